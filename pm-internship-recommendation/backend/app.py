@@ -1,10 +1,17 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, stream_with_context
 from flask_cors import CORS
+import json
 import os
+import time
 from dotenv import load_dotenv
 from services.recommendation_engine import RecommendationEngine
 from services.resume_parser import ResumeParser
-from services.translation_service import TranslationService
+from services.catalog_index import CatalogIndex
+from services.keyword_extractor import KeywordExtractor
+from services.registry import registry
+from services.resume_jobs import ResumeJobQueue, ResumeJobQueueFull
+from services.metrics import metrics
+from services.script_detector import script_proportions
 from data.sample_data import get_sample_internships
 
 load_dotenv()
@@ -12,13 +19,32 @@ load_dotenv()
 app = Flask(__name__)
 CORS(app)
 
-# Initialize services
-recommendation_engine = RecommendationEngine()
+def load_catalog():
+    """Catalog snapshot: postings plus their preprocessed CatalogIndex"""
+    text_processor = registry.get('text_processor')
+    # Corpus IDF table (built with build_idf.py); without the file the
+    # document frequencies are counted over the catalog at ingest
+    keyword_extractor = KeywordExtractor(text_processor)
+    keyword_extractor.load(os.getenv('KEYWORD_IDF_PATH') or None)
+    internships = get_sample_internships()
+    # Catalog text is cleaned, normalized and tokenized once at ingest
+    return {
+        'internships': internships,
+        'index': CatalogIndex(internships, text_processor, keyword_extractor)
+    }
+
+registry.register('catalog', load_catalog, 'Internship catalog snapshot and CatalogIndex')
+
+# Initialize services (heavy resources are shared through the registry)
 resume_parser = ResumeParser()
-translation_service = TranslationService()
+resume_jobs = ResumeJobQueue(resume_parser)
+translation_service = registry.get('translation_service')
 
 # Sample internships data
-internships = get_sample_internships()
+catalog = registry.get('catalog')
+internships = catalog['internships']
+catalog_index = catalog['index']
+recommendation_engine = RecommendationEngine(catalog_index)
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
@@ -29,6 +55,41 @@ def get_internships():
     """Get all available internships"""
     return jsonify(internships)
 
+def normalize_profile(user_data):
+    """Profile shape the recommendation engine scores; accepts partial profiles"""
+    normalized_user = {
+        'education': (user_data.get('education') or '').strip(),
+        'skills': user_data.get('skills') or [],
+        'location': (user_data.get('location') or '').strip(),
+        'interests': user_data.get('interests') or []
+    }
+    # Ensure types
+    if not isinstance(normalized_user['skills'], list):
+        normalized_user['skills'] = [str(normalized_user['skills'])]
+    if not isinstance(normalized_user['interests'], list):
+        normalized_user['interests'] = [str(normalized_user['interests'])]
+    return normalized_user
+
+def profile_from_resume(parsed, interests=None):
+    """
+    Map parsed resume fields onto the normalized profile: the highest
+    degree as a profile form option, English location when translated
+    """
+    language = parsed.get('detected_language', 'en')
+    translations = parsed.get('translations', {})
+
+    education = parsed.get('education', 'Not specified')
+    education = '' if education == 'Not specified' else education
+    location = translations.get('location_en') or parsed.get('location', 'Not specified')
+    location = '' if location == 'Not specified' else location
+
+    return normalize_profile({
+        'education': resume_parser.education_level(education, language) or education,
+        'skills': parsed.get('skills', []),
+        'location': location,
+        'interests': interests
+    })
+
 @app.route('/api/recommend', methods=['POST'])
 def recommend_internships():
     """Get personalized internship recommendations with multilingual support"""
@@ -38,18 +99,10 @@ def recommend_internships():
         # Extract target language preference
         target_language = user_data.get('target_language', 'en')
 
-        # Accept partial profiles; default missing fields
-        normalized_user = {
-            'education': (user_data.get('education') or '').strip(),
-            'skills': user_data.get('skills') or [],
-            'location': (user_data.get('location') or '').strip(),
-            'interests': user_data.get('interests') or []
-        }
-        # Ensure types
-        if not isinstance(normalized_user['skills'], list):
-            normalized_user['skills'] = [str(normalized_user['skills'])]
-        if not isinstance(normalized_user['interests'], list):
-            normalized_user['interests'] = [str(normalized_user['interests'])]
+        # Latency budget for the whole request (optional, else config default)
+        deadline = translation_service.make_deadline(user_data.get('latency_budget_ms'))
+
+        normalized_user = normalize_profile(user_data)
 
         # Get recommendations
         recommendations = recommendation_engine.get_recommendations(normalized_user, internships)
@@ -57,14 +110,17 @@ def recommend_internships():
         # Translate recommendations if target language is not English
         if target_language != 'en':
             recommendations = translation_service.translate_recommendations(
-                recommendations, target_language
+                recommendations, target_language, deadline
             )
 
         return jsonify({
             "recommendations": recommendations,
             "count": len(recommendations),
             "target_language": target_language,
-            "translation_applied": target_language != 'en'
+            "translation_applied": target_language != 'en',
+            "translation_degraded": any(
+                rec.get('translation_degraded_fields') for rec in recommendations
+            )
         })
 
     except Exception as e:
@@ -81,14 +137,114 @@ def parse_resume():
         if file.filename == '':
             return jsonify({"error": "No file selected"}), 400
         
-        # Parse resume
-        parsed_data = resume_parser.parse(file)
+        # Parse resume (education_details=true also lists every degree with its span)
+        education_details = request.values.get('education_details', '').lower() in ('1', 'true', 'yes')
+        
+        # async=true: queue the upload and return a job id to poll
+        if request.values.get('async', '').lower() in ('1', 'true', 'yes'):
+            try:
+                job_id = resume_jobs.submit(file, education_details)
+            except ResumeJobQueueFull as e:
+                return jsonify({"error": str(e)}), 429
+            return jsonify({
+                "job_id": job_id,
+                "status": "queued",
+                "status_url": f"/api/parse-resume/{job_id}"
+            }), 202
+        
+        parsed_data = resume_parser.parse(file, education_details)
         
         return jsonify(parsed_data)
     
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/recommend-from-resume', methods=['POST'])
+def recommend_from_resume():
+    """
+    Parse an uploaded resume and return its profile with recommendations in
+    one request. Optional form fields: interests (comma separated),
+    target_language (default: the resume's language), latency_budget_ms.
+    """
+    try:
+        started = time.perf_counter()
+        if 'file' not in request.files:
+            return jsonify({"error": "No file uploaded"}), 400
+        
+        file = request.files['file']
+        if file.filename == '':
+            return jsonify({"error": "No file selected"}), 400
+        
+        # Deadline.from_budget validates the value; empty means the default budget
+        deadline = translation_service.make_deadline(request.values.get('latency_budget_ms') or None)
+        
+        # Parse, timing each parser stage through the progress callback
+        timings = {}
+        marks = []
+        def progress(stage):
+            marks.append((stage, time.perf_counter()))
+        
+        parse_started = time.perf_counter()
+        parsed = resume_parser.parse(file, progress=progress)
+        parse_finished = time.perf_counter()
+        for (stage, stage_start), (_, stage_end) in zip(marks, marks[1:] + [(None, parse_finished)]):
+            timings[stage] = round((stage_end - stage_start) * 1000, 2)
+        timings['parse'] = round((parse_finished - parse_started) * 1000, 2)
+        
+        if not parsed.get('success'):
+            return jsonify({"error": parsed.get('message', 'Failed to parse resume')}), 422
+        
+        data = parsed['data']
+        interests = [
+            interest.strip() for interest in request.values.get('interests', '').split(',')
+            if interest.strip()
+        ]
+        profile = profile_from_resume(data, interests)
+        target_language = request.values.get('target_language') or data.get('detected_language', 'en')
+        
+        stage_started = time.perf_counter()
+        recommendations = recommendation_engine.get_recommendations(profile, internships)
+        timings['scoring'] = round((time.perf_counter() - stage_started) * 1000, 2)
+        
+        if target_language != 'en':
+            stage_started = time.perf_counter()
+            recommendations = translation_service.translate_recommendations(
+                recommendations, target_language, deadline
+            )
+            timings['translating_recommendations'] = round(
+                (time.perf_counter() - stage_started) * 1000, 2
+            )
+        timings['total'] = round((time.perf_counter() - started) * 1000, 2)
+        
+        return jsonify({
+            "parsed": data,
+            "cached": parsed.get('cached', False),
+            "profile": profile,
+            "recommendations": recommendations,
+            "count": len(recommendations),
+            "target_language": target_language,
+            "translation_applied": target_language != 'en',
+            "translation_degraded": any(
+                rec.get('translation_degraded_fields') for rec in recommendations
+            ),
+            "timings_ms": timings
+        })
+    
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/parse-resume/<job_id>', methods=['GET'])
+def get_resume_job(job_id):
+    """Status, progress and (when done) result of an async resume parsing job"""
+    try:
+        job = resume_jobs.get(job_id)
+        if job is None:
+            return jsonify({"error": "Job not found or expired"}), 404
+        return jsonify(job)
+    
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 @app.route('/api/translate', methods=['POST'])
 def translate_text():
     """Translate text to regional languages"""
@@ -108,6 +264,49 @@ def translate_text():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/translate/stream', methods=['POST'])
+def translate_text_stream():
+    """
+    Translate long text as a Server-Sent Events stream, one event per
+    translated sentence, followed by a summary event
+    """
+    data = request.get_json() or {}
+    text = data.get('text', '')
+    target_language = data.get('target_language', 'hi')
+    batch_size = data.get('batch_size')
+
+    if not text:
+        return jsonify({"error": "No text provided"}), 400
+    if batch_size is not None and (
+        not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size < 1
+    ):
+        return jsonify({"error": "batch_size must be a positive integer"}), 400
+
+    def events():
+        first_segment_ms = None
+        count = 0
+        try:
+            for segment in translation_service.translate_stream(text, target_language, batch_size):
+                if first_segment_ms is None:
+                    first_segment_ms = segment['elapsed_ms']
+                count += 1
+                yield f"event: segment\ndata: {json.dumps(segment, ensure_ascii=False)}\n\n"
+        except Exception as e:
+            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+            return
+        summary = {
+            "segments": count,
+            "target_language": target_language,
+            "time_to_first_segment_ms": first_segment_ms
+        }
+        yield f"event: done\ndata: {json.dumps(summary)}\n\n"
+
+    return Response(
+        stream_with_context(events()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 @app.route('/api/profile', methods=['POST'])
 def create_profile():
     """Create or update user profile"""
@@ -145,6 +344,26 @@ def get_translation_mode():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/metrics', methods=['GET'])
+def get_metrics():
+    """Get in-process service metrics (counters and histograms)"""
+    try:
+        return jsonify(metrics.snapshot())
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/resources', methods=['GET'])
+def get_resources():
+    """List shared resources, whether they are loaded and their approximate memory"""
+    try:
+        resources = registry.snapshot()
+        return jsonify({
+            "resources": resources,
+            "total_memory_bytes": sum(resource['memory_bytes'] for resource in resources)
+        })
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 @app.route('/api/detect-language', methods=['POST'])
 def detect_language():
     """Detect the language of input text"""
@@ -160,6 +379,7 @@ def detect_language():
         
         return jsonify({
             "detected_language": detected_language,
+            "script_proportions": script_proportions(text),
             "original_text": text,
             "normalized_text": normalized_text
         })
@@ -179,6 +399,18 @@ def process_multilingual_query():
         
         processed_query = translation_service.process_multilingual_query(query)
         
+        # Match query keywords against the precomputed posting keyword sets;
+        # the catalog is in English, so the English translation is used too.
+        # Rule-based mode leaves the "translation" in the source script, so
+        # it only counts when it really is English
+        keywords = catalog_index.query_keywords(query, processed_query['detected_language'])
+        translation = processed_query['translation_to_english']
+        if processed_query['detected_language'] != 'en' and \
+                translation_service.detect_language(translation) == 'en':
+            keywords += catalog_index.query_keywords(translation, 'en')
+        processed_query['keywords'] = list(dict.fromkeys(keywords))
+        processed_query['matching_internships'] = catalog_index.match_keywords(processed_query['keywords'])
+        
         return jsonify(processed_query)
     
     except Exception as e:
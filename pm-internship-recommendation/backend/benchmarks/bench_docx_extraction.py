@@ -0,0 +1,123 @@
+"""
+Benchmark: streaming DOCX extraction vs python-docx
+
+Synthetic resumes mix paragraphs, tables (label/value rows and two-column
+layouts), text boxes and a header and footer. Every line carries a unique
+marker, so coverage is the share of markers found in the extracted text.
+
+Modes:
+    python-docx paragraphs   doc.paragraphs only (the previous extractor)
+    python-docx full DOM     paragraphs + table cells + header/footer via python-docx
+    streaming                services.docx_text (zip + iterparse)
+
+Reports mean time per document, tracemalloc peak and coverage for a normal
+resume and a very long document. tracemalloc only sees Python allocations;
+the lxml tree behind python-docx is not traced, so its real peak is higher.
+
+Run from the backend directory:
+    python -m benchmarks.bench_docx_extraction [--runs 20] [--large-sections 2000]
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from io import BytesIO
+
+import docx
+
+from benchmarks.synthetic_docx import build_docx
+from services.docx_text import extract_docx_text
+
+
+def synthetic_resume(sections):
+    """(docx bytes, markers) with `sections` repeated resume sections"""
+    markers = []
+
+    def line(text):
+        marker = f"m{len(markers)}x"
+        markers.append(marker)
+        return f"{text} {marker}"
+
+    blocks = []
+    for section in range(sections):
+        blocks.append(line(f"Objective {section}: build reliable software"))
+        blocks.append(('table', [
+            [line("Address"), line("Delhi")],
+            [line("Email"), line("student@example.com")],
+        ]))
+        blocks.append(('table', [[
+            [line("Education"), line("B.Tech Computer Science 2024"), line("IIT Delhi")],
+            [line("Skills"), line("Python"), line("SQL"), line("React")],
+        ]]))
+        blocks.append(('textbox', [line("Phone: 9876543210")]))
+        blocks.append(line("Projects: internship portal"))
+    data = build_docx(blocks, header=[line("Rahul Sharma")], footer=[line("References on request")])
+    return data, markers
+
+
+def python_docx_paragraphs(data):
+    doc = docx.Document(BytesIO(data))
+    return "\n".join(p.text for p in doc.paragraphs)
+
+
+def python_docx_full(data):
+    doc = docx.Document(BytesIO(data))
+    lines = []
+    for section in doc.sections:
+        lines.extend(p.text for p in section.header.paragraphs)
+    lines.extend(p.text for p in doc.paragraphs)
+    for table in doc.tables:
+        for row in table.rows:
+            lines.extend(cell.text for cell in row.cells)
+    for section in doc.sections:
+        lines.extend(p.text for p in section.footer.paragraphs)
+    return "\n".join(lines)
+
+
+def streaming(data):
+    return extract_docx_text(BytesIO(data))
+
+
+MODES = [
+    ('python-docx paragraphs', python_docx_paragraphs),
+    ('python-docx full DOM', python_docx_full),
+    ('streaming', streaming),
+]
+
+
+def run(label, data, markers, runs):
+    print(f"\n{label}: {len(data) / 1024:.0f} KB, {len(markers)} marked lines")
+    print(f"{'mode':<24} {'mean ms':>10} {'peak MB':>9} {'coverage':>9}")
+    for name, extract in MODES:
+        extract(data)  # warm up
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            extract(data)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        tracemalloc.start()
+        text = extract(data)
+        peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+
+        found = sum(1 for marker in markers if marker in text)
+        print(f"{name:<24} {statistics.mean(timings):>10.2f} {peak:>9.2f} "
+              f"{found / len(markers):>9.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--large-sections', type=int, default=2000)
+    args = parser.parse_args()
+
+    data, markers = synthetic_resume(2)
+    run("Resume (2 sections)", data, markers, args.runs)
+    data, markers = synthetic_resume(args.large_sections)
+    run(f"Long document ({args.large_sections} sections)", data, markers, max(1, args.runs // 10))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+Memory benchmark: whole-document vs page-streamed PDF rasterization
+
+For PDFs of increasing page count (all pages without a text layer, as in a
+scanned resume), each mode runs in a fresh process and reports that
+process's peak RSS and the peak RSS of its children (pdftoppm, tesseract):
+
+    whole     convert_from_bytes(file.read()): every page rendered into
+              PIL images held at once (the previous implementation)
+    streamed  upload spooled to a temp file, one page rendered at a time
+              into a temp folder and released before the next (pdf_ocr)
+
+Peak RSS of "whole" grows with page count; "streamed" should stay flat.
+Requires pdf2image + poppler (and pytesseract + tesseract with --ocr).
+Run from the backend directory:
+    python -m benchmarks.bench_pdf_rasterization [--pages 5 15 30] [--dpi 200] [--ocr]
+"""
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+from benchmarks.synthetic_pdf import build_pdf
+
+
+def _peak_rss_mb(who):
+    # ru_maxrss is in KB on Linux
+    return resource.getrusage(who).ru_maxrss / 1024
+
+
+def _run_whole(pdf_bytes, dpi, ocr):
+    from pdf2image import convert_from_bytes
+    images = convert_from_bytes(pdf_bytes, dpi=dpi)
+    if ocr:
+        import pytesseract
+        for image in images:
+            pytesseract.image_to_string(image)
+    return len(images)
+
+
+def _run_streamed(pdf_bytes, dpi, ocr, page_count):
+    from pdf2image import convert_from_path
+    from PIL import Image
+    from services.pdf_ocr import spooled_upload
+
+    with spooled_upload(BytesIO(pdf_bytes)) as pdf_path:
+        for page_number in range(1, page_count + 1):
+            with tempfile.TemporaryDirectory() as folder:
+                image_paths = convert_from_path(
+                    pdf_path, dpi=dpi, first_page=page_number, last_page=page_number,
+                    output_folder=folder, paths_only=True
+                )
+                for image_path in image_paths:
+                    if ocr:
+                        import pytesseract
+                        pytesseract.image_to_string(image_path)
+                    else:
+                        with Image.open(image_path) as image:
+                            image.load()
+    return page_count
+
+
+def measure(mode, page_count, dpi, ocr):
+    """Runs in a fresh worker process"""
+    pdf_bytes = build_pdf([None] * page_count) if page_count else b''
+    started = time.perf_counter()
+    if mode == 'whole' and page_count:
+        _run_whole(pdf_bytes, dpi, ocr)
+    elif mode == 'streamed' and page_count:
+        _run_streamed(pdf_bytes, dpi, ocr, page_count)
+    return {
+        'seconds': time.perf_counter() - started,
+        'peak_rss_mb': _peak_rss_mb(resource.RUSAGE_SELF),
+        'children_peak_rss_mb': _peak_rss_mb(resource.RUSAGE_CHILDREN)
+    }
+
+
+def _in_fresh_process(*args):
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(measure, *args).result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--pages', type=int, nargs='+', default=[5, 15, 30])
+    parser.add_argument('--dpi', type=int, default=200)
+    parser.add_argument('--ocr', action='store_true', help="also run Tesseract on every page")
+    args = parser.parse_args()
+
+    try:
+        import pdf2image  # noqa: F401
+    except ImportError:
+        print("pdf2image is not installed; this benchmark needs pdf2image and poppler.")
+        sys.exit(1)
+
+    baseline = _in_fresh_process('idle', 0, args.dpi, False)
+    print(f"Baseline process peak RSS: {baseline['peak_rss_mb']:.1f} MB")
+    print(f"{'pages':>5}  {'mode':<9} {'peak RSS MB':>12} {'children MB':>12} {'seconds':>8}")
+    for page_count in args.pages:
+        for mode in ('whole', 'streamed'):
+            result = _in_fresh_process(mode, page_count, args.dpi, args.ocr)
+            print(
+                f"{page_count:>5}  {mode:<9} {result['peak_rss_mb']:>12.1f} "
+                f"{result['children_peak_rss_mb']:>12.1f} {result['seconds']:>8.2f}"
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+"""
+Benchmark: fp32 vs int8 dynamic-quantized neural translation on CPU
+
+Compares per-phrase latency, process RSS after loading each model and
+output agreement between the two on a fixed phrase set.
+
+Uses the IndicTrans2 model when transformers is installed; otherwise a tiny
+locally constructed seq2seq transformer stands in so the quantization path
+can still be exercised.
+
+Run from the backend directory:
+    python -m benchmarks.bench_quantized_translation [--threads N] [--runs N]
+"""
+
+import argparse
+import copy
+import gc
+import io
+import statistics
+import time
+
+import torch
+
+from services.translation_service import quantize_model_int8
+
+PHRASES = [
+    "Software Development Intern",
+    "Work on web development projects using React and Node.js.",
+    "Location preference matches",
+    "Skills match: Python, SQL",
+    "Analyze business data using Python and SQL.",
+    "Assist in creating digital marketing campaigns and content.",
+    "B.Tech/B.Sc in Computer Science or related field",
+    "Educational background matches requirements",
+]
+
+
+def current_rss_mb():
+    """Resident set size of this process in MB (Linux /proc, psutil elsewhere)"""
+    try:
+        with open('/proc/self/statm') as statm:
+            pages = int(statm.read().split()[1])
+        import resource
+        return pages * resource.getpagesize() / (1024 * 1024)
+    except (OSError, ImportError):
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+class TinySeq2Seq(torch.nn.Module):
+    """Small randomly initialised encoder-decoder used when transformers is missing"""
+
+    def __init__(self, vocab_size=512, d_model=256, layers=3):
+        super().__init__()
+        self.vocab_size = vocab_size
+        self.embed = torch.nn.Embedding(vocab_size, d_model)
+        self.transformer = torch.nn.Transformer(
+            d_model=d_model, nhead=4, num_encoder_layers=layers,
+            num_decoder_layers=layers, dim_feedforward=d_model * 4,
+            batch_first=True
+        )
+        self.lm_head = torch.nn.Linear(d_model, vocab_size)
+
+    def encode_text(self, texts):
+        ids = [[b % self.vocab_size for b in text.encode('utf-8')][:64] for text in texts]
+        width = max(len(row) for row in ids)
+        return torch.tensor([row + [0] * (width - len(row)) for row in ids])
+
+    def generate(self, input_ids, max_new_tokens=24):
+        """Greedy decoding; returns generated token ids"""
+        memory = self.transformer.encoder(self.embed(input_ids))
+        output = torch.ones((input_ids.shape[0], 1), dtype=torch.long)
+        for _ in range(max_new_tokens):
+            hidden = self.transformer.decoder(self.embed(output), memory)
+            next_token = self.lm_head(hidden[:, -1]).argmax(-1, keepdim=True)
+            output = torch.cat([output, next_token], dim=1)
+        return output
+
+
+def load_translator():
+    """Return (name, fp32 model, translate(model, texts) -> outputs)"""
+    try:
+        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+        model_name = "ai4bharat/indictrans2-en-indic-1B"
+        tokenizer = AutoTokenizer.from_pretrained(model_name, trust_remote_code=True)
+        model = AutoModelForSeq2SeqLM.from_pretrained(model_name, trust_remote_code=True)
+
+        def translate(m, texts):
+            inputs = tokenizer(texts, return_tensors="pt", padding=True, truncation=True)
+            generated = m.generate(
+                **inputs, forced_bos_token_id=tokenizer.lang_code_to_id['hin_Deva']
+            )
+            return tokenizer.batch_decode(generated, skip_special_tokens=True)
+
+        return model_name, model, translate
+    except Exception as load_error:
+        print(f"transformers model unavailable ({load_error}); using TinySeq2Seq stand-in")
+        # nn.Transformer's inference fast path reads Linear.weight directly,
+        # which dynamically quantized Linear layers do not expose
+        torch.backends.mha.set_fastpath_enabled(False)
+        torch.manual_seed(0)
+        model = TinySeq2Seq()
+
+        def translate(m, texts):
+            return [row.tolist() for row in m.generate(m.encode_text(texts))]
+
+        return "TinySeq2Seq", model, translate
+
+
+def run_phrases(model, translate, runs):
+    latencies = []
+    outputs = None
+    with torch.no_grad():
+        translate(model, PHRASES[:1])  # warm-up
+        for _ in range(runs):
+            outputs = []
+            for phrase in PHRASES:
+                started = time.perf_counter()
+                outputs.extend(translate(model, [phrase]))
+                latencies.append((time.perf_counter() - started) * 1000)
+    return latencies, outputs
+
+
+def serialized_size_mb(model):
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell() / (1024 * 1024)
+
+
+def summarize(label, latencies, rss_mb, size_mb):
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"{label:6} median {statistics.median(ordered):8.2f} ms   "
+          f"p95 {p95:8.2f} ms   RSS +{rss_mb:8.1f} MB   weights {size_mb:8.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--threads', type=int, default=0, help='intra-op threads (0 = torch default)')
+    parser.add_argument('--runs', type=int, default=3, help='passes over the phrase set')
+    args = parser.parse_args()
+
+    if args.threads > 0:
+        torch.set_num_threads(args.threads)
+
+    baseline_rss = current_rss_mb()
+    name, fp32_model, translate = load_translator()
+    fp32_model.eval()
+    fp32_rss = current_rss_mb()
+    fp32_size = serialized_size_mb(fp32_model)
+    fp32_latencies, fp32_outputs = run_phrases(fp32_model, translate, args.runs)
+
+    int8_model = quantize_model_int8(copy.deepcopy(fp32_model))
+    del fp32_model
+    gc.collect()
+    int8_rss = current_rss_mb()
+    int8_size = serialized_size_mb(int8_model)
+    int8_latencies, int8_outputs = run_phrases(int8_model, translate, args.runs)
+
+    agreement = sum(a == b for a, b in zip(fp32_outputs, int8_outputs)) / len(fp32_outputs)
+
+    print(f"\nModel: {name}   threads: {torch.get_num_threads()}   "
+          f"phrases: {len(PHRASES)} x {args.runs} runs")
+    summarize('fp32', fp32_latencies, fp32_rss - baseline_rss, fp32_size)
+    summarize('int8', int8_latencies, int8_rss - baseline_rss, int8_size)
+    print(f"speedup (median): {statistics.median(fp32_latencies) / statistics.median(int8_latencies):.2f}x")
+    print(f"output agreement: {agreement:.0%}")
+
+
+if __name__ == '__main__':
+    main()
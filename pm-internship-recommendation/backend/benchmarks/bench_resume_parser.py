@@ -0,0 +1,276 @@
+"""
+Benchmark: ResumeParser latency, throughput and field accuracy
+
+Parses a synthetic multilingual corpus (benchmarks.synthetic_resumes, or a
+corpus directory written by it) with the parse cache disabled and reports:
+
+    per-stage latency   text extraction, language detection, cleaning,
+                        normalization, section splitting, each field
+                        extractor and translation (exclusive time: a stage
+                        called inside another is not counted twice)
+    throughput          resumes per second over the whole corpus
+    field accuracy      precision and recall of name, email, phone,
+                        education, location and skills, overall and per
+                        language, plus language detection accuracy
+
+Run it before and after a parser change to show the change keeps accuracy.
+--json writes the numbers for comparing runs.
+
+Run from the backend directory:
+    python -m benchmarks.bench_resume_parser [--count 20] [--corpus DIR] [--json results.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import time
+
+from werkzeug.datastructures import FileStorage
+
+from benchmarks.synthetic_resumes import FORMATS, LANGUAGES, generate_corpus, load_corpus
+from services.parse_cache import ParseCache
+from services.resume_parser import EDUCATION_LABELS, PARSER_VERSION, ResumeParser
+
+FIELDS = ('name', 'email', 'phone', 'education', 'location', 'skills')
+MISSING = ('', 'Not found', 'Not specified', None)
+
+# (object attribute path, method, stage name) instrumented on the parser
+STAGES = [
+    ('', '_extract_text', 'extract_text'),
+    ('text_processor', 'detect_language', 'detect_language'),
+    ('text_processor', 'clean_text', 'clean'),
+    ('text_processor', 'clean_many', 'clean'),
+    ('text_processor', 'normalize_text', 'normalize'),
+    ('text_processor', 'normalize_many', 'normalize'),
+    ('', '_split_sections', 'split_sections'),
+    ('', '_extract_name_multilingual', 'field:name'),
+    ('', '_extract_email', 'field:email'),
+    ('', '_extract_phone', 'field:phone'),
+    ('', '_extract_education_multilingual', 'field:education'),
+    ('', '_extract_location_from_sections', 'field:location'),
+    ('', '_extract_skills_multilingual', 'field:skills'),
+    ('', '_add_translations', 'translate'),
+]
+
+
+class StageTimer:
+    """Wraps methods to record exclusive time per stage for the current resume"""
+
+    def __init__(self):
+        self.samples = {}   # stage -> [ms per resume]
+        self._current = {}
+        self._stack = []
+
+    def wrap(self, owner, method_name, stage):
+        method = getattr(owner, method_name)
+
+        def timed(*args, **kwargs):
+            self._stack.append(0.0)
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                children = self._stack.pop()
+                self._current[stage] = self._current.get(stage, 0.0) + elapsed - children
+                if self._stack:
+                    self._stack[-1] += elapsed
+
+        setattr(owner, method_name, timed)
+
+    def finish_resume(self):
+        for stage, seconds in self._current.items():
+            self.samples.setdefault(stage, []).append(seconds * 1000)
+        self._current = {}
+
+
+def _percentile(values, fraction):
+    values = sorted(values)
+    return values[max(0, int(round(len(values) * fraction)) - 1)]
+
+
+class FieldScores:
+    """Precision/recall counts per field"""
+
+    def __init__(self):
+        self.counts = {field: {'tp': 0, 'predicted': 0, 'expected': 0} for field in FIELDS}
+
+    def add(self, field, true_positives, predicted, expected):
+        counts = self.counts[field]
+        counts['tp'] += true_positives
+        counts['predicted'] += predicted
+        counts['expected'] += expected
+
+    def precision_recall(self, field):
+        counts = self.counts[field]
+        precision = counts['tp'] / counts['predicted'] if counts['predicted'] else 0.0
+        recall = counts['tp'] / counts['expected'] if counts['expected'] else 0.0
+        return precision, recall
+
+
+class Evaluator:
+    """Compares parsed fields with ground truth after the parser's own normalization"""
+
+    def __init__(self, parser):
+        self.parser = parser
+        self.text_processor = parser.text_processor
+
+    def _norm(self, text, language):
+        text = self.text_processor.normalize_text(str(text), language)
+        return ' '.join(text.casefold().split())
+
+    def score(self, parsed, truth, language, scores):
+        language = parsed.get('detected_language', language)
+        for field in FIELDS:
+            predicted = parsed.get(field)
+            if field == 'skills':
+                found = {self._norm(skill, language) for skill in predicted or []}
+                expected = {self._norm(skill, language) for skill in truth['skills']}
+                scores.add(field, len(found & expected), len(found), len(expected))
+                continue
+
+            if predicted in MISSING:
+                scores.add(field, 0, 0, 1)
+                continue
+            scores.add(field, int(self._correct(field, predicted, truth[field], language)), 1, 1)
+
+    def _correct(self, field, predicted, expected, language):
+        if field == 'phone':
+            digits = ''.join(char for char in predicted if char.isdigit())
+            return digits[-10:] == expected
+        if field == 'email':
+            return predicted.lower() == expected.lower()
+        if field == 'education':
+            return self.parser.education_level(predicted, language) == EDUCATION_LABELS[expected]
+        if field == 'location':
+            return self._norm(expected, language) in self._norm(predicted, language)
+        return self._norm(predicted, language) == self._norm(expected, language)
+
+
+def run(corpus, parser):
+    timer = StageTimer()
+    for owner_path, method_name, stage in STAGES:
+        owner = getattr(parser, owner_path) if owner_path else parser
+        timer.wrap(owner, method_name, stage)
+
+    evaluator = Evaluator(parser)
+    overall = FieldScores()
+    by_language = {}
+    detection = {}
+    per_resume_ms = []
+
+    started = time.perf_counter()
+    for item in corpus:
+        upload = FileStorage(stream=io.BytesIO(item['data']), filename=item['filename'])
+        resume_started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = parser.parse(upload)
+        per_resume_ms.append((time.perf_counter() - resume_started) * 1000)
+        timer.finish_resume()
+
+        language = item['language']
+        parsed = result.get('data', {}) if result.get('success') else {}
+        evaluator.score(parsed, item['truth'], 'hi' if language == 'mixed' else language, overall)
+        evaluator.score(parsed, item['truth'], 'hi' if language == 'mixed' else language,
+                        by_language.setdefault(language, FieldScores()))
+        if language != 'mixed':
+            hits, total = detection.get(language, (0, 0))
+            detection[language] = (hits + (parsed.get('detected_language') == language), total + 1)
+    elapsed = time.perf_counter() - started
+
+    return {
+        'resumes': len(per_resume_ms),
+        'seconds': elapsed,
+        'per_resume_ms': per_resume_ms,
+        'stages': timer.samples,
+        'overall': overall,
+        'by_language': by_language,
+        'detection': detection,
+    }
+
+
+def report(results):
+    count = results['resumes']
+    print(f"\n{count} resumes in {results['seconds']:.2f}s: "
+          f"{count / results['seconds']:.1f} resumes/s, "
+          f"mean {statistics.mean(results['per_resume_ms']):.2f} ms, "
+          f"p95 {_percentile(results['per_resume_ms'], 0.95):.2f} ms per resume")
+
+    print(f"\n{'stage':<18} {'mean ms':>9} {'p95 ms':>9} {'share':>7}")
+    total = sum(sum(values) for values in results['stages'].values())
+    for stage, values in sorted(results['stages'].items(), key=lambda item: -sum(item[1])):
+        print(f"{stage:<18} {statistics.mean(values):>9.3f} {_percentile(values, 0.95):>9.3f} "
+              f"{sum(values) / total:>7.1%}")
+
+    print(f"\n{'field':<10} {'precision':>9} {'recall':>7}")
+    for field in FIELDS:
+        precision, recall = results['overall'].precision_recall(field)
+        print(f"{field:<10} {precision:>9.1%} {recall:>7.1%}")
+
+    print("\nPer language (precision/recall):")
+    print(f"{'lang':<6} " + ' '.join(f"{field:>13}" for field in FIELDS) + f" {'detected':>9}")
+    for language, scores in results['by_language'].items():
+        cells = []
+        for field in FIELDS:
+            precision, recall = scores.precision_recall(field)
+            cells.append(f"{precision:>6.0%}/{recall:<6.0%}")
+        hits, total = results['detection'].get(language, (None, None))
+        detected = f"{hits / total:>9.0%}" if total else f"{'-':>9}"
+        print(f"{language:<6} " + ' '.join(cells) + f" {detected}")
+
+
+def to_json(results):
+    return {
+        'parser_version': PARSER_VERSION,
+        'resumes': results['resumes'],
+        'resumes_per_second': results['resumes'] / results['seconds'],
+        'stages_mean_ms': {stage: statistics.mean(values) for stage, values in results['stages'].items()},
+        'fields': {
+            field: dict(zip(('precision', 'recall'), results['overall'].precision_recall(field)))
+            for field in FIELDS
+        },
+        'by_language': {
+            language: {
+                field: dict(zip(('precision', 'recall'), scores.precision_recall(field)))
+                for field in FIELDS
+            }
+            for language, scores in results['by_language'].items()
+        },
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    arg_parser.add_argument('--count', type=int, default=20, help="resumes per language and format")
+    arg_parser.add_argument('--languages', nargs='+', default=list(LANGUAGES), choices=LANGUAGES)
+    arg_parser.add_argument('--formats', nargs='+', default=list(FORMATS), choices=FORMATS)
+    arg_parser.add_argument('--corpus', help="corpus directory written by benchmarks.synthetic_resumes")
+    arg_parser.add_argument('--json', help="also write the results to this file")
+    args = arg_parser.parse_args()
+
+    if args.corpus:
+        corpus = list(load_corpus(args.corpus))
+    else:
+        corpus = list(generate_corpus(args.count, args.languages, args.formats))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        parser = ResumeParser()
+        # Every upload must be parsed, not answered from the cache
+        parser.parse_cache = ParseCache(PARSER_VERSION, max_entries=0, directory='')
+        # Load lazily created resources before timing
+        for item in {item['language']: item for item in corpus}.values():
+            parser.parse(FileStorage(stream=io.BytesIO(item['data']), filename=item['filename']))
+
+    results = run(corpus, parser)
+    report(results)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as output:
+            json.dump(to_json(results), output, indent=2, ensure_ascii=False)
+        print(f"\nWrote {os.path.abspath(args.json)}")
+
+
+if __name__ == '__main__':
+    main()
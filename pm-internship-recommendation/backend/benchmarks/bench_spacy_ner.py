@@ -0,0 +1,121 @@
+"""
+Benchmark: per-resume spaCy NER latency for name extraction
+
+Compares, on synthetic English resume headers:
+    full      spacy.load("en_core_web_sm"), nlp(text) per resume (previous code)
+    trimmed   NER-only pipeline (registry.SPACY_EXCLUDE), nlp(text) per resume
+    pipe      NER-only pipeline through nlp.pipe at the given batch size(s)
+
+and reports load time, mean/p95 latency per resume and whether the PERSON
+found matches the full pipeline.
+
+Run from the backend directory:
+    python -m benchmarks.bench_spacy_ner [--resumes 500] [--batch-sizes 16 64 256] [--n-process 1]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+
+from services.registry import SPACY_EXCLUDE
+from services.resume_parser import NER_TEXT_CHARS
+
+FIRST_NAMES = ['Rahul', 'Priya', 'Arjun', 'Sneha', 'Vikram', 'Ananya', 'Karthik', 'Divya',
+               'Rohan', 'Meera', 'Aditya', 'Kavya', 'Suresh', 'Lakshmi', 'Amit', 'Pooja']
+LAST_NAMES = ['Sharma', 'Reddy', 'Iyer', 'Banerjee', 'Patel', 'Nair', 'Gupta', 'Das',
+              'Kumar', 'Singh', 'Rao', 'Mukherjee', 'Joshi', 'Menon', 'Verma', 'Pillai']
+CITIES = ['Mumbai', 'Delhi', 'Bangalore', 'Chennai', 'Hyderabad', 'Kolkata', 'Pune', 'Jaipur']
+SKILLS = ['Python', 'Java', 'React', 'SQL', 'Machine Learning', 'Excel', 'Node.js',
+          'Digital Marketing', 'Data Analysis', 'Communication', 'AutoCAD', 'Tally']
+DEGREES = ['B.Tech in Computer Science', 'B.Sc Physics', 'B.Com', 'MBA', 'Diploma in Civil Engineering']
+
+
+def synthetic_resumes(count, seed=7):
+    rng = random.Random(seed)
+    resumes = []
+    for _ in range(count):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        resumes.append(
+            f"{name} {name.split()[0].lower()}@example.com +91 98{rng.randint(10000000, 99999999)} "
+            f"{rng.choice(CITIES)}, India Education {rng.choice(DEGREES)}, "
+            f"{rng.randint(2018, 2025)} Skills {', '.join(rng.sample(SKILLS, 4))} "
+            f"Projects Built a {rng.choice(SKILLS)} project during an internship at a startup "
+            f"in {rng.choice(CITIES)} working with a team of {rng.randint(3, 12)} people."
+        )
+    return resumes
+
+
+def first_person(doc):
+    return next((entity.text for entity in doc.ents if entity.label_ == 'PERSON'), None)
+
+
+def timed_load(spacy, **kwargs):
+    started = time.perf_counter()
+    nlp = spacy.load('en_core_web_sm', **kwargs)
+    return nlp, (time.perf_counter() - started) * 1000
+
+
+def per_resume(nlp, texts):
+    latencies, names = [], []
+    for text in texts:
+        started = time.perf_counter()
+        names.append(first_person(nlp(text)))
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies, names
+
+
+def report(label, load_ms, latencies, names, reference):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if len(latencies) >= 20 else latencies[-1]
+    agreement = sum(a == b for a, b in zip(names, reference)) / len(reference)
+    load = f"{load_ms:8.0f}" if load_ms is not None else f"{'':>8}"
+    print(f"{label:<22} {load} {statistics.mean(latencies):10.3f} {p95:10.3f} {agreement:9.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--resumes', type=int, default=500)
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[16, 64, 256])
+    parser.add_argument('--n-process', type=int, default=1)
+    args = parser.parse_args()
+
+    try:
+        import spacy
+        spacy.util.get_package_path('en_core_web_sm')
+    except ImportError:
+        print("spaCy is not installed; this benchmark needs spaCy and en_core_web_sm.")
+        sys.exit(1)
+    except Exception:
+        print("spaCy model 'en_core_web_sm' not found: python -m spacy download en_core_web_sm")
+        sys.exit(1)
+
+    texts = [resume[:NER_TEXT_CHARS] for resume in synthetic_resumes(args.resumes)]
+
+    full, full_load_ms = timed_load(spacy)
+    trimmed, trimmed_load_ms = timed_load(spacy, exclude=list(SPACY_EXCLUDE))
+    print(f"full pipeline:    {full.pipe_names}")
+    print(f"trimmed pipeline: {trimmed.pipe_names}")
+    print(f"{args.resumes} resumes, first {NER_TEXT_CHARS} characters each\n")
+
+    # Warm up both pipelines before timing
+    per_resume(full, texts[:10])
+    per_resume(trimmed, texts[:10])
+
+    print(f"{'mode':<22} {'load ms':>8} {'mean ms':>10} {'p95 ms':>10} {'same name':>9}")
+    full_latencies, reference = per_resume(full, texts)
+    report('full, nlp()', full_load_ms, full_latencies, reference, reference)
+    trimmed_latencies, names = per_resume(trimmed, texts)
+    report('trimmed, nlp()', trimmed_load_ms, trimmed_latencies, names, reference)
+
+    for batch_size in args.batch_sizes:
+        started = time.perf_counter()
+        docs = trimmed.pipe(texts, batch_size=batch_size, n_process=args.n_process)
+        names = [first_person(doc) for doc in docs]
+        per_doc_ms = (time.perf_counter() - started) * 1000 / len(texts)
+        report(f"trimmed, pipe({batch_size})", None, [per_doc_ms], names, reference)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark and oracle check: precomputed str.translate transliteration
+
+1. Correctness: every assigned character of every supported Brahmic block is
+   transliterated to every other script with both the precomputed tables and
+   indicnlp's UnicodeIndicTransliterator. Outputs must agree, except where
+   indicnlp emits an unassigned code point (handled explicitly by the tables).
+2. Speed: transliteration of a sentence mix with both implementations.
+
+Requires indic-nlp-library. Run from the backend directory:
+    python -m benchmarks.bench_transliteration [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+import unicodedata
+
+from services import transliteration_tables
+
+try:
+    from indicnlp.transliterate.unicode_transliterate import UnicodeIndicTransliterator
+except ImportError:
+    UnicodeIndicTransliterator = None
+
+SAMPLE_TEXT = {
+    'hi': "मैं पायथन और डेटा विश्लेषण में कुशल हूँ। मेरा पता बेंगलुरु है।",
+    'te': "నేను పైథాన్ మరియు డేటా విశ్లేషణలో నైపుణ్యం కలిగి ఉన్నాను.",
+    'ta': "நான் பைதான் மற்றும் தரவு பகுப்பாய்வில் திறமையானவன்.",
+    'bn': "আমি পাইথন এবং ডেটা বিশ্লেষণে দক্ষ। আমার ঠিকানা কলকাতা।",
+}
+
+
+def _is_unassigned(text):
+    return any(unicodedata.category(char) == 'Cn' for char in text)
+
+
+def check_against_oracle():
+    """Return (pairs checked, characters checked, mismatches)"""
+    mismatches = []
+    checked = 0
+    scripts = list(transliteration_tables.SCRIPT_BASES)
+    for source in scripts:
+        base = transliteration_tables.SCRIPT_BASES[source]
+        for target in scripts:
+            if source == target:
+                continue
+            for codepoint in range(base, base + 0x80):
+                char = chr(codepoint)
+                if unicodedata.category(char) == 'Cn':
+                    continue
+                checked += 1
+                expected = UnicodeIndicTransliterator.transliterate(char, source, target)
+                actual = transliteration_tables.transliterate(char, source, target)
+                if actual != expected and not _is_unassigned(expected):
+                    mismatches.append((source, target, f"U+{codepoint:04X}", expected, actual))
+    pairs = len(scripts) * (len(scripts) - 1)
+    return pairs, checked, mismatches
+
+
+def time_pairs(transliterate, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for source, text in SAMPLE_TEXT.items():
+            for target in transliteration_tables.SCRIPT_BASES:
+                if target != source:
+                    transliterate(text, source, target)
+    return (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    if UnicodeIndicTransliterator is None:
+        print("indic-nlp-library is not installed; the oracle check needs it.")
+        sys.exit(1)
+
+    pairs, checked, mismatches = check_against_oracle()
+    print(f"Oracle check: {pairs} script pairs, {checked} characters, {len(mismatches)} mismatches")
+    for mismatch in mismatches[:20]:
+        print("  ", mismatch)
+
+    table_ms = time_pairs(transliteration_tables.transliterate, args.repeat)
+    library_ms = time_pairs(UnicodeIndicTransliterator.transliterate, args.repeat)
+    print(f"str.translate tables: {table_ms:9.1f} ms")
+    print(f"indicnlp library:     {library_ms:9.1f} ms")
+    print(f"speedup: {library_ms / table_ms:.1f}x")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
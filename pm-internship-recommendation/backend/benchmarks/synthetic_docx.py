@@ -0,0 +1,117 @@
+"""
+Minimal DOCX writer for benchmarks
+
+Writes the WordprocessingML parts directly with zipfile, no dependencies.
+Supports what resumes use and python-docx's doc.paragraphs misses: tables,
+text boxes (DrawingML with the usual VML fallback copy) and a header and
+footer.
+
+Body blocks are given as:
+    "text"                      a paragraph
+    ('table', rows)             rows of cells; a cell is a string or a list
+                                of paragraph strings
+    ('textbox', lines)          a paragraph anchoring a text box with lines
+"""
+
+import zipfile
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+R = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+NAMESPACES = (
+    f'xmlns:w="{W}" xmlns:r="{R}" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+    'xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing" '
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape" '
+    'xmlns:v="urn:schemas-microsoft-com:vml" '
+    'mc:Ignorable="wps"'
+)
+
+CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+<Override PartName="/word/header1.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.header+xml"/>
+<Override PartName="/word/footer1.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.footer+xml"/>
+</Types>"""
+
+PACKAGE_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+
+DOCUMENT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/header" Target="header1.xml"/>
+<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/footer" Target="footer1.xml"/>
+</Relationships>"""
+
+
+def _paragraph(text):
+    return f'<w:p><w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>'
+
+
+def _table(rows):
+    xml = ['<w:tbl>']
+    for row in rows:
+        xml.append('<w:tr>')
+        for cell in row:
+            lines = [cell] if isinstance(cell, str) else cell
+            xml.append('<w:tc>' + ''.join(_paragraph(line) for line in lines) + '</w:tc>')
+        xml.append('</w:tr>')
+    xml.append('</w:tbl>')
+    return ''.join(xml)
+
+
+def _textbox(lines):
+    content = ''.join(_paragraph(line) for line in lines)
+    return (
+        '<w:p><w:r><mc:AlternateContent>'
+        '<mc:Choice Requires="wps"><w:drawing><wp:anchor><wp:docPr id="1" name="Text Box"/>'
+        '<a:graphic><a:graphicData uri="http://schemas.microsoft.com/office/word/2010/wordprocessingShape">'
+        f'<wps:wsp><wps:txbx><w:txbxContent>{content}</w:txbxContent></wps:txbx></wps:wsp>'
+        '</a:graphicData></a:graphic></wp:anchor></w:drawing></mc:Choice>'
+        f'<mc:Fallback><w:pict><v:shape><v:textbox><w:txbxContent>{content}</w:txbxContent>'
+        '</v:textbox></v:shape></w:pict></mc:Fallback>'
+        '</mc:AlternateContent></w:r></w:p>'
+    )
+
+
+def _block(block):
+    if isinstance(block, str):
+        return _paragraph(block)
+    kind, content = block
+    return _table(content) if kind == 'table' else _textbox(content)
+
+
+def build_docx(blocks, header=None, footer=None):
+    """Return a .docx file as bytes; header/footer are optional lists of lines"""
+    body = ''.join(_block(block) for block in blocks)
+    section = (
+        '<w:sectPr><w:headerReference w:type="default" r:id="rId1"/>'
+        '<w:footerReference w:type="default" r:id="rId2"/></w:sectPr>'
+    )
+    document = (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<w:document {NAMESPACES}><w:body>{body}{section}</w:body></w:document>'
+    )
+    header_xml = ''.join(_paragraph(line) for line in header or [])
+    footer_xml = ''.join(_paragraph(line) for line in footer or [])
+
+    output = BytesIO()
+    with zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', CONTENT_TYPES)
+        archive.writestr('_rels/.rels', PACKAGE_RELS)
+        archive.writestr('word/_rels/document.xml.rels', DOCUMENT_RELS)
+        archive.writestr('word/document.xml', document)
+        archive.writestr('word/header1.xml', f'<w:hdr {NAMESPACES}>{header_xml}</w:hdr>')
+        archive.writestr('word/footer1.xml', f'<w:ftr {NAMESPACES}>{footer_xml}</w:ftr>')
+    return output.getvalue()
+
+
+def write_docx(path, blocks, header=None, footer=None):
+    with open(path, 'wb') as docx_file:
+        docx_file.write(build_docx(blocks, header, footer))
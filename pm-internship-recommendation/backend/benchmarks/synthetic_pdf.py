@@ -0,0 +1,74 @@
+"""
+Minimal text-layer PDF writer for benchmarks
+
+Writes pages of Latin-1 text with the standard Helvetica font, no
+dependencies. Pages given as None are left blank (no text layer), which
+stands in for a scanned page.
+"""
+
+LINE_HEIGHT = 14
+TOP_MARGIN = 760
+LEFT_MARGIN = 56
+
+
+def _escape(line):
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def _content_stream(lines):
+    if not lines:
+        return ''
+    commands = [f"BT /F1 11 Tf {LEFT_MARGIN} {TOP_MARGIN} Td {LINE_HEIGHT} TL"]
+    for line in lines:
+        commands.append(f"({_escape(line)}) Tj T*")
+    commands.append("ET")
+    return '\n'.join(commands)
+
+
+def build_pdf(pages):
+    """
+    pages: list of pages, each a list of text lines (or None for a blank
+    page). Returns the PDF file as bytes.
+    """
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in once the page object numbers are known
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    kids = []
+    for lines in pages:
+        page_number = len(objects) + 1
+        kids.append(f"{page_number} 0 R")
+        stream = _content_stream(lines).encode('latin-1', errors='replace')
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_number + 1} 0 R >>"
+        )
+        objects.append(stream)
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n".encode()
+        if isinstance(body, bytes):
+            output += f"<< /Length {len(body)} >>\nstream\n".encode() + body + b"\nendstream"
+        else:
+            output += body.encode('latin-1')
+        output += b"\nendobj\n"
+
+    xref_offset = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        output += f"{offset:010d} 00000 n \n".encode()
+    output += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref_offset}\n%%EOF\n"
+    ).encode()
+    return bytes(output)
+
+
+def write_pdf(path, pages):
+    with open(path, 'wb') as pdf_file:
+        pdf_file.write(build_pdf(pages))
@@ -0,0 +1,317 @@
+"""
+Synthetic multilingual resume corpus with ground truth
+
+Generates resumes in English, Hindi, Telugu, Tamil, Bengali and code-mixed
+Hindi/English ("mixed": Devanagari headings and names, English degrees and
+skills) as TXT, DOCX and text-layer PDF. Every resume comes with its
+ground-truth fields: name, email, phone, education (degree key of
+EDUCATION_PATTERNS), location (city) and skills (skill dictionary entries).
+
+Layouts vary: "Heading: value" lines or headings on their own line,
+contact details in a table or a text box (DOCX), several phone formats, and
+a project description naming a different city as a distractor for the
+location extractor.
+
+PDFs are only generated for English: the dependency-free PDF writer
+(synthetic_pdf) has no embedded font for Indic scripts, so Indic PDFs would
+need a TTF and a PDF library. Requesting an Indic PDF falls back to TXT.
+
+Run from the backend directory to write a corpus with a manifest.jsonl:
+    python -m benchmarks.synthetic_resumes --output corpus/ [--count 20]
+"""
+
+import argparse
+import json
+import os
+import random
+
+from benchmarks.synthetic_docx import build_docx
+from benchmarks.synthetic_pdf import build_pdf
+from services.skill_matcher import load_skill_dictionary
+
+LANGUAGES = ('en', 'hi', 'te', 'ta', 'bn', 'mixed')
+FORMATS = ('txt', 'docx', 'pdf')
+
+# Per language: names as (native, romanized for the email address), cities
+# as (native, state), degree phrases by degree key, section headings and
+# sentence templates
+LANGUAGE_DATA = {
+    'en': {
+        'first_names': [('Rahul', 'rahul'), ('Priya', 'priya'), ('Arjun', 'arjun'), ('Sneha', 'sneha'),
+                        ('Vikram', 'vikram'), ('Ananya', 'ananya'), ('Karthik', 'karthik'),
+                        ('Divya', 'divya')],
+        'last_names': [('Sharma', 'sharma'), ('Reddy', 'reddy'), ('Iyer', 'iyer'), ('Patel', 'patel'),
+                       ('Nair', 'nair'), ('Gupta', 'gupta'), ('Das', 'das'), ('Singh', 'singh')],
+        'cities': [('Pune', 'Maharashtra'), ('Jaipur', 'Rajasthan'), ('Hyderabad', 'Telangana'),
+                   ('Chennai', 'Tamil Nadu'), ('Kolkata', 'West Bengal'), ('Lucknow', 'Uttar Pradesh')],
+        'degrees': {
+            'btech': 'B.Tech in Computer Science', 'bsc': 'B.Sc Physics', 'bcom': 'B.Com',
+            'ba': 'B.A. English', 'mba': 'MBA in Marketing', 'diploma': 'Polytechnic Diploma, Mechanical'
+        },
+        'class12': 'Class 12, CBSE',
+        'headings': {
+            'objective': 'Objective', 'contact': 'Contact', 'email': 'Email', 'phone': 'Phone',
+            'education': 'Education', 'skills': 'Skills', 'address': 'Address', 'projects': 'Projects'
+        },
+        'objective': 'Looking for an internship where I can learn and contribute.',
+        'project': 'Built a volunteer portal for an NGO in {city}.',
+        'street': '{number} MG Road, {city}, {state}',
+    },
+    'hi': {
+        'first_names': [('राहुल', 'rahul'), ('प्रिया', 'priya'), ('अर्जुन', 'arjun'), ('स्नेहा', 'sneha'),
+                        ('विक्रम', 'vikram'), ('अनन्या', 'ananya')],
+        'last_names': [('शर्मा', 'sharma'), ('वर्मा', 'verma'), ('गुप्ता', 'gupta'), ('सिंह', 'singh'),
+                       ('यादव', 'yadav'), ('मिश्रा', 'mishra')],
+        'cities': [('जयपुर', 'राजस्थान'), ('लखनऊ', 'उत्तर प्रदेश'), ('पटना', 'बिहार'),
+                   ('भोपाल', 'मध्य प्रदेश'), ('इंदौर', 'मध्य प्रदेश')],
+        'degrees': {
+            'btech': 'बी.टेक कंप्यूटर साइंस', 'bsc': 'बी.एससी भौतिकी', 'bcom': 'बी.कॉम',
+            'ba': 'बी.ए हिंदी', 'mba': 'एमबीए', 'diploma': 'डिप्लोमा (पॉलिटेक्निक)'
+        },
+        'class12': '12वीं कक्षा',
+        'headings': {
+            'objective': 'उद्देश्य', 'contact': 'संपर्क', 'email': 'ईमेल', 'phone': 'फ़ोन',
+            'education': 'शिक्षा', 'skills': 'कौशल', 'address': 'पता', 'projects': 'परियोजनाएं'
+        },
+        'objective': 'मैं एक इंटर्नशिप की तलाश में हूं जहां मैं सीख सकूं।',
+        'project': '{city} में एक स्वयंसेवी पोर्टल बनाया।',
+        'street': 'मकान {number}, {city}, {state}',
+    },
+    'te': {
+        'first_names': [('రాహుల్', 'rahul'), ('ప్రియ', 'priya'), ('అర్జున్', 'arjun'), ('స్నేహ', 'sneha'),
+                        ('కిరణ్', 'kiran')],
+        'last_names': [('రెడ్డి', 'reddy'), ('రావు', 'rao'), ('నాయుడు', 'naidu'), ('వర్మ', 'varma')],
+        'cities': [('హైదరాబాద్', 'తెలంగాణ'), ('విజయవాడ', 'ఆంధ్రప్రదేశ్'), ('వరంగల్', 'తెలంగాణ'),
+                   ('విశాఖపట్నం', 'ఆంధ్రప్రదేశ్')],
+        'degrees': {
+            'btech': 'బీ.టెక్', 'bsc': 'బీ.ఎస్సీ', 'bcom': 'బీ.కామ్', 'mba': 'ఎంబీఏ', 'diploma': 'డిప్లొమా'
+        },
+        'class12': 'ఇంటర్మీడియట్',
+        'headings': {
+            'objective': 'లక్ష్యం', 'contact': 'సంప్రదింపు వివరాలు', 'email': 'ఇమెయిల్', 'phone': 'ఫోన్',
+            'education': 'విద్య', 'skills': 'నైపుణ్యాలు', 'address': 'చిరునామా', 'projects': 'ప్రాజెక్టులు'
+        },
+        'objective': 'నేర్చుకోవడానికి ఇంటర్న్‌షిప్ కోసం చూస్తున్నాను.',
+        'project': '{city} లో ఒక వెబ్‌సైట్ నిర్మించాను.',
+        'street': 'ఇంటి నం {number}, {city}, {state}',
+    },
+    'ta': {
+        'first_names': [('ராகுல்', 'rahul'), ('பிரியா', 'priya'), ('அருண்', 'arun'), ('கார்த்திக்', 'karthik'),
+                        ('மீனா', 'meena')],
+        'last_names': [('குமார்', 'kumar'), ('ராஜா', 'raja'), ('சுப்பிரமணியன்', 'subramanian'),
+                       ('முருகன்', 'murugan')],
+        'cities': [('சென்னை', 'தமிழ்நாடு'), ('மதுரை', 'தமிழ்நாடு'), ('கோயம்புத்தூர்', 'தமிழ்நாடு'),
+                   ('திருச்சி', 'தமிழ்நாடு')],
+        'degrees': {
+            'btech': 'பி.டெக்', 'bsc': 'பி.எஸ்சி', 'bcom': 'பி.காம்', 'mba': 'எம்பிஏ', 'diploma': 'டிப்ளமோ'
+        },
+        'class12': '12ஆம் வகுப்பு',
+        'headings': {
+            'objective': 'நோக்கம்', 'contact': 'தொடர்பு', 'email': 'மின்னஞ்சல்', 'phone': 'தொலைபேசி',
+            'education': 'கல்வி', 'skills': 'திறன்கள்', 'address': 'முகவரி', 'projects': 'திட்டங்கள்'
+        },
+        'objective': 'கற்றுக்கொள்ள ஒரு பயிற்சி வாய்ப்பை தேடுகிறேன்.',
+        'project': '{city} நகரில் ஒரு இணையதளம் உருவாக்கினேன்.',
+        'street': 'வீடு எண் {number}, {city}, {state}',
+    },
+    'bn': {
+        'first_names': [('রাহুল', 'rahul'), ('প্রিয়া', 'priya'), ('অর্জুন', 'arjun'), ('সুমন', 'suman'),
+                        ('অনন্যা', 'ananya')],
+        'last_names': [('দাস', 'das'), ('বন্দ্যোপাধ্যায়', 'banerjee'), ('চক্রবর্তী', 'chakraborty'),
+                       ('সেন', 'sen')],
+        'cities': [('কলকাতা', 'পশ্চিমবঙ্গ'), ('হাওড়া', 'পশ্চিমবঙ্গ'), ('শিলিগুড়ি', 'পশ্চিমবঙ্গ'),
+                   ('দুর্গাপুর', 'পশ্চিমবঙ্গ')],
+        'degrees': {
+            'btech': 'বি.টেক', 'bsc': 'বি.এসসি', 'bcom': 'বি.কম', 'mba': 'এমবিএ', 'diploma': 'ডিপ্লোমা'
+        },
+        'class12': 'উচ্চ মাধ্যমিক',
+        'headings': {
+            'objective': 'উদ্দেশ্য', 'contact': 'যোগাযোগ', 'email': 'ইমেল', 'phone': 'ফোন',
+            'education': 'শিক্ষা', 'skills': 'দক্ষতা', 'address': 'ঠিকানা', 'projects': 'প্রকল্প'
+        },
+        'objective': 'শেখার জন্য একটি ইন্টার্নশিপ খুঁজছি।',
+        'project': '{city} শহরে একটি ওয়েবসাইট তৈরি করেছি।',
+        'street': 'বাড়ি {number}, {city}, {state}',
+    },
+}
+
+# Code-mixed: Hindi names, headings and places with English degrees and skills
+LANGUAGE_DATA['mixed'] = dict(
+    LANGUAGE_DATA['hi'],
+    degrees=LANGUAGE_DATA['en']['degrees'],
+    class12='12th, CBSE',
+    objective='मैं Software Development में internship की तलाश में हूं।',
+    project='{city} में एक NGO के लिए web portal बनाया।',
+)
+
+# Language whose skill dictionary a resume's skills come from
+SKILL_LANGUAGE = {'mixed': 'en'}
+
+# Degrees a resume may also list class 12 under (class 12 ranks below them)
+_WITH_CLASS12 = ('btech', 'bsc', 'bcom', 'ba', 'diploma')
+
+
+def _phone(rng):
+    number = f"9{rng.randint(100000000, 999999999)}"
+    formats = [f"+91 {number}", f"+91-{number}", number, f"+91 {number[:5]} {number[5:]}"]
+    return rng.choice(formats), number
+
+
+def make_resume(language, rng, skills_by_language):
+    """Lines of one resume by section, plus its ground truth"""
+    data = LANGUAGE_DATA[language]
+    first, first_roman = rng.choice(data['first_names'])
+    last, last_roman = rng.choice(data['last_names'])
+    city, state = rng.choice(data['cities'])
+    other_city = rng.choice([c for c, _ in data['cities'] if c != city])
+    degree = rng.choice(sorted(data['degrees']))
+    skills = rng.sample(skills_by_language[SKILL_LANGUAGE.get(language, language)], 4)
+    email = f"{first_roman}.{last_roman}{rng.randint(1, 99)}@example.com"
+    phone_text, phone_digits = _phone(rng)
+
+    education = [f"{data['degrees'][degree]}, {rng.randint(2019, 2025)}"]
+    if degree in _WITH_CLASS12 and rng.random() < 0.5:
+        education.append(f"{data['class12']}, {rng.randint(2015, 2020)}")
+
+    resume = {
+        'name': f"{first} {last}",
+        'email': email,
+        'phone': phone_text,
+        'objective': data['objective'],
+        'education': education,
+        'skills': skills,
+        'address': data['street'].format(number=rng.randint(1, 200), city=city, state=state),
+        'project': data['project'].format(city=other_city),
+    }
+    truth = {
+        'name': resume['name'],
+        'email': email,
+        'phone': phone_digits,
+        'education': degree,
+        'location': city,
+        'skills': [skill.title() for skill in skills],
+    }
+    return resume, truth
+
+
+def _text_lines(language, resume, rng):
+    """Plain text layout: "Heading: value" or headings on their own line"""
+    headings = LANGUAGE_DATA[language]['headings']
+    inline = rng.random() < 0.5
+    lines = [resume['name'], f"{headings['email']}: {resume['email']}",
+             f"{headings['phone']}: {resume['phone']}"]
+
+    def section(key, values):
+        if inline:
+            lines.append(f"{headings[key]}: {', '.join(values) if key == 'skills' else values[0]}")
+            if key != 'skills':
+                lines.extend(values[1:])
+        else:
+            lines.append(headings[key])
+            lines.extend(values)
+
+    section('objective', [resume['objective']])
+    section('education', resume['education'])
+    section('skills', resume['skills'])
+    section('address', [resume['address']])
+    section('projects', [resume['project']])
+    return lines
+
+
+def _docx_blocks(language, resume, rng):
+    """DOCX layout: name in the page header, contact table or text box, skills table"""
+    headings = LANGUAGE_DATA[language]['headings']
+    contact = [[headings['email'], resume['email']], [headings['phone'], resume['phone']]]
+    blocks = []
+    if rng.random() < 0.5:
+        blocks.append(('table', contact))
+    else:
+        blocks.append(('textbox', [f"{label}: {value}" for label, value in contact]))
+    blocks += [headings['objective'], resume['objective'], headings['education']]
+    blocks += resume['education']
+    blocks.append(headings['skills'])
+    if rng.random() < 0.5:
+        blocks.append(('table', [resume['skills'][:2], resume['skills'][2:]]))
+    else:
+        blocks.append(', '.join(resume['skills']))
+    blocks.append(('table', [[headings['address'], resume['address']]]))
+    blocks += [headings['projects'], resume['project']]
+    return blocks
+
+
+def render(language, fmt, resume, rng):
+    """(file extension, bytes) of a resume in the given format"""
+    if fmt == 'pdf' and language != 'en':
+        fmt = 'txt'  # no embedded Indic font, see the module docstring
+    if fmt == 'docx':
+        return 'docx', build_docx(_docx_blocks(language, resume, rng), header=[resume['name']])
+    lines = _text_lines(language, resume, rng)
+    if fmt == 'pdf':
+        return 'pdf', build_pdf([lines])
+    return 'txt', '\n'.join(lines).encode('utf-8')
+
+
+def generate_corpus(count, languages=LANGUAGES, formats=FORMATS, seed=7):
+    """
+    Yield count resumes per (language, format) as dicts with id, language,
+    format, filename, data (bytes) and truth
+    """
+    rng = random.Random(seed)
+    skills_by_language = load_skill_dictionary()
+    for language in languages:
+        for fmt in formats:
+            if fmt == 'pdf' and language != 'en':
+                continue
+            for number in range(count):
+                resume, truth = make_resume(language, rng, skills_by_language)
+                extension, data = render(language, fmt, resume, rng)
+                resume_id = f"{language}-{fmt}-{number:04d}"
+                yield {
+                    'id': resume_id,
+                    'language': language,
+                    'format': extension,
+                    'filename': f"{resume_id}.{extension}",
+                    'data': data,
+                    'truth': truth
+                }
+
+
+def write_corpus(directory, count, languages=LANGUAGES, formats=FORMATS, seed=7):
+    """Write the resumes and a manifest.jsonl of their ground truth"""
+    os.makedirs(directory, exist_ok=True)
+    written = 0
+    with open(os.path.join(directory, 'manifest.jsonl'), 'w', encoding='utf-8') as manifest:
+        for item in generate_corpus(count, languages, formats, seed):
+            with open(os.path.join(directory, item['filename']), 'wb') as resume_file:
+                resume_file.write(item['data'])
+            entry = {key: value for key, value in item.items() if key != 'data'}
+            manifest.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            written += 1
+    return written
+
+
+def load_corpus(directory):
+    """Read a corpus written by write_corpus back into generate_corpus's shape"""
+    with open(os.path.join(directory, 'manifest.jsonl'), encoding='utf-8') as manifest:
+        for line in manifest:
+            item = json.loads(line)
+            with open(os.path.join(directory, item['filename']), 'rb') as resume_file:
+                item['data'] = resume_file.read()
+            yield item
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic multilingual resume corpus")
+    parser.add_argument('--output', required=True)
+    parser.add_argument('--count', type=int, default=20, help="resumes per language and format")
+    parser.add_argument('--languages', nargs='+', default=list(LANGUAGES), choices=LANGUAGES)
+    parser.add_argument('--formats', nargs='+', default=list(FORMATS), choices=FORMATS)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    written = write_corpus(args.output, args.count, args.languages, args.formats, args.seed)
+    print(f"Wrote {written} resumes and manifest.jsonl to {os.path.abspath(args.output)}")
+
+
+if __name__ == '__main__':
+    main()
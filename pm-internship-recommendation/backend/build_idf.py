@@ -0,0 +1,69 @@
+"""
+Build the keyword IDF table file
+
+Counts per-language document frequencies over the internship catalog and,
+optionally, a directory of resumes (PDF, DOCX or TXT), and writes them to
+data/idf_tables.npz (or --output). The API loads the file at startup; set
+KEYWORD_IDF_PATH to use another location.
+
+Usage (from the backend directory):
+    python build_idf.py [--resumes DIR] [--output PATH]
+"""
+
+import argparse
+import os
+
+from werkzeug.datastructures import FileStorage
+
+from data.sample_data import get_sample_internships
+from services.catalog_index import CatalogIndex
+from services.keyword_extractor import DEFAULT_IDF_PATH, KeywordExtractor
+from services.resume_parser import ResumeParser
+
+RESUME_EXTENSIONS = ('.pdf', '.docx', '.doc', '.txt')
+
+
+def iter_resume_texts(parser, directory):
+    for root, _, filenames in os.walk(directory):
+        for filename in sorted(filenames):
+            if not filename.lower().endswith(RESUME_EXTENSIONS):
+                continue
+            path = os.path.join(root, filename)
+            try:
+                with open(path, 'rb') as stream:
+                    yield parser._extract_text(FileStorage(stream=stream, filename=filename))
+            except Exception as e:
+                print(f"WARNING: skipping {path}: {e}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Build the keyword IDF table file")
+    arg_parser.add_argument('--resumes', help="directory of resumes to include in the corpus")
+    arg_parser.add_argument('--output', default=DEFAULT_IDF_PATH)
+    args = arg_parser.parse_args()
+
+    parser = ResumeParser()
+    text_processor = parser.text_processor
+    extractor = KeywordExtractor(text_processor)
+
+    # The catalog index counts its postings into an empty extractor
+    CatalogIndex(get_sample_internships(), text_processor, extractor)
+
+    if args.resumes:
+        by_language = {}
+        for text in iter_resume_texts(parser, args.resumes):
+            language = text_processor.detect_language(text)
+            by_language.setdefault(language, []).append(text)
+        for language, texts in by_language.items():
+            cleaned = text_processor.clean_many(texts, language)
+            normalized = text_processor.normalize_many(cleaned, language)
+            extractor.add_documents(text_processor.tokenize_many(normalized, language), language)
+
+    extractor.save(args.output)
+    for language, stats in sorted(extractor.get_stats().items()):
+        print(f"{language}: {stats['documents']} documents, {stats['terms']} terms")
+    print(f"Wrote {os.path.abspath(args.output)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+"""
+Bulk resume parsing
+
+Walks a directory or a zip archive of resumes (PDF, DOCX or TXT), parses
+them on a process pool with one ResumeParser per worker and writes one JSON
+line per resume. Workers parse --batch-size resumes at a time through
+ResumeParser.parse_many, so normalization and spaCy NER are batched. A
+batch is timed as a whole, so a resume's timings_ms are its batch's stage
+times divided by the batch size (the same for every resume of the batch).
+
+    {"source": "<relative path>", "success": true, "data": {...},
+     "message": "...", "cached": false, "timings_ms": {"<stage>": ms, ..., "total": ms}}
+
+The output file doubles as the checkpoint: the lines of a batch are flushed
+as soon as the batch is done, and a rerun with the same output skips the sources
+already in it (a truncated last line from an interrupted run is dropped).
+Use --restart to start over. Throughput and per-stage timings are printed
+at the end; their percentiles are over batch means, not single resumes.
+
+Usage (from the backend directory):
+    python bulk_parse.py SOURCE --output parsed.jsonl [--workers N] [--batch-size N] [--education-details]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+import zipfile
+from io import BytesIO
+
+from werkzeug.datastructures import FileStorage
+
+RESUME_EXTENSIONS = ('.pdf', '.docx', '.doc', '.txt')
+PROGRESS_EVERY = 100
+
+# Per-worker state, set up by _init_worker
+_parser = None
+_archive = None
+_source = None
+_options = {}
+
+
+def list_sources(source):
+    """Relative paths of the resumes in a directory or zip archive, sorted"""
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            names = [
+                info.filename for info in archive.infolist()
+                if not info.is_dir() and info.filename.lower().endswith(RESUME_EXTENSIONS)
+            ]
+        return sorted(names)
+
+    paths = []
+    for root, _, filenames in os.walk(source):
+        for filename in filenames:
+            if filename.lower().endswith(RESUME_EXTENSIONS):
+                paths.append(os.path.relpath(os.path.join(root, filename), source))
+    return sorted(paths)
+
+
+def completed_sources(output_path):
+    """
+    Sources already written to an output file. A partial last line left by
+    an interrupted run is cut off so appending continues cleanly.
+    """
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    good_bytes = 0
+    with open(output_path, 'rb') as output:
+        for line in output:
+            try:
+                done.add(json.loads(line)['source'])
+            except (ValueError, KeyError):
+                break
+            good_bytes += len(line)
+    if good_bytes != os.path.getsize(output_path):
+        with open(output_path, 'r+b') as output:
+            output.truncate(good_bytes)
+    return done
+
+
+def _init_worker(source, education_details, verbose):
+    global _parser, _archive, _source, _options
+    if not verbose:
+        # The parser reports every file on stdout
+        sys.stdout = open(os.devnull, 'w')
+    from services.resume_parser import ResumeParser
+    _parser = ResumeParser()
+    _source = source
+    _archive = zipfile.ZipFile(source) if zipfile.is_zipfile(source) else None
+    _options = {'education_details': education_details}
+
+
+def _open(name):
+    if _archive is not None:
+        return BytesIO(_archive.read(name))
+    return open(os.path.join(_source, name), 'rb')
+
+
+def _parse_batch(names):
+    """Parse a batch of resumes in a worker; returns their output records"""
+    marks = []
+
+    def progress(stage):
+        marks.append((stage, time.perf_counter()))
+
+    started = time.perf_counter()
+    results = {}
+    streams = {}
+    try:
+        for name in names:
+            try:
+                streams[name] = _open(name)
+            except Exception as e:
+                results[name] = {"success": False, "data": {}, "message": f"Error reading resume: {e}"}
+        uploads = [
+            FileStorage(stream=stream, filename=os.path.basename(name))
+            for name, stream in streams.items()
+        ]
+        try:
+            parsed = _parser.parse_many(uploads, _options['education_details'], progress)
+        except Exception as e:
+            # parse_many reports failures per file; never lose the whole run
+            parsed = [{"success": False, "data": {}, "message": f"Error parsing resume: {e}"}] * len(uploads)
+        results.update(zip(streams, parsed))
+    finally:
+        for stream in streams.values():
+            stream.close()
+    finished = time.perf_counter()
+
+    # Stages repeat per language group and resume inside a batch
+    timings = {}
+    for (stage, stage_start), (_, stage_end) in zip(marks, marks[1:] + [(None, finished)]):
+        timings[stage] = timings.get(stage, 0.0) + stage_end - stage_start
+    timings['total'] = finished - started
+    share = {stage: round(seconds * 1000 / len(names), 2) for stage, seconds in timings.items()}
+
+    records = []
+    for name in names:
+        record = {"source": name}
+        record.update(results[name])
+        record["timings_ms"] = share
+        records.append(record)
+    return records
+
+
+def _summarize(records, batch_timings, elapsed, skipped):
+    parsed = len(records)
+    failed = sum(1 for record in records if not record.get('success'))
+    print(f"\nParsed {parsed} resumes ({failed} failed, {skipped} skipped from checkpoint) "
+          f"in {elapsed:.1f}s: {parsed / elapsed if elapsed else 0:.1f} resumes/s")
+
+    # (ms per resume, batch size) per stage, one sample per batch
+    by_stage = {}
+    for timings, size in batch_timings:
+        for stage, ms in timings.items():
+            by_stage.setdefault(stage, []).append((ms, size))
+    if not by_stage:
+        return
+    print(f"\nStage time per resume, averaged within each of {len(batch_timings)} batches "
+          f"(mean weighted by resumes; p50/p95 over batches)")
+    print(f"{'stage':<20} {'resumes':>7} {'mean ms':>10} {'p50 ms':>10} {'p95 ms':>10} {'sum s':>9}")
+    for stage, samples in sorted(by_stage.items(), key=lambda item: item[0] == 'total'):
+        resumes = sum(size for _, size in samples)
+        total_ms = sum(ms * size for ms, size in samples)
+        values = sorted(ms for ms, _ in samples)
+        p95 = values[max(0, int(len(values) * 0.95) - 1)]
+        print(f"{stage:<20} {resumes:>7} {total_ms / resumes:>10.2f} "
+              f"{statistics.median(values):>10.2f} {p95:>10.2f} {total_ms / 1000:>9.1f}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Parse a directory or zip archive of resumes to JSONL")
+    arg_parser.add_argument('source', help="directory or .zip archive of resumes")
+    arg_parser.add_argument('--output', required=True, help="JSONL output file (also the checkpoint)")
+    arg_parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    arg_parser.add_argument('--batch-size', type=int, default=16,
+                            help="resumes a worker parses in one batch")
+    arg_parser.add_argument('--education-details', action='store_true')
+    arg_parser.add_argument('--restart', action='store_true', help="ignore and overwrite existing output")
+    arg_parser.add_argument('--verbose', action='store_true', help="show the parser's own output")
+    args = arg_parser.parse_args()
+
+    if not os.path.exists(args.source):
+        arg_parser.error(f"{args.source} does not exist")
+    if args.batch_size < 1:
+        arg_parser.error("--batch-size must be at least 1")
+
+    if args.restart and os.path.exists(args.output):
+        os.remove(args.output)
+    done = completed_sources(args.output)
+    sources = list_sources(args.source)
+    pending = [name for name in sources if name not in done]
+    skipped = len(sources) - len(pending)
+    print(f"{len(sources)} resumes found, {skipped} already parsed, {len(pending)} to go "
+          f"on {args.workers} workers")
+
+    batches = [pending[start:start + args.batch_size] for start in range(0, len(pending), args.batch_size)]
+    records = []
+    batch_timings = []
+    started = time.perf_counter()
+    with open(args.output, 'a', encoding='utf-8') as output, multiprocessing.Pool(
+        args.workers, initializer=_init_worker,
+        initargs=(args.source, args.education_details, args.verbose)
+    ) as pool:
+        for batch in pool.imap_unordered(_parse_batch, batches):
+            for record in batch:
+                output.write(json.dumps(record, ensure_ascii=False) + '\n')
+                records.append({'success': record.get('success')})
+                if len(records) % PROGRESS_EVERY == 0:
+                    elapsed = time.perf_counter() - started
+                    print(f"  {len(records)}/{len(pending)} ({len(records) / elapsed:.1f} resumes/s)")
+            output.flush()
+            if batch:
+                batch_timings.append((batch[0]['timings_ms'], len(batch)))
+
+    _summarize(records, batch_timings, time.perf_counter() - started, skipped)
+
+
+if __name__ == '__main__':
+    main()
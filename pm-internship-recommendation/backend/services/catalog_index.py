@@ -0,0 +1,148 @@
+"""
+Preprocessed internship catalog
+
+Posting text is cleaned, normalized and tokenized once at ingest instead of
+per request. Postings are grouped by language so the batch text APIs of
+IndicTextProcessor can amortize the per-language setup. Each posting also
+gets a precomputed keyword set (tf-idf top-k) and an inverted keyword index
+so queries can be matched against postings directly, and a stem index so
+inflected Indic words match without fuzzy comparison.
+"""
+
+import heapq
+
+from .keyword_extractor import KeywordExtractor, keyword_terms
+
+
+class CatalogIndex:
+    """
+    Ingest-time text processing of the internship catalog
+    """
+
+    # Posting fields that make up the searchable document
+    TEXT_FIELDS = ('title', 'sector', 'description')
+
+    # Keywords precomputed per posting
+    KEYWORD_COUNT = 15
+
+    def __init__(self, internships, text_processor, keyword_extractor=None):
+        self.text_processor = text_processor
+        self.keyword_extractor = keyword_extractor or KeywordExtractor(text_processor)
+        # Without a prebuilt IDF table, document frequencies come from the catalog itself
+        self._count_frequencies = not self.keyword_extractor.document_counts
+        self.internships = {}
+        self.documents = {}
+        self.keyword_postings = {}  # keyword -> set of internship ids
+        self.stem_postings = {}     # stem -> set of internship ids
+        self.ingest(internships)
+
+    def _document_text(self, internship):
+        parts = [str(internship.get(field) or '') for field in self.TEXT_FIELDS]
+        parts.extend(str(skill) for skill in internship.get('requirements', {}).get('skills', []))
+        return ' '.join(part for part in parts if part)
+
+    def ingest(self, internships):
+        """Add (or replace) postings in the index"""
+        by_language = {}
+        ingested = []
+        for internship in internships:
+            text = self._document_text(internship)
+            language = self.text_processor.detect_language(text)
+            by_language.setdefault(language, []).append((internship, text))
+            self.internships[internship['id']] = internship
+            ingested.append(internship['id'])
+
+        for language, items in by_language.items():
+            texts = [text for _, text in items]
+            cleaned = self.text_processor.clean_many(texts, language)
+            normalized = self.text_processor.normalize_many(cleaned, language)
+            tokenized = self.text_processor.tokenize_many(normalized, language)
+            if self._count_frequencies:
+                self.keyword_extractor.add_documents(tokenized, language)
+            lowered = [[token.lower() for token in tokens] for tokens in tokenized]
+            stemmed = self.text_processor.stem_many(lowered, language)
+
+            for (internship, _), text, tokens, stems in zip(items, normalized, lowered, stemmed):
+                self._unindex(internship['id'])
+                self.documents[internship['id']] = {
+                    'language': language,
+                    'text': text,
+                    'tokens': tokens,
+                    'stems': frozenset(stems)
+                }
+                for stem in self.documents[internship['id']]['stems']:
+                    self.stem_postings.setdefault(stem, set()).add(internship['id'])
+
+        # Keywords need the final document frequencies, so they come last
+        for internship_id in ingested:
+            document = self.documents[internship_id]
+            keywords = self.keyword_extractor.extract(
+                document['tokens'], document['language'], self.KEYWORD_COUNT
+            )
+            document['keywords'] = frozenset(keywords)
+            for keyword in keywords:
+                self.keyword_postings.setdefault(keyword, set()).add(internship_id)
+
+    def _unindex(self, internship_id):
+        """Remove a replaced posting from the keyword and stem indexes"""
+        previous = self.documents.get(internship_id)
+        if not previous:
+            return
+        for index, terms in ((self.keyword_postings, previous.get('keywords', ())),
+                             (self.stem_postings, previous.get('stems', ()))):
+            for term in terms:
+                postings = index.get(term)
+                if postings:
+                    postings.discard(internship_id)
+
+    def match_stems(self, text, language=None):
+        """
+        Ids of postings containing every word of `text` in some inflection
+        (the same stem). The text is prepared the same way as postings.
+        """
+        language = language or self.text_processor.detect_language(text)
+        cleaned = self.text_processor.clean_text(text, language)
+        normalized = self.text_processor.normalize_text(cleaned, language)
+        tokens = [token.lower() for token in self.text_processor.tokenize_words(normalized, language)]
+        stems = set(self.text_processor.stem_many([tokens], language)[0])
+        if not stems:
+            return set()
+        return set.intersection(*(self.stem_postings.get(stem, set()) for stem in stems))
+
+    def query_keywords(self, text, language, top_k=10):
+        """Keywords of a free-text query, prepared the same way as postings"""
+        cleaned = self.text_processor.clean_text(text, language)
+        normalized = self.text_processor.normalize_text(cleaned, language)
+        tokens = self.text_processor.tokenize_words(normalized, language)
+        return self.keyword_extractor.extract(tokens, language, top_k)
+
+    def match_keywords(self, keywords, top_k=5):
+        """
+        Postings whose keyword sets contain the given keywords, scored by the
+        summed IDF of the keywords they share
+        """
+        scores = {}
+        matched = {}
+        for keyword in set(keyword_terms(keywords, None)):
+            for internship_id in self.keyword_postings.get(keyword, ()):
+                language = self.documents[internship_id]['language']
+                scores[internship_id] = scores.get(internship_id, 0.0) + \
+                    self.keyword_extractor.idf(keyword, language)
+                matched.setdefault(internship_id, []).append(keyword)
+
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        return [
+            {
+                'id': internship_id,
+                'title': self.internships[internship_id].get('title'),
+                'score': round(score, 3),
+                'matched_keywords': sorted(matched[internship_id])
+            }
+            for internship_id, score in best
+        ]
+
+    def get_document(self, internship_id):
+        return self.documents.get(internship_id)
+
+    def __len__(self):
+        return len(self.documents)
@@ -0,0 +1,38 @@
+"""
+Per-request latency budget
+
+A Deadline is created when a request starts and handed to the stages that
+may be slow (neural translation). Stages check the remaining budget and
+degrade to cheaper work instead of overrunning it.
+"""
+
+import time
+
+
+class Deadline:
+    """Absolute point in time derived from a latency budget in milliseconds"""
+
+    def __init__(self, budget_ms):
+        self.budget_ms = float(budget_ms)
+        self._expires_at = time.monotonic() + self.budget_ms / 1000.0
+
+    @classmethod
+    def from_budget(cls, budget_ms):
+        """Return a Deadline, or None when no positive budget is given"""
+        try:
+            budget_ms = float(budget_ms)
+        except (TypeError, ValueError):
+            return None
+        return cls(budget_ms) if budget_ms > 0 else None
+
+    def remaining_ms(self):
+        return max(0.0, (self._expires_at - time.monotonic()) * 1000.0)
+
+    def remaining_seconds(self):
+        return self.remaining_ms() / 1000.0
+
+    def expired(self):
+        return time.monotonic() >= self._expires_at
+
+    def __repr__(self):
+        return f"Deadline(budget_ms={self.budget_ms}, remaining_ms={self.remaining_ms():.1f})"
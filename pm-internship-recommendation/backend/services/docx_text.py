@@ -0,0 +1,163 @@
+"""
+Streaming DOCX text extraction
+
+Reads the WordprocessingML parts straight from the zip with iterparse,
+without building the python-docx object model. Text comes out in document
+order: headers, then the body (paragraphs, tables, text boxes), then footers.
+Elements are cleared as soon as their text has been taken, so memory stays
+flat for large documents.
+
+Tables: a row whose cells hold at most one paragraph each becomes one line
+with the cells separated by tabs ("Address<TAB>Delhi" still reads as a
+labelled field). Rows with multi-paragraph cells (two-column layouts) emit
+the cells' paragraphs one per line, cell by cell.
+Text boxes are emitted where their anchor paragraph ends. The VML fallback
+copy of a text box (mc:Fallback) is skipped so it is not read twice.
+"""
+
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+
+# Transitional and strict WordprocessingML namespaces
+_W_NAMESPACES = (
+    'http://schemas.openxmlformats.org/wordprocessingml/2006/main',
+    'http://purl.oclc.org/ooxml/wordprocessingml/main',
+)
+_MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+_RELS_NAMESPACE = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+DOCUMENT_PART = 'word/document.xml'
+DOCUMENT_RELS_PART = 'word/_rels/document.xml.rels'
+
+
+def _w(name):
+    return frozenset(f'{{{namespace}}}{name}' for namespace in _W_NAMESPACES)
+
+
+_P, _T, _TAB, _TC, _TR = _w('p'), _w('t'), _w('tab'), _w('tc'), _w('tr')
+_BREAKS = _w('br') | _w('cr')
+_NO_BREAK_HYPHEN = _w('noBreakHyphen')
+# Containers whose finished children can be dropped from memory
+_PART_BODIES = _w('body') | _w('hdr') | _w('ftr')
+
+
+def _header_footer_parts(archive):
+    """Header and footer part names in relationship order"""
+    headers, footers = [], []
+    try:
+        rels = archive.read(DOCUMENT_RELS_PART)
+    except KeyError:
+        return headers, footers
+    for rel in ET.fromstring(rels).iter(f'{{{_RELS_NAMESPACE}}}Relationship'):
+        kind = rel.get('Type', '').rsplit('/', 1)[-1]
+        if kind not in ('header', 'footer') or rel.get('TargetMode') == 'External':
+            continue
+        target = rel.get('Target', '')
+        name = target.lstrip('/') if target.startswith('/') else \
+            posixpath.normpath(posixpath.join('word', target))
+        parts = headers if kind == 'header' else footers
+        if name not in parts:
+            parts.append(name)
+    return headers, footers
+
+
+def _iter_part_lines(stream):
+    """Yield the text lines of one WordprocessingML part, in document order"""
+    ready = []          # finished lines outside any table
+    runs = []           # one text buffer per open paragraph (text boxes nest)
+    cells = []          # one paragraph list per open table cell
+    rows = []           # one cell list per open table row
+    elements = []       # open elements, to find the parent of a finished one
+    fallback_depth = 0  # > 0 while inside an mc:Fallback copy
+
+    def emit(line):
+        (cells[-1] if cells else ready).append(line)
+
+    for event, element in ET.iterparse(stream, events=('start', 'end')):
+        tag = element.tag
+        if event == 'start':
+            elements.append(element)
+            if tag == _MC_FALLBACK:
+                fallback_depth += 1
+            elif fallback_depth:
+                continue
+            elif tag in _P:
+                runs.append([])
+            elif tag in _TC:
+                cells.append([])
+            elif tag in _TR:
+                rows.append([])
+            continue
+
+        elements.pop()
+        if tag == _MC_FALLBACK:
+            fallback_depth -= 1
+            element.clear()
+            continue
+        if fallback_depth:
+            continue
+
+        if tag in _T:
+            if runs and element.text:
+                runs[-1].append(element.text)
+        elif tag in _TAB:
+            if runs:
+                runs[-1].append('\t')
+        elif tag in _BREAKS:
+            if runs:
+                runs[-1].append('\n')
+        elif tag in _NO_BREAK_HYPHEN:
+            if runs:
+                runs[-1].append('-')
+        elif tag in _P:
+            text = ''.join(runs.pop()).strip()
+            if text:
+                emit(text)
+        elif tag in _TC:
+            cell = cells.pop()
+            if rows:
+                rows[-1].append(cell)
+            else:
+                for line in cell:
+                    emit(line)
+        elif tag in _TR:
+            row = [cell for cell in rows.pop() if cell]
+            if all(len(cell) == 1 for cell in row):
+                if row:
+                    emit('\t'.join(cell[0] for cell in row))
+            else:
+                for cell in row:
+                    for line in cell:
+                        emit(line)
+
+        # Drop finished top-level blocks (paragraphs, tables) from the tree
+        if elements and elements[-1].tag in _PART_BODIES:
+            elements[-1].clear()
+
+        if ready:
+            yield from ready
+            ready.clear()
+
+
+def iter_docx_lines(file):
+    """
+    Yield the text lines of a .docx file (path or binary file object):
+    headers, body and footers in document order
+    """
+    with zipfile.ZipFile(file) as archive:
+        headers, footers = _header_footer_parts(archive)
+        for part in headers + [DOCUMENT_PART] + footers:
+            try:
+                stream = archive.open(part)
+            except KeyError:
+                if part == DOCUMENT_PART:
+                    raise ValueError("Not a Word document: word/document.xml is missing")
+                continue
+            with stream:
+                yield from _iter_part_lines(stream)
+
+
+def extract_docx_text(file):
+    """Full text of a .docx file, one line per paragraph or table row"""
+    return '\n'.join(iter_docx_lines(file))
@@ -8,19 +8,27 @@ tokenization, script detection, and other language processing features.
 
 import os
 import re
+import threading
+from collections import Counter
+from functools import lru_cache
+
+from . import script_detector
+from . import transliteration_tables
+from .keyword_extractor import keyword_terms
 
 # Indic NLP Library imports
 try:
     from indicnlp import common
     from indicnlp.tokenize import indic_tokenize, sentence_tokenize
     from indicnlp.normalize import indic_normalize
-    from indicnlp.script import indic_scripts
     from indicnlp.transliterate import unicode_transliterate
     from indicnlp.morph import unsupervised_morph
     _INDIC_NLP_AVAILABLE = True
 except ImportError:
     _INDIC_NLP_AVAILABLE = False
 
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 class IndicTextProcessor:
     """
@@ -73,6 +81,33 @@ class IndicTextProcessor:
             'or': (0x0B00, 0x0B7F),  # Oriya
         }
         
+        # Cleaning regexes compiled once per language (None: whitespace only)
+        self._clean_patterns = {}
+        for language in self.supported_languages:
+            lang_range = self.unicode_ranges.get(language)
+            if lang_range:
+                start, end = lang_range
+                # Keep alphanumeric, spaces, and language-specific characters
+                self._clean_patterns[language] = re.compile(
+                    rf'[^\w\s{chr(start)}-{chr(end)}।.!?,:;()-]+', flags=re.UNICODE
+                )
+            else:
+                self._clean_patterns[language] = None
+        # General cleaning for unknown language
+        self._generic_clean_pattern = re.compile(r'[^\w\s।.!?,:;()-]+', flags=re.UNICODE)
+
+        # Indic NLP normalizer instances, created on first use per language
+        self._normalizers = {}
+        self._normalizer_lock = threading.Lock()
+        
+        # Unsupervised morph analyzers, loaded once per language, and a
+        # bounded LRU of stems (word frequencies are heavily skewed)
+        self._morph_analyzers = {}
+        self._morph_lock = threading.Lock()
+        self._cached_stem = lru_cache(maxsize=int(os.getenv('STEM_CACHE_SIZE', 50000)))(
+            self._stem_uncached
+        )
+
         # Initialize Indic NLP if available
         if self.available:
             self._initialize_indic_nlp()
@@ -92,34 +127,15 @@ class IndicTextProcessor:
     
     def detect_script(self, text):
         """
-        Detect the script of the input text
+        Detect the dominant script of the input text
         """
-        if not self.available:
-            return self._fallback_script_detection(text)
-        
-        try:
-            detected_script = indic_scripts.get_script(text)
-            return detected_script
-        except Exception:
-            return self._fallback_script_detection(text)
+        return script_detector.dominant_script(text)
     
-    def _fallback_script_detection(self, text):
-        """Fallback script detection using Unicode ranges"""
-        char_counts = {}
-        
-        for char in text:
-            for lang, (start, end) in self.unicode_ranges.items():
-                if start <= ord(char) <= end:
-                    char_counts[lang] = char_counts.get(lang, 0) + 1
-        
-        if char_counts:
-            detected_lang = max(char_counts, key=char_counts.get)
-            # Convert language code to script name
-            for script, lang in self.script_to_lang.items():
-                if lang == detected_lang:
-                    return script
-        
-        return 'LATIN'  # Default to Latin if no Indian script detected
+    def script_proportions(self, text):
+        """
+        Share of each script in the text, for mixed-script input
+        """
+        return script_detector.script_proportions(text)
     
     def detect_language(self, text):
         """
@@ -128,19 +144,53 @@ class IndicTextProcessor:
         script = self.detect_script(text)
         return self.script_to_lang.get(script, 'en')
     
+    def _get_normalizer(self, language):
+        """Cached Indic NLP normalizer for a language (None if unavailable)"""
+        if not self.available or language not in self.supported_languages:
+            return None
+        
+        normalizer = self._normalizers.get(language)
+        if normalizer is None and language not in self._normalizers:
+            with self._normalizer_lock:
+                if language not in self._normalizers:
+                    try:
+                        factory = indic_normalize.IndicNormalizerFactory()
+                        self._normalizers[language] = factory.get_normalizer(language)
+                    except Exception:
+                        self._normalizers[language] = None
+                normalizer = self._normalizers[language]
+        return normalizer
+    
     def normalize_text(self, text, language):
         """
         Normalize text using Indic NLP normalization
         """
-        if not self.available or language not in self.supported_languages:
+        normalizer = self._get_normalizer(language)
+        if normalizer is None:
             return text.strip()
         
         try:
-            normalized = indic_normalize.normalize(text, language)
+            normalized = normalizer.normalize(text)
             return normalized.strip()
         except Exception:
             return text.strip()
     
+    def normalize_many(self, texts, language):
+        """
+        Normalize a list of texts in the same language
+        """
+        normalizer = self._get_normalizer(language)
+        if normalizer is None:
+            return [text.strip() for text in texts]
+        
+        normalized = []
+        for text in texts:
+            try:
+                normalized.append(normalizer.normalize(text).strip())
+            except Exception:
+                normalized.append(text.strip())
+        return normalized
+    
     def tokenize_words(self, text, language):
         """
         Tokenize text into words using Indic NLP tokenizer
@@ -154,13 +204,24 @@ class IndicTextProcessor:
         except Exception:
             return text.split()
     
+    def tokenize_many(self, texts, language):
+        """
+        Tokenize a list of texts in the same language into word lists
+        """
+        if not self.available or language not in self.supported_languages:
+            return [text.split() for text in texts]
+        
+        return [self.tokenize_words(text, language) for text in texts]
+    
     def tokenize_sentences(self, text, language):
         """
         Tokenize text into sentences
         """
         if not self.available or language not in self.supported_languages:
-            # Simple sentence tokenization fallback
-            sentences = re.split(r'[।.!?]+', text)
+            # Simple sentence tokenization fallback: split after terminal
+            # punctuation followed by whitespace, keeping the punctuation and
+            # abbreviations such as "B.Tech" intact
+            sentences = re.split(r'(?<=[।.!?])\s+', text)
             return [s.strip() for s in sentences if s.strip()]
         
         try:
@@ -168,14 +229,22 @@ class IndicTextProcessor:
             return sentences
         except Exception:
             # Fallback to regex-based sentence splitting
-            sentences = re.split(r'[।.!?]+', text)
+            sentences = re.split(r'(?<=[।.!?])\s+', text)
             return [s.strip() for s in sentences if s.strip()]
     
     def transliterate(self, text, source_lang, target_lang):
         """
         Transliterate text between Indian languages
         """
-        if not self.available or source_lang == target_lang:
+        if source_lang == target_lang:
+            return text
+        
+        # Brahmic script pairs: precomputed str.translate tables
+        transliterated = transliteration_tables.transliterate(text, source_lang, target_lang)
+        if transliterated is not None:
+            return transliterated
+        
+        if not self.available:
             return text
         
         if source_lang not in self.supported_languages or target_lang not in self.supported_languages:
@@ -189,32 +258,69 @@ class IndicTextProcessor:
         except Exception:
             return text
     
+    def _get_morph_analyzer(self, language):
+        """Cached unsupervised morph analyzer for a language (None if unavailable)"""
+        if not self.available or language not in self.supported_languages:
+            return None
+        
+        if language not in self._morph_analyzers:
+            with self._morph_lock:
+                if language not in self._morph_analyzers:
+                    try:
+                        self._morph_analyzers[language] = \
+                            unsupervised_morph.UnsupervisedMorphAnalyzer(language)
+                    except Exception as e:
+                        print(f"Morph analyzer for '{language}' not available: {e}")
+                        self._morph_analyzers[language] = None
+        return self._morph_analyzers[language]
+    
+    def _stem_uncached(self, word, language):
+        analyzer = self._get_morph_analyzer(language)
+        if analyzer is None:
+            return word
+        try:
+            # The first morpheme is the root; suffixes follow it
+            morphs = analyzer.morph_analyze(word)
+            return morphs[0] if morphs else word
+        except Exception:
+            return word
+    
+    def stem(self, word, language):
+        """
+        Stem of a word (the word itself when no morph model is available)
+        """
+        return self._cached_stem(word, language)
+    
+    def stem_many(self, token_lists, language):
+        """
+        Stem a list of token lists in the same language, e.g. at ingest
+        """
+        if self._get_morph_analyzer(language) is None:
+            return [list(tokens) for tokens in token_lists]
+        
+        stem = self._cached_stem
+        return [[stem(token, language) for token in tokens] for tokens in token_lists]
+    
+    def stem_cache_info(self):
+        return self._cached_stem.cache_info()._asdict()
+    
     def morphological_analysis(self, text, language):
         """
-        Perform basic morphological analysis
+        Perform morphological analysis (word stems from the unsupervised
+        Indic NLP morph analyzer)
         """
         if not self.available or language not in self.supported_languages:
             return {'words': text.split(), 'stems': text.split()}
         
         try:
-            # Tokenize first
             words = self.tokenize_words(text, language)
-            
-            # Simple stem extraction (if available in Indic NLP)
-            stems = []
-            for word in words:
-                try:
-                    # This is a simplified approach - actual morphological analysis
-                    # would require more sophisticated models
-                    stems.append(word)  # Placeholder
-                except Exception:
-                    stems.append(word)
+            stems = self.stem_many([words], language)[0]
             
             return {
                 'words': words,
                 'stems': stems,
                 'language': language,
-                'analysis_available': True
+                'analysis_available': self._get_morph_analyzer(language) is not None
             }
         except Exception:
             return {
@@ -231,61 +337,38 @@ class IndicTextProcessor:
         if not text:
             return text
         
+        return self._clean(text, self._clean_pattern_for(language))
+    
+    def clean_many(self, texts, language=None):
+        """
+        Clean a list of texts in the same language
+        """
+        pattern = self._clean_pattern_for(language)
+        return [self._clean(text, pattern) if text else text for text in texts]
+    
+    def _clean_pattern_for(self, language):
+        if language and language in self.supported_languages:
+            return self._clean_patterns[language]
+        return self._generic_clean_pattern
+    
+    def _clean(self, text, pattern):
         # Remove extra whitespace
-        cleaned = re.sub(r'\s+', ' ', text)
+        cleaned = _WHITESPACE_RE.sub(' ', text)
         
         # Remove special characters but keep Indian language characters
-        if language and language in self.supported_languages:
-            # Preserve characters in the language's unicode range
-            lang_range = self.unicode_ranges.get(language)
-            if lang_range:
-                start, end = lang_range
-                # Keep alphanumeric, spaces, and language-specific characters
-                cleaned = re.sub(
-                    rf'[^\w\s{chr(start)}-{chr(end)}।.!?,:;()-]+', 
-                    '', 
-                    cleaned, 
-                    flags=re.UNICODE
-                )
-        else:
-            # General cleaning for unknown language
-            cleaned = re.sub(r'[^\w\s।.!?,:;()-]+', '', cleaned, flags=re.UNICODE)
+        if pattern is not None:
+            cleaned = pattern.sub('', cleaned)
         
         return cleaned.strip()
     
-    def extract_keywords(self, text, language):
+    def extract_keywords(self, text, language, top_k=10):
         """
-        Extract keywords from text (simple frequency-based approach)
+        Extract keywords from text (in-document frequency). For corpus-aware
+        tf-idf ranking use KeywordExtractor.
         """
-        words = self.tokenize_words(text, language)
-        cleaned_words = self.clean_text(' '.join(words), language).split()
-        
-        # Remove common stop words (simplified approach)
-        stop_words = {
-            'hi': {'है', 'हैं', 'का', 'की', 'के', 'में', 'से', 'को', 'और', 'या'},
-            'te': {'ఉంది', 'ఉన్నది', 'కు', 'లో', 'మరియు', 'లేదా'},
-            'ta': {'உள்ளது', 'உள்ளன', 'இல்', 'கு', 'மற்றும்', 'அல்லது'},
-            'bn': {'আছে', 'এর', 'তে', 'এবং', 'অথবা'},
-            'en': {'is', 'are', 'the', 'and', 'or', 'in', 'at', 'of', 'to', 'for'}
-        }
-        
-        lang_stop_words = stop_words.get(language, set())
-        
-        # Filter out stop words and short words
-        keywords = [
-            word for word in cleaned_words 
-            if len(word) > 2 and word.lower() not in lang_stop_words
-        ]
-        
-        # Count frequency
-        word_freq = {}
-        for word in keywords:
-            word_freq[word] = word_freq.get(word, 0) + 1
-        
-        # Sort by frequency
-        sorted_keywords = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        
-        return [word for word, freq in sorted_keywords[:10]]  # Top 10 keywords
+        words = self.tokenize_words(self.clean_text(text, language), language)
+        counts = Counter(keyword_terms(words, language))
+        return [word for word, freq in counts.most_common(top_k)]
     
     def is_supported_language(self, language_code):
         """Check if a language is supported"""
@@ -0,0 +1,144 @@
+"""
+Corpus-level keyword extraction
+
+Document frequencies are counted once per language over a corpus (the
+internship catalog, optionally plus resumes) and stored as a compact numpy
+.npz file. Keywords of a text are then its terms ranked by tf * idf, picked
+with Counter + heapq instead of sorting every term.
+
+Build the table file with `python build_idf.py` from the backend directory.
+"""
+
+import heapq
+import math
+import os
+from collections import Counter
+
+import numpy as np
+
+DEFAULT_IDF_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'idf_tables.npz')
+
+# Common words that never make useful keywords
+STOP_WORDS = {
+    'hi': frozenset({'है', 'हैं', 'का', 'की', 'के', 'में', 'से', 'को', 'और', 'या', 'पर', 'यह', 'एक'}),
+    'te': frozenset({'ఉంది', 'ఉన్నది', 'కు', 'లో', 'మరియు', 'లేదా'}),
+    'ta': frozenset({'உள்ளது', 'உள்ளன', 'இல்', 'கு', 'மற்றும்', 'அல்லது'}),
+    'bn': frozenset({'আছে', 'এর', 'তে', 'এবং', 'অথবা'}),
+    'en': frozenset({
+        'is', 'are', 'the', 'and', 'or', 'in', 'at', 'of', 'to', 'for', 'with',
+        'on', 'an', 'a', 'as', 'by', 'from', 'this', 'that', 'be', 'will', 'you',
+        'your', 'our', 'we', 'it', 'its', 'into', 'using', 'work', 'learn'
+    })
+}
+
+# Punctuation stripped from the edges of whitespace-split tokens
+_EDGE_PUNCTUATION = '.,:;()[]{}!?।"\'-/'
+
+
+def keyword_terms(tokens, language):
+    """Lowercased candidate terms: punctuation trimmed, short and stop words dropped"""
+    stop_words = STOP_WORDS.get(language, frozenset())
+    terms = []
+    for token in tokens:
+        term = token.strip(_EDGE_PUNCTUATION).lower()
+        if len(term) > 2 and term not in stop_words and not term.isdigit():
+            terms.append(term)
+    return terms
+
+
+class KeywordExtractor:
+    """
+    Per-language IDF table with tf-idf top-k keyword extraction
+    """
+
+    def __init__(self, text_processor=None):
+        self.text_processor = text_processor
+        self.document_frequencies = {}  # language -> Counter(term -> documents containing it)
+        self.document_counts = {}       # language -> number of documents
+        self._idf = {}                  # language -> {term: idf}, rebuilt lazily
+
+    def add_documents(self, token_lists, language):
+        """Count document frequencies of tokenized documents in one language"""
+        frequencies = self.document_frequencies.setdefault(language, Counter())
+        for tokens in token_lists:
+            frequencies.update(set(keyword_terms(tokens, language)))
+        self.document_counts[language] = self.document_counts.get(language, 0) + len(token_lists)
+        self._idf.pop(language, None)
+
+    def _idf_table(self, language):
+        table = self._idf.get(language)
+        if table is None:
+            frequencies = self.document_frequencies.get(language, Counter())
+            documents = self.document_counts.get(language, 0)
+            table = {term: self._smoothed_idf(documents, df) for term, df in frequencies.items()}
+            self._idf[language] = table
+        return table
+
+    @staticmethod
+    def _smoothed_idf(documents, df):
+        return math.log((documents + 1) / (df + 1)) + 1.0
+
+    def idf(self, term, language):
+        """IDF of a term; terms never seen in the corpus get the maximum weight"""
+        weight = self._idf_table(language).get(term)
+        if weight is None:
+            weight = self._smoothed_idf(self.document_counts.get(language, 0), 0)
+        return weight
+
+    def extract(self, tokens, language, top_k=10):
+        """Top-k keywords of a tokenized text, ranked by tf * idf"""
+        counts = Counter(keyword_terms(tokens, language))
+        if not counts:
+            return []
+        idf = self._idf_table(language)
+        default_idf = self._smoothed_idf(self.document_counts.get(language, 0), 0)
+        top = heapq.nlargest(
+            top_k, counts.items(),
+            key=lambda item: item[1] * idf.get(item[0], default_idf)
+        )
+        return [term for term, _ in top]
+
+    def extract_from_text(self, text, language, top_k=10):
+        """Tokenize text with the text processor, then extract keywords"""
+        if self.text_processor is None:
+            tokens = text.split()
+        else:
+            tokens = self.text_processor.tokenize_words(text, language)
+        return self.extract(tokens, language, top_k)
+
+    def save(self, path=None):
+        """Write the document-frequency tables as a compressed .npz file"""
+        arrays = {}
+        for language, frequencies in self.document_frequencies.items():
+            terms = sorted(frequencies)
+            arrays[f'terms_{language}'] = np.array(terms, dtype=str)
+            arrays[f'df_{language}'] = np.array([frequencies[t] for t in terms], dtype=np.uint32)
+            arrays[f'documents_{language}'] = np.array(self.document_counts[language], dtype=np.uint32)
+        np.savez_compressed(path or DEFAULT_IDF_PATH, **arrays)
+
+    def load(self, path=None):
+        """Load tables written by save(); returns False if the file does not exist"""
+        path = path or DEFAULT_IDF_PATH
+        if not os.path.exists(path):
+            return False
+
+        with np.load(path) as data:
+            for key in data.files:
+                if not key.startswith('terms_'):
+                    continue
+                language = key[len('terms_'):]
+                terms = data[key].tolist()
+                frequencies = data[f'df_{language}'].tolist()
+                self.document_frequencies[language] = Counter(dict(zip(terms, frequencies)))
+                self.document_counts[language] = int(data[f'documents_{language}'])
+                self._idf.pop(language, None)
+        return True
+
+    def get_stats(self):
+        return {
+            language: {
+                'documents': self.document_counts.get(language, 0),
+                'terms': len(frequencies)
+            }
+            for language, frequencies in self.document_frequencies.items()
+        }
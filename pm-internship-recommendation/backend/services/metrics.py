@@ -0,0 +1,103 @@
+"""
+In-process metrics
+
+Thread-safe counters and fixed-bucket histograms that services record into.
+The shared registry is exposed as JSON through `/api/metrics`.
+"""
+
+import bisect
+import threading
+
+
+class Counter:
+    """Monotonically increasing counter"""
+
+    def __init__(self, name, description=''):
+        self.name = name
+        self.description = description
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self._value += amount
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'type': 'counter',
+                'description': self.description,
+                'value': self._value
+            }
+
+
+class Histogram:
+    """
+    Histogram with fixed upper-bound buckets (cumulative, Prometheus style)
+    """
+
+    def __init__(self, name, buckets, description=''):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self._count = 0
+        self._sum = 0.0
+        self._max = None
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            if self._max is None or value > self._max:
+                self._max = value
+
+    def snapshot(self):
+        with self._lock:
+            cumulative = {}
+            running = 0
+            for bound, count in zip(self.buckets, self._counts):
+                running += count
+                cumulative[str(bound)] = running
+            cumulative['+Inf'] = self._count
+            return {
+                'type': 'histogram',
+                'description': self.description,
+                'count': self._count,
+                'sum': round(self._sum, 3),
+                'mean': round(self._sum / self._count, 3) if self._count else 0,
+                'max': self._max,
+                'buckets': cumulative
+            }
+
+
+class MetricsRegistry:
+    """Get-or-create registry of named metrics"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name, description=''):
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = Counter(name, description)
+            return self._metrics[name]
+
+    def histogram(self, name, buckets, description=''):
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = Histogram(name, buckets, description)
+            return self._metrics[name]
+
+    def snapshot(self):
+        with self._lock:
+            items = list(self._metrics.items())
+        return {name: metric.snapshot() for name, metric in sorted(items)}
+
+
+# Process-wide registry shared by all services
+metrics = MetricsRegistry()
@@ -0,0 +1,201 @@
+"""
+Content-hash cache of parsed resumes
+
+Students re-upload the same file many times while editing their profile.
+Parse results are keyed on the SHA-256 of the uploaded bytes plus the parser
+version and options, so an identical upload skips text extraction, OCR and
+field extraction. Bumping PARSER_VERSION (resume_parser) invalidates every
+entry.
+
+Entries live in a bounded in-memory LRU and, when PARSE_CACHE_DIR is set,
+also as JSON files on disk so they survive restarts and are shared between
+worker processes. Results are stored serialized, so callers always get
+their own copy. The disk tier is bounded too: once a process has seen the
+entry count pass PARSE_CACHE_DISK_SIZE by DISK_EVICTION_SLACK, the least
+recently used files (by modification time, refreshed on disk hits) beyond
+the limit are deleted. Eviction scans the directory, so it runs once per
+slack's worth of writes instead of after every write.
+
+Configuration (environment variables):
+    PARSE_CACHE_SIZE       parsed resumes kept in memory (256, 0 disables the cache)
+    PARSE_CACHE_DIR        directory of the on-disk tier (unset = memory only)
+    PARSE_CACHE_DISK_SIZE  parsed resumes kept on disk (10000)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+from .metrics import metrics
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Share of PARSE_CACHE_DISK_SIZE the disk tier may grow past before eviction
+DISK_EVICTION_SLACK = 0.1
+
+_hits_counter = metrics.counter(
+    'resume_parse_cache_hits_total',
+    description='Resume uploads answered from the parse cache'
+)
+_disk_hits_counter = metrics.counter(
+    'resume_parse_cache_disk_hits_total',
+    description='Parse cache hits served from the on-disk tier'
+)
+_misses_counter = metrics.counter(
+    'resume_parse_cache_misses_total',
+    description='Resume uploads that had to be parsed'
+)
+
+
+def content_hash(file):
+    """SHA-256 hex digest of an uploaded file, read in chunks; rewinds the file"""
+    digest = hashlib.sha256()
+    file.seek(0)
+    for chunk in iter(lambda: file.read(_HASH_CHUNK_SIZE), b''):
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """
+    LRU of parse results with an optional on-disk tier
+    """
+
+    def __init__(self, version, max_entries=None, directory=None, disk_max_entries=None):
+        self.version = version
+        if max_entries is None:
+            max_entries = int(os.getenv('PARSE_CACHE_SIZE', 256))
+        self.max_entries = max_entries
+        self.directory = directory if directory is not None else os.getenv('PARSE_CACHE_DIR')
+        if disk_max_entries is None:
+            disk_max_entries = int(os.getenv('PARSE_CACHE_DISK_SIZE', 10000))
+        self.disk_max_entries = max(1, disk_max_entries)
+        self._disk_slack = max(1, int(self.disk_max_entries * DISK_EVICTION_SLACK))
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Entry files as last counted plus this process's writes since
+        self._disk_entries = 0
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            self._disk_entries = sum(1 for name in os.listdir(self.directory) if name.endswith('.json'))
+
+    @property
+    def enabled(self):
+        return self.max_entries > 0
+
+    def key(self, file, **options):
+        """Cache key of an upload: content hash, parser version and parse options"""
+        parts = [content_hash(file), str(self.version)]
+        parts.extend(f"{name}={options[name]}" for name in sorted(options))
+        return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Cached result for a key, or None"""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+
+        if payload is None and self.directory:
+            payload = self._read_disk(key)
+            if payload is not None:
+                _disk_hits_counter.inc()
+                self._remember(key, payload)
+
+        if payload is None:
+            _misses_counter.inc()
+            return None
+        _hits_counter.inc()
+        return json.loads(payload)
+
+    def put(self, key, result):
+        payload = json.dumps(result, ensure_ascii=False)
+        self._remember(key, payload)
+        if self.directory:
+            self._write_disk(key, payload)
+
+    def _remember(self, key, payload):
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _read_disk(self, key):
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as cache_file:
+                payload = cache_file.read()
+            # A hit makes the entry the most recently used one for eviction
+            os.utime(path)
+            return payload
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            print(f"WARNING: Could not read parse cache entry {key}: {e}")
+            return None
+
+    def _write_disk(self, key, payload):
+        # Write to a temp file and rename, so readers never see half an entry
+        try:
+            handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(handle, 'w', encoding='utf-8') as cache_file:
+                cache_file.write(payload)
+            os.replace(temp_path, self._path(key))
+        except OSError as e:
+            print(f"WARNING: Could not write parse cache entry {key}: {e}")
+            return
+        with self._lock:
+            self._disk_entries += 1
+            due = self._disk_entries > self.disk_max_entries + self._disk_slack
+        if due:
+            self._evict_disk()
+
+    def _evict_disk(self):
+        """Delete the least recently used entry files beyond disk_max_entries"""
+        try:
+            entries = [entry for entry in os.scandir(self.directory) if entry.name.endswith('.json')]
+        except OSError as e:
+            print(f"WARNING: Could not list parse cache directory: {e}")
+            return
+        excess = len(entries) - self.disk_max_entries
+        with self._lock:
+            self._disk_entries = len(entries) - max(0, excess)
+        if excess <= 0:
+            return
+
+        def modified(entry):
+            try:
+                return entry.stat().st_mtime
+            except OSError:
+                return 0.0
+
+        for entry in sorted(entries, key=modified)[:excess]:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass  # evicted by another worker
+            except OSError as e:
+                print(f"WARNING: Could not evict parse cache entry {entry.name}: {e}")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self):
+        return {
+            'version': self.version,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'directory': self.directory,
+            'disk_max_entries': self.disk_max_entries
+        }
@@ -0,0 +1,168 @@
+"""
+Page-level OCR for PDFs
+
+Only pages whose text layer is empty or junk are rasterized and OCRed;
+pages with real text keep their extracted text. The OCR pages of a document
+run in parallel on a shared process pool (Tesseract and rasterization are
+CPU bound), one page per task. Daemonic processes such as bulk_parse
+workers may not have children, so they OCR their pages serially.
+
+Memory stays roughly constant in page count: the upload is spooled to a
+temporary file, each task renders a single page into a temporary folder
+and Tesseract reads the image from disk, so neither the PDF bytes nor
+decoded page images are held in the Python processes.
+
+Configuration (environment variables):
+    OCR_DPI            rasterization resolution (200)
+    OCR_MAX_PAGES      pages of a document that may be OCRed (20)
+    OCR_LANGUAGES      Tesseract language packs (eng+hin+tel+tam+ben)
+    OCR_WORKERS        OCR processes (0 = CPU count, 1 = OCR in the calling process)
+    OCR_MIN_PAGE_CHARS letters/digits below which a page counts as empty (20)
+    PDF_MAX_PAGES      hard limit on pages per uploaded PDF (50)
+"""
+
+import multiprocessing
+import os
+import re
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+# Optional dependencies
+try:
+    from pdf2image import convert_from_path
+    import pytesseract
+    OCR_AVAILABLE = True
+except ImportError:
+    OCR_AVAILABLE = False
+
+OCR_DPI = int(os.getenv('OCR_DPI', 200))
+OCR_MAX_PAGES = int(os.getenv('OCR_MAX_PAGES', 20))
+OCR_LANGUAGES = os.getenv('OCR_LANGUAGES', 'eng+hin+tel+tam+ben')
+OCR_WORKERS = int(os.getenv('OCR_WORKERS', 0)) or os.cpu_count() or 1
+OCR_MIN_PAGE_CHARS = int(os.getenv('OCR_MIN_PAGE_CHARS', 20))
+PDF_MAX_PAGES = int(os.getenv('PDF_MAX_PAGES', 50))
+
+# Copy buffer used when spooling uploads to disk
+_SPOOL_CHUNK_SIZE = 1024 * 1024
+
+# Unmapped glyphs from PDF text extraction, e.g. "(cid:123)"
+_CID_RE = re.compile(r'\(cid:\d+\)')
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def needs_ocr(page_text):
+    """
+    True when a page's extracted text is empty or junk: too few letters or
+    digits, or mostly unmapped glyphs and replacement characters
+    """
+    if not page_text:
+        return True
+    text = _CID_RE.sub('\ufffd', page_text)
+    visible = [char for char in text if not char.isspace()]
+    word_chars = sum(1 for char in visible if char.isalnum())
+    if word_chars < OCR_MIN_PAGE_CHARS:
+        return True
+    junk = sum(1 for char in visible if char == '\ufffd' or not char.isprintable())
+    return junk > len(visible) / 2
+
+
+def spool_to_temp(file, suffix=''):
+    """
+    Copy an uploaded file to a temporary file in chunks and return its
+    path; the caller deletes the file
+    """
+    file.seek(0)
+    handle, path = tempfile.mkstemp(suffix=suffix)
+    try:
+        with os.fdopen(handle, 'wb') as spool:
+            shutil.copyfileobj(file, spool, _SPOOL_CHUNK_SIZE)
+    except Exception:
+        os.remove(path)
+        raise
+    return path
+
+
+@contextmanager
+def spooled_upload(file, suffix='.pdf'):
+    """spool_to_temp as a context manager; yields the path and deletes the file"""
+    path = spool_to_temp(file, suffix)
+    try:
+        yield path
+    finally:
+        os.remove(path)
+
+
+def _ocr_page(pdf_path, page_number, dpi, languages):
+    """
+    Rasterize one page (1-based) into a temporary folder and OCR the image
+    file; runs in a worker process. The image is deleted with the folder.
+    """
+    with tempfile.TemporaryDirectory(prefix='ocr-page-') as folder:
+        image_paths = convert_from_path(
+            pdf_path, dpi=dpi, first_page=page_number, last_page=page_number,
+            output_folder=folder, paths_only=True
+        )
+        return '\n'.join(
+            pytesseract.image_to_string(image_path, lang=languages) for image_path in image_paths
+        )
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(max_workers=OCR_WORKERS)
+    return _pool
+
+
+def _ocr_serially(pdf_path, page_numbers, dpi, languages):
+    texts = {}
+    for page_number in page_numbers:
+        try:
+            texts[page_number] = _ocr_page(pdf_path, page_number, dpi, languages)
+        except Exception as e:
+            print(f"WARNING: OCR failed for page {page_number}: {e}")
+            texts[page_number] = ''
+    return texts
+
+
+def ocr_pages(pdf_path, page_numbers, dpi=None, languages=None):
+    """
+    OCR the given 1-based page numbers of a PDF file in parallel.
+    Returns {page_number: text}; a page that fails to OCR maps to ''.
+    """
+    if not OCR_AVAILABLE or not page_numbers:
+        return {}
+    dpi = dpi or OCR_DPI
+    languages = languages or OCR_LANGUAGES
+
+    # A single page is not worth the round trip to the pool, and daemonic
+    # processes (bulk_parse workers) may not start one
+    if len(page_numbers) == 1 or OCR_WORKERS == 1 or multiprocessing.current_process().daemon:
+        return _ocr_serially(pdf_path, page_numbers, dpi, languages)
+
+    futures = {}
+    try:
+        pool = _get_pool()
+        for page_number in page_numbers:
+            futures[page_number] = pool.submit(_ocr_page, pdf_path, page_number, dpi, languages)
+    except Exception as e:
+        # Pool could not start or broke; the remaining pages run here
+        print(f"WARNING: OCR pool unavailable, running pages serially: {e}")
+    texts = _ocr_serially(
+        pdf_path, [page_number for page_number in page_numbers if page_number not in futures],
+        dpi, languages
+    )
+    for page_number, future in futures.items():
+        try:
+            texts[page_number] = future.result()
+        except Exception as e:
+            print(f"WARNING: OCR failed for page {page_number}: {e}")
+            texts[page_number] = ''
+    return texts
@@ -0,0 +1,81 @@
+"""
+Pre-translated match reason templates
+
+The recommendation engine emits match reasons as codes plus parameters
+(e.g. {'code': 'skills_match', 'params': {'skills': ['Python', 'SQL']}}).
+Localizing a reason is then string formatting against these templates; only
+the parameter terms (skill and interest names) need translating, and those
+come from the translation service's term cache.
+"""
+
+REASON_TEMPLATES = {
+    'en': {
+        'education_match': "Educational background matches requirements",
+        'skills_match': "Skills match: {skills}",
+        'location_match': "Location preference matches",
+        'interest_match': "Interest alignment: {interests}"
+    },
+    'hi': {
+        'education_match': "शैक्षिक पृष्ठभूमि आवश्यकताओं से मेल खाती है",
+        'skills_match': "कौशल मेल: {skills}",
+        'location_match': "स्थान वरीयता मेल खाती है",
+        'interest_match': "रुचि संरेखण: {interests}"
+    },
+    'te': {
+        'education_match': "విద్యా నేపథ్యం అవసరాలకు సరిపోతుంది",
+        'skills_match': "నైపుణ్యాల సరిపోలిక: {skills}",
+        'location_match': "ప్రాంత ప్రాధాన్యత సరిపోతుంది",
+        'interest_match': "ఆసక్తి అనుగుణ్యత: {interests}"
+    },
+    'ta': {
+        'education_match': "கல்விப் பின்னணி தேவைகளுக்குப் பொருந்துகிறது",
+        'skills_match': "திறன் பொருத்தம்: {skills}",
+        'location_match': "இட விருப்பம் பொருந்துகிறது",
+        'interest_match': "ஆர்வப் பொருத்தம்: {interests}"
+    },
+    'bn': {
+        'education_match': "শিক্ষাগত যোগ্যতা প্রয়োজনীয়তার সাথে মেলে",
+        'skills_match': "দক্ষতার মিল: {skills}",
+        'location_match': "অবস্থানের পছন্দ মেলে",
+        'interest_match': "আগ্রহের মিল: {interests}"
+    }
+}
+
+# Parameters that hold lists of terms to be translated and joined
+TERM_LIST_PARAMS = ('skills', 'interests')
+
+
+def has_templates(language):
+    return language in REASON_TEMPLATES
+
+
+def reason_terms(reason_codes):
+    """All parameter terms used by a list of reason codes"""
+    terms = []
+    for reason in reason_codes:
+        params = reason.get('params', {})
+        for name in TERM_LIST_PARAMS:
+            terms.extend(params.get(name, []))
+    return terms
+
+
+def render_reason(reason, language='en', term_translations=None):
+    """
+    Format one reason code in the given language.
+    term_translations maps English terms to their translation; terms
+    missing from it are used as-is.
+    """
+    templates = REASON_TEMPLATES.get(language, REASON_TEMPLATES['en'])
+    template = templates.get(reason['code']) or REASON_TEMPLATES['en'][reason['code']]
+    term_translations = term_translations or {}
+
+    values = {}
+    for name, value in reason.get('params', {}).items():
+        if name in TERM_LIST_PARAMS:
+            value = ', '.join(term_translations.get(term, term) for term in value)
+        values[name] = value
+    return template.format(**values)
+
+
+def render_reasons(reason_codes, language='en', term_translations=None):
+    return [render_reason(reason, language, term_translations) for reason in reason_codes]
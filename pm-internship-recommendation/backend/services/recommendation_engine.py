@@ -1,8 +1,12 @@
 from rapidfuzz import fuzz
 import re
+from .reason_templates import render_reasons
 
 class RecommendationEngine:
-    def __init__(self):
+    def __init__(self, catalog_index=None):
+        # With the catalog's CatalogIndex, interests also match postings that
+        # contain them in another inflection (stem index), not only fuzzily
+        self.catalog_index = catalog_index
         self.education_weights = {
             'btech': ['engineering', 'technology', 'software', 'it'],
             'bsc': ['science', 'research', 'lab', 'analysis'],
@@ -23,9 +27,10 @@ class RecommendationEngine:
         Get top 3-5 internship recommendations based on user profile
         """
         scores = []
+        interest_postings = self._interest_postings(user_data.get('interests', []))
         
         for internship in internships:
-            score = self._calculate_match_score(user_data, internship)
+            score = self._calculate_match_score(user_data, internship, interest_postings)
             scores.append({
                 'internship': internship,
                 'score': score
@@ -38,12 +43,23 @@ class RecommendationEngine:
         for item in scores[:5]:
             recommendation = item['internship'].copy()
             recommendation['match_score'] = round(item['score'], 2)
-            recommendation['match_reasons'] = self._get_match_reasons(user_data, item['internship'])
+            reason_codes = self._get_match_reason_codes(user_data, item['internship'])
+            recommendation['match_reason_codes'] = reason_codes
+            recommendation['match_reasons'] = render_reasons(reason_codes, 'en')
             recommendations.append(recommendation)
         
         return recommendations
 
-    def _calculate_match_score(self, user_data, internship):
+    def _interest_postings(self, user_interests):
+        """
+        Per interest, the ids of postings containing it in some inflection
+        (None without a catalog index)
+        """
+        if self.catalog_index is None or not user_interests:
+            return None
+        return [self.catalog_index.match_stems(str(interest)) for interest in user_interests]
+
+    def _calculate_match_score(self, user_data, internship, interest_postings=None):
         """
         Calculate match score between user and internship
         """
@@ -75,7 +91,9 @@ class RecommendationEngine:
         interests_score = self._calculate_interests_match(
             user_data.get('interests', []),
             internship.get('sector', ''),
-            internship.get('description', '')
+            internship.get('description', ''),
+            interest_postings,
+            internship.get('id')
         )
         total_score += interests_score * self.interests_match_weight
         
@@ -141,9 +159,11 @@ class RecommendationEngine:
         
         return 0.2  # Different location
 
-    def _calculate_interests_match(self, user_interests, sector, description):
+    def _calculate_interests_match(self, user_interests, sector, description,
+                                   interest_postings=None, internship_id=None):
         """
-        Calculate interests match with internship sector and description
+        Calculate interests match with internship sector and description.
+        An interest also matches when the stem index found it in the posting.
         """
         if not user_interests:
             return 0.5
@@ -151,8 +171,10 @@ class RecommendationEngine:
         combined_text = f"{sector} {description}".lower()
         matches = 0
         
-        for interest in user_interests:
-            if fuzz.partial_ratio(interest.lower(), combined_text) > 50:
+        for position, interest in enumerate(user_interests):
+            if interest_postings and internship_id in interest_postings[position]:
+                matches += 1
+            elif fuzz.partial_ratio(interest.lower(), combined_text) > 50:
                 matches += 1
         
         return min(matches / len(user_interests), 1.0)
@@ -177,9 +199,10 @@ class RecommendationEngine:
         
         return 'unknown'
 
-    def _get_match_reasons(self, user_data, internship):
+    def _get_match_reason_codes(self, user_data, internship):
         """
-        Generate human-readable reasons for the match
+        Generate structured reasons for the match as {'code', 'params'} dicts,
+        localized later from pre-translated templates
         """
         reasons = []
 
@@ -187,7 +210,7 @@ class RecommendationEngine:
             user_data.get('education', '').lower(),
             internship.get('requirements', {}).get('education', '').lower()
         ) > 70:
-            reasons.append("Educational background matches requirements")
+            reasons.append({'code': 'education_match', 'params': {}})
 
         user_skills = user_data.get('skills', [])
         required_skills = internship.get('requirements', {}).get('skills', [])
@@ -200,13 +223,13 @@ class RecommendationEngine:
                     break
         
         if matched_skills:
-            reasons.append(f"Skills match: {', '.join(matched_skills[:3])}")
+            reasons.append({'code': 'skills_match', 'params': {'skills': matched_skills[:3]}})
 
         if fuzz.partial_ratio(
             user_data.get('location', '').lower(),
             internship.get('location', '').lower()
         ) > 60:
-            reasons.append("Location preference matches")
+            reasons.append({'code': 'location_match', 'params': {}})
         
         user_interests = user_data.get('interests', [])
         sector = internship.get('sector', '')
@@ -217,6 +240,6 @@ class RecommendationEngine:
                 matched_interests.append(interest)
         
         if matched_interests:
-            reasons.append(f"Interest alignment: {', '.join(matched_interests)}")
+            reasons.append({'code': 'interest_match', 'params': {'interests': matched_interests}})
         
         return reasons[:3]  # Return top 3 reasons
@@ -0,0 +1,197 @@
+"""
+Process-wide registry of heavy shared resources
+
+Text processors, the translation service (and its neural model), the spaCy
+pipeline, compiled regex banks and the catalog snapshot are expensive to
+build and safe to share between request threads. Services ask the registry
+for them instead of constructing their own copies; each resource is created
+lazily, exactly once, on first use.
+"""
+
+import os
+import sys
+import threading
+import time
+import types
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
+
+class _Entry:
+    __slots__ = ('factory', 'description', 'instance', 'loaded', 'load_time_ms', 'lock')
+
+    def __init__(self, factory, description):
+        self.factory = factory
+        self.description = description
+        self.instance = None
+        self.loaded = False
+        self.load_time_ms = None
+        self.lock = threading.Lock()
+
+
+class ServiceRegistry:
+    """
+    Lazily created, shared resource instances keyed by name
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, factory, description=''):
+        """Register a factory; an already loaded instance is kept"""
+        with self._lock:
+            if name in self._entries and self._entries[name].loaded:
+                return
+            self._entries[name] = _Entry(factory, description)
+
+    def get(self, name):
+        """Return the shared instance, creating it on first use"""
+        entry = self._entries.get(name)
+        if entry is None:
+            raise KeyError(f"No resource registered as '{name}'")
+        if not entry.loaded:
+            # Per-resource lock: factories may get() other resources
+            with entry.lock:
+                if not entry.loaded:
+                    started = time.perf_counter()
+                    entry.instance = entry.factory()
+                    entry.load_time_ms = round((time.perf_counter() - started) * 1000, 2)
+                    entry.loaded = True
+        return entry.instance
+
+    def is_loaded(self, name):
+        entry = self._entries.get(name)
+        return bool(entry and entry.loaded)
+
+    def snapshot(self):
+        """Registered resources with load state, load time and approximate memory"""
+        entries = list(self._entries.items())
+        # A resource holding a reference to another one does not count its memory
+        shared = {id(entry.instance) for _, entry in entries if entry.loaded}
+        resources = []
+        for name, entry in entries:
+            memory = 0
+            if entry.loaded:
+                memory = estimate_memory(entry.instance, exclude=shared - {id(entry.instance)})
+            resources.append({
+                'name': name,
+                'description': entry.description,
+                'loaded': entry.loaded,
+                'load_time_ms': entry.load_time_ms,
+                'memory_bytes': memory
+            })
+        return resources
+
+
+# Objects not followed when estimating memory (shared code, not resource data)
+_SKIP_TYPES = (
+    type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+    types.MethodType, threading.Thread
+)
+
+
+def _module_bytes(module):
+    tensors = list(module.parameters()) + list(module.buffers())
+    return sum(t.numel() * t.element_size() for t in tensors)
+
+
+def estimate_memory(obj, exclude=()):
+    """
+    Approximate memory held by an object graph: sys.getsizeof over the
+    reachable containers and instances, parameter/buffer bytes for torch
+    modules, serialized size for spaCy pipelines. Objects whose id is in
+    exclude are not followed.
+    """
+    seen = set(exclude)
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if item is None or id(item) in seen or isinstance(item, _SKIP_TYPES):
+            continue
+        seen.add(id(item))
+
+        if torch is not None and isinstance(item, torch.nn.Module):
+            total += _module_bytes(item)
+            continue
+        if type(item).__module__.startswith('spacy.') and hasattr(item, 'to_bytes'):
+            try:
+                total += len(item.to_bytes())
+                continue
+            except Exception:
+                pass
+
+        try:
+            total += sys.getsizeof(item)
+        except TypeError:
+            continue
+
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        else:
+            if hasattr(item, '__dict__'):
+                stack.append(vars(item))
+            for slot in getattr(type(item), '__slots__', ()):
+                stack.append(getattr(item, slot, None))
+    return total
+
+
+def _load_text_processor():
+    from .indic_text_processor import IndicTextProcessor
+    return IndicTextProcessor()
+
+
+def _load_translation_service():
+    from .translation_service import TranslationService
+    return TranslationService()
+
+
+# spaCy is only used for PERSON entities; en_core_web_sm's ner component has
+# its own embedding layer, so everything else can be left out of the pipeline
+SPACY_EXCLUDE = ('tok2vec', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'senter')
+
+
+def _load_spacy_nlp():
+    try:
+        import spacy
+    except ImportError:
+        print("WARNING: spaCy not available. Name extraction will use fallback method.")
+        return None
+    exclude = os.getenv('SPACY_EXCLUDE')
+    exclude = [name.strip() for name in exclude.split(',') if name.strip()] \
+        if exclude is not None else list(SPACY_EXCLUDE)
+    try:
+        return spacy.load("en_core_web_sm", exclude=exclude)
+    except OSError:
+        print("WARNING: spaCy model 'en_core_web_sm' not found.")
+        print("    For better name extraction, install with: python -m spacy download en_core_web_sm")
+        return None
+
+
+def _load_resume_regex_banks():
+    from .resume_parser import compile_regex_banks
+    return compile_regex_banks()
+
+
+def _load_skill_matcher():
+    from .skill_matcher import SkillMatcher, load_skill_dictionary
+    return SkillMatcher(load_skill_dictionary())
+
+
+registry = ServiceRegistry()
+registry.register('text_processor', _load_text_processor,
+                  'IndicTextProcessor (normalizers, morph analyzers, stem cache)')
+registry.register('translation_service', _load_translation_service,
+                  'TranslationService (neural model when available, term cache)')
+registry.register('spacy_nlp', _load_spacy_nlp, 'spaCy en_core_web_sm pipeline (NER only)')
+registry.register('resume_regex_banks', _load_resume_regex_banks,
+                  'Compiled resume location and name patterns')
+registry.register('skill_matcher', _load_skill_matcher,
+                  'Aho-Corasick automaton over data/skills keywords')
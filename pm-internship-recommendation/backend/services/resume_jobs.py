@@ -0,0 +1,170 @@
+"""
+Asynchronous resume parsing jobs
+
+Uploads are spooled to temporary files, queued and parsed on a bounded
+worker pool, so a slow resume (OCR, spaCy, translation) does not hold a
+request thread.
+Clients poll the job for its stage, progress and result. Finished jobs are
+dropped after a TTL; submissions are rejected while the queue is full.
+
+Configuration (environment variables, overridable via constructor):
+    RESUME_JOB_WORKERS          parser threads (2)
+    RESUME_JOB_QUEUE_MAX_DEPTH  queued + running jobs before rejecting (32)
+    RESUME_JOB_TTL_SECONDS      how long finished jobs stay available (600)
+"""
+
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.datastructures import FileStorage
+
+from .metrics import metrics
+from .pdf_ocr import spool_to_temp
+from .resume_parser import PARSE_STAGES
+
+
+class ResumeJobQueueFull(Exception):
+    """Raised when the resume job queue is at its maximum depth"""
+
+
+_queue_wait_histogram = metrics.histogram(
+    'resume_job_queue_wait_ms',
+    buckets=(10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000),
+    description='Time a resume job waited for a worker'
+)
+_duration_histogram = metrics.histogram(
+    'resume_job_duration_ms',
+    buckets=(50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000),
+    description='Time spent parsing a resume job'
+)
+_rejected_counter = metrics.counter(
+    'resume_job_rejected_total',
+    description='Resume jobs rejected because the queue was full'
+)
+
+
+class ResumeJobQueue:
+    """
+    Bounded pool of resume parsing jobs with polling by job id
+    """
+
+    def __init__(self, parser, max_workers=None, max_pending=None, ttl_seconds=None):
+        self.parser = parser
+        self.max_workers = max_workers or int(os.getenv('RESUME_JOB_WORKERS', 2))
+        self.max_pending = max_pending or int(os.getenv('RESUME_JOB_QUEUE_MAX_DEPTH', 32))
+        self.ttl_seconds = ttl_seconds or float(os.getenv('RESUME_JOB_TTL_SECONDS', 600))
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='resume-job'
+        )
+        self._jobs = {}
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def submit(self, file, education_details=False):
+        """Queue an uploaded file for parsing and return its job id"""
+        self._purge_expired()
+        with self._lock:
+            if self._pending >= self.max_pending:
+                _rejected_counter.inc()
+                raise ResumeJobQueueFull(
+                    f"Resume job queue is full ({self.max_pending} pending jobs)"
+                )
+            job_id = uuid.uuid4().hex
+            self._jobs[job_id] = {
+                'job_id': job_id,
+                'filename': file.filename,
+                'status': 'queued',
+                'stage': None,
+                'progress': 0.0,
+                'created_at': time.time(),
+                'started_at': None,
+                'finished_at': None,
+                'result': None,
+                'error': None
+            }
+            self._pending += 1
+
+        try:
+            # Queued jobs hold a temporary file, not the upload bytes
+            path = spool_to_temp(file, os.path.splitext(file.filename or '')[1])
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+                del self._jobs[job_id]
+            raise
+        self._executor.submit(self._run, job_id, file.filename, path, education_details)
+        return job_id
+
+    def get(self, job_id):
+        """Snapshot of a job, or None if unknown or expired"""
+        self._purge_expired()
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def queue_depth(self):
+        return self._pending
+
+    def get_stats(self):
+        return {
+            'max_workers': self.max_workers,
+            'max_pending': self.max_pending,
+            'pending': self._pending,
+            'jobs': len(self._jobs),
+            'ttl_seconds': self.ttl_seconds
+        }
+
+    def _update(self, job_id, **fields):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job:
+                job.update(fields)
+
+    def _run(self, job_id, filename, path, education_details):
+        started = time.time()
+        with self._lock:
+            _queue_wait_histogram.observe((started - self._jobs[job_id]['created_at']) * 1000)
+        self._update(job_id, status='running', started_at=started)
+
+        def progress(stage):
+            position = PARSE_STAGES.index(stage) if stage in PARSE_STAGES else 0
+            self._update(job_id, stage=stage, progress=round(position / len(PARSE_STAGES), 2))
+
+        try:
+            with open(path, 'rb') as stream:
+                upload = FileStorage(stream=stream, filename=filename)
+                result = self.parser.parse(upload, education_details, progress)
+            status = 'done' if result.get('success') else 'failed'
+            self._update(job_id, status=status, result=result,
+                         error=None if result.get('success') else result.get('message'))
+        except Exception as e:
+            self._update(job_id, status='failed', error=str(e))
+        finally:
+            os.remove(path)
+            finished = time.time()
+            _duration_histogram.observe((finished - started) * 1000)
+            with self._lock:
+                self._pending -= 1
+                job = self._jobs.get(job_id)
+                if job:
+                    job['finished_at'] = finished
+                    if job['status'] == 'done':
+                        job['stage'] = None
+                        job['progress'] = 1.0
+
+    def _purge_expired(self):
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job['finished_at'] is not None and job['finished_at'] < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
@@ -1,141 +1,232 @@
 import PyPDF2
-import docx
+import multiprocessing
+import os
 import re
-from io import BytesIO
-from .indic_text_processor import IndicTextProcessor
-from .translation_service import TranslationService
-
-# Optional dependencies for better functionality
-try:
-    from pdf2image import convert_from_bytes
-    import pytesseract
-    OCR_AVAILABLE = True
-except ImportError:
-    OCR_AVAILABLE = False
+from .docx_text import extract_docx_text
+from .parse_cache import ParseCache
+from .pdf_ocr import (
+    OCR_AVAILABLE, OCR_MAX_PAGES, PDF_MAX_PAGES, needs_ocr, ocr_pages, spooled_upload
+)
+from .registry import registry
+from .resume_sections import compile_section_pattern, split_sections
+from .text_pipeline import TextPipeline
+
+if not OCR_AVAILABLE:
     print("WARNING: OCR dependencies not available. Install pillow and pytesseract for better PDF parsing.")
 
-try:
-    import spacy
-    SPACY_AVAILABLE = True
-except ImportError:
-    SPACY_AVAILABLE = False
-    print("WARNING: spaCy not available. Name extraction will use fallback method.")
+
+# Location patterns in different languages. A label must be followed by a
+# colon, so body text like "State-level champion" is not read as one. Indic
+# labels also accept a visarga: the Indic NLP normalizer rewrites "पता:" as "पताः"
+LOCATION_PATTERNS = {
+    'en': [
+        r'\baddress\s*:\s*([^\n]+)',
+        r'\blocation\s*:\s*([^\n]+)',
+        r'\bcity\s*:\s*([^\n]+)',
+        r'\bstate\s*:\s*([^\n]+)',
+        r'\bresidence\s*:\s*([^\n]+)'
+    ],
+    'hi': [
+        r'पता\s*[:ःঃஃః]\s*([^\n]+)',
+        r'स्थान\s*[:ःঃஃః]\s*([^\n]+)',
+        r'शहर\s*[:ःঃஃః]\s*([^\n]+)',
+        r'राज्य\s*[:ःঃஃః]\s*([^\n]+)',
+        r'निवास\s*[:ःঃஃః]\s*([^\n]+)'
+    ],
+    'te': [
+        r'చిరునామా\s*[:ःঃஃః]\s*([^\n]+)',
+        r'స్థానం\s*[:ःঃஃః]\s*([^\n]+)',
+        r'పట్టణం\s*[:ःঃஃః]\s*([^\n]+)',
+        r'రాష్ట్రం\s*[:ःঃஃః]\s*([^\n]+)'
+    ],
+    'ta': [
+        r'முகவரி\s*[:ःঃஃః]\s*([^\n]+)',
+        r'இடம்\s*[:ःঃஃః]\s*([^\n]+)',
+        r'நகரம்\s*[:ःঃஃః]\s*([^\n]+)',
+        r'மாநிலம்\s*[:ःঃஃః]\s*([^\n]+)'
+    ],
+    'bn': [
+        r'ঠিকানা\s*[:ःঃஃః]\s*([^\n]+)',
+        r'স্থান\s*[:ःঃஃః]\s*([^\n]+)',
+        r'শহর\s*[:ःঃஃః]\s*([^\n]+)',
+        r'রাজ্য\s*[:ःঃஃః]\s*([^\n]+)'
+    ]
+}
+
+# An address section with no label or known place still gives the location
+# when it is shaped like an address: comma-separated parts such as
+# "मकान 128, इंदौर, मध्य प्रदेश"
+ADDRESS_SHAPE_RE = re.compile(r'^[^,]{1,40}(?:,[^,]{1,40}){1,4}$')
+
+# Multilingual name patterns (visarga separators as for locations)
+NAME_PATTERNS = {
+    'en': [r'^([A-Z][a-z]+ [A-Z][a-z]+)', r'name[:\s]*([A-Z][a-z]+ [A-Z][a-z]+)'],
+    'hi': [r'^नाम[:\sःঃஃః]*([^न\n]+)', r'^([अ-ह]+ [अ-ह]+)'],
+    'te': [r'^పేరు[:\sःঃஃః]*([^న\n]+)', r'^([అ-హ]+ [అ-హ]+)'],
+    'ta': [r'^பெயர்[:\sःঃஃః]*([^ந\n]+)', r'^([அ-ஹ]+ [அ-ஹ]+)'],
+    'bn': [r'^নাম[:\sःঃஃః]*([^ন\n]+)', r'^([অ-হ]+ [অ-হ]+)']
+}
+
+# Education patterns (multilingual) as (degree, pattern) in priority order:
+# when one education entry is wanted, the highest-priority degree wins.
+# Each alternative must stand as a whole word (see _WORD_START/_WORD_END),
+# so short forms like "b.a" no longer match inside "database" or "bank"
+EDUCATION_PATTERNS = {
+    'en': [
+        ('btech', r'b\.?tech|bachelor.{0,40}?technology|engineering'),
+        ('bsc', r'b\.?sc|bachelor.{0,40}?science'),
+        ('bcom', r'b\.?com|bachelor.{0,40}?commerce'),
+        ('ba', r'b\.a\.?|ba|bachelor.{0,40}?arts'),
+        ('mtech', r'm\.?tech|master.{0,40}?technology'),
+        ('msc', r'm\.?sc|master.{0,40}?science'),
+        ('mba', r'mba|master.{0,40}?business'),
+        ('diploma', r'diploma|polytechnic'),
+        ('class12', r'12th|class.{0,10}?12|higher\s+secondary|intermediate'),
+        ('class10', r'10th|class.{0,10}?10|matriculation|secondary')
+    ],
+    'hi': [
+        ('btech', r'बी\.?टेक|इंजीनियरिंग|तकनीकी'),
+        ('bsc', r'बी\.?एससी|विज्ञान'),
+        ('bcom', r'बी\.?कॉम|वाणिज्य'),
+        ('ba', r'बी\.?ए|कला'),
+        ('mtech', r'एम\.?टेक|प्रौद्योगिकी'),
+        ('msc', r'एम\.?एससी|विज्ञान'),
+        ('mba', r'एमबीए|बिजनेस|व्यापार'),
+        ('diploma', r'डिप्लोमा|पॉलिटेक्निक'),
+        ('class12', r'12वीं|कक्षा.{0,10}?12|उच्च माध्यमिक|इंटरमीडिएट'),
+        ('class10', r'10वीं|कक्षा.{0,10}?10|मैट्रिक|माध्यमिक')
+    ],
+    'te': [
+        ('btech', r'బీ\.?టెక్|ఇంజనీరింగ్|టెక్నాలజీ'),
+        ('bsc', r'బీ\.?ఎస్సీ|సైన్స్'),
+        ('bcom', r'బీ\.?కామ్|కామర్స్'),
+        ('ba', r'బీ\.?ఏ|ఆర్ట్స్'),
+        ('mtech', r'ఎం\.?టెక్|టెక్నాలజీ'),
+        ('msc', r'ఎం\.?ఎస్సీ|సైన్స్'),
+        ('mba', r'ఎంబీఏ|బిజినెస్'),
+        ('diploma', r'డిప్లొమా|పాలిటెక్నిక్'),
+        ('class12', r'12వ|తరగతి.{0,10}?12|ఇంటర్మీడియట్'),
+        ('class10', r'10వ|తరగతి.{0,10}?10|మెట్రిక్|సెకండరీ')
+    ],
+    'ta': [
+        ('btech', r'பி\.?டெக்|இன்ஜினியரிங்|தொழில்நுட்பம்'),
+        ('bsc', r'பி\.?எஸ்சி|அறிவியல்'),
+        ('bcom', r'பி\.?காம்|வணிகம்'),
+        ('ba', r'பி\.?ஏ|கலை'),
+        ('mtech', r'எம்\.?டெக்|தொழில்நுட்பம்'),
+        ('msc', r'எம்\.?எஸ்சி|அறிவியல்'),
+        ('mba', r'எம்பிஏ|பிசினஸ்'),
+        ('diploma', r'டிப்ளமோ|பாலிடெக்னிக்'),
+        ('class12', r'12ஆம்|வகுப்பு.{0,10}?12|உயர்நிலை'),
+        ('class10', r'10ஆம்|வகுப்பு.{0,10}?10|மெட்ரிக்|செகண்டரி')
+    ],
+    'bn': [
+        ('btech', r'বি\.?টেক|ইঞ্জিনিয়ারিং|প্রযুক্তি'),
+        ('bsc', r'বি\.?এসসি|বিজ্ঞান'),
+        ('bcom', r'বি\.?কম|বাণিজ্য'),
+        ('ba', r'বি\.?এ|কলা'),
+        ('mtech', r'এম\.?টেক|প্রযুক্তি'),
+        ('msc', r'এম\.?এসসি|বিজ্ঞান'),
+        ('mba', r'এমবিএ|ব্যবসা'),
+        ('diploma', r'ডিপ্লোমা|পলিটেকনিক'),
+        ('class12', r'12তম|শ্রেণী.{0,10}?12|উচ্চ মাধ্যমিক'),
+        ('class10', r'10ম|শ্রেণী.{0,10}?10|মাধ্যমিক')
+    ]
+}
+
+# Word boundaries that also work for Indic scripts: vowel signs and
+# viramas are not \w, so \b fails after e.g. "बी.ए" or "டெக்"
+_WORD_CHARS = r'\w\u0900-\u0DFF\u200c\u200d'
+_WORD_START = rf'(?<![{_WORD_CHARS}])'
+_WORD_END = rf'(?![{_WORD_CHARS}])'
+
+
+def _compile_education_bank(languages):
+    """
+    One named-group alternation over the patterns of the given languages.
+    Returns (pattern, {group name: (priority, language, degree)}).
+    """
+    alternatives = []
+    groups = {}
+    for language in languages:
+        for degree, pattern in EDUCATION_PATTERNS[language]:
+            name = f'{language}_{degree}'
+            if name in groups:
+                continue
+            groups[name] = (len(groups), language, degree)
+            alternatives.append(f'(?P<{name}>{_WORD_START}(?:{pattern}){_WORD_END})')
+    return re.compile('|'.join(alternatives), re.IGNORECASE), groups
+
+
+def compile_regex_banks():
+    """Compile the location, name, education and section heading banks (shared via the registry)"""
+    banks = {
+        bank: {
+            language: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for language, patterns in source.items()
+        }
+        for bank, source in (('location', LOCATION_PATTERNS), ('name', NAME_PATTERNS))
+    }
+    # Detected-language patterns first, then English (common in Indian resumes)
+    banks['education'] = {
+        language: _compile_education_bank((language, 'en'))
+        for language in EDUCATION_PATTERNS
+    }
+    banks['sections'] = compile_section_pattern()
+    return banks
+
+
+# Degree keys of EDUCATION_PATTERNS as the education options of the profile form
+EDUCATION_LABELS = {
+    'btech': 'B.Tech', 'bsc': 'B.Sc', 'bcom': 'B.Com', 'ba': 'B.A',
+    'mtech': 'M.Tech', 'msc': 'M.Sc', 'mba': 'MBA', 'diploma': 'Diploma',
+    'class12': '12th', 'class10': '10th'
+}
+
+# Bump whenever a change alters parse output, so cached results are dropped
+PARSER_VERSION = 3
+
+# spaCy NER: leading characters searched for a PERSON entity, and the
+# nlp.pipe settings of the bulk path (parse_many)
+NER_TEXT_CHARS = 500
+SPACY_BATCH_SIZE = int(os.getenv('SPACY_BATCH_SIZE', 64))
+SPACY_N_PROCESS = int(os.getenv('SPACY_N_PROCESS', 1))
+
+# Stages reported to the progress callback of ResumeParser.parse, in order
+PARSE_STAGES = (
+    'extracting_text', 'detecting_language', 'normalizing', 'extracting_fields', 'translating'
+)
+
+
+def _report(progress, stage):
+    if progress is not None:
+        progress(stage)
+
+
+def _parse_failure(error):
+    return {
+        "success": False,
+        "data": {},
+        "message": f"Error parsing resume: {str(error)}"
+    }
 
 
 class ResumeParser:
     def __init__(self):
-        # Initialize multilingual text processing
-        self.text_processor = IndicTextProcessor()
-        self.translation_service = TranslationService()
+        # Shared multilingual text processing, translation and regex banks
+        self.text_processor = registry.get('text_processor')
+        self.translation_service = registry.get('translation_service')
+        self.regex_banks = registry.get('resume_regex_banks')
         
-        # Load spaCy model if available
-        self.nlp = None
-        if SPACY_AVAILABLE: 
-            try:
-                self.nlp = spacy.load("en_core_web_sm")
-            except OSError:
-                print("WARNING: spaCy model 'en_core_web_sm' not found.")
-                print("    For better name extraction, install with: python -m spacy download en_core_web_sm")
-                self.nlp = None
-
-        # Multilingual skills dictionary (extendable)
-        self.skills_keywords = {
-            'en': [
-                'python', 'java', 'javascript', 'html', 'css', 'react', 'angular', 'vue',
-                'node.js', 'express', 'django', 'flask', 'spring', 'sql', 'mysql', 'postgresql',
-                'mongodb', 'git', 'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'linux',
-                'windows', 'photoshop', 'illustrator', 'figma', 'sketch', 'autocad', 'solidworks',
-                'excel', 'powerpoint', 'word', 'tableau', 'power bi', 'r', 'matlab', 'tensorflow',
-                'pytorch', 'machine learning', 'deep learning', 'data science', 'analytics',
-                'marketing', 'seo', 'content writing', 'social media', 'communication',
-                'leadership', 'project management', 'agile', 'scrum', 'teamwork', 'problem solving'
-            ],
-            'hi': [
-                'पायथन', 'जावा', 'प्रोग्रामिंग', 'कंप्यूटर', 'सॉफ्टवेयर', 'डेटा',
-                'मशीन लर्निंग', 'कृत्रिम बुद्धिमत्ता', 'वेब डेवलपमेंट', 'मोबाइल',
-                'डिजाइन', 'मार्केटिंग', 'बिक्री', 'प्रबंधन', 'नेतृत्व', 'संचार',
-                'टीमवर्क', 'समस्या समाधान', 'विश्लेषण', 'रिपोर्टिंग'
-            ],
-            'te': [
-                'ప్రోగ్రామింగ్', 'కంప్యూటర్', 'సాఫ్ట్‌వేర్', 'డేటా', 'వెబ్ డెవలప్‌మెంట్',
-                'మొబైల్', 'డిజైన్', 'మార్కెటింగ్', 'సేల్స్', 'మేనేజ్‌మెంట్',
-                'లీడర్‌షిప్', 'కమ్యూనికేషన్', 'టీమ్‌వర్క్', 'సమస్య పరిష్కారం'
-            ],
-            'ta': [
-                'நிரலாக்கம்', 'கணினி', 'மென்பொருள்', 'தரவு', 'வலை மேம்பாடு',
-                'மொபைல்', 'வடிவமைப்பு', 'சந்தைப்படுத்தல்', 'விற்பனை', 'மேலாண்மை',
-                'தலைமைத்துவம்', 'தகவல்தொடர்பு', 'குழு வேலை', 'சிக்கல் தீர்வு'
-            ],
-            'bn': [
-                'প্রোগ্রামিং', 'কম্পিউটার', 'সফটওয়্যার', 'ডাটা', 'ওয়েব ডেভেলপমেন্ট',
-                'মোবাইল', 'ডিজাইন', 'মার্কেটিং', 'সেলস', 'ম্যানেজমেন্ট',
-                'লিডারশিপ', 'কমিউনিকেশন', 'টিমওয়ার্ক', 'সমস্যা সমাধান'
-            ]
-        }
+        # Texts longer than this (characters) are parsed chunk by chunk
+        # through the streaming text pipeline
+        self.streaming_threshold = int(os.getenv('RESUME_STREAMING_THRESHOLD', 20000))
+        
+        # Skill keywords of all languages (data/skills/*.txt) in one automaton
+        self.skill_matcher = registry.get('skill_matcher')
 
-        # Education patterns (multilingual)
-        self.education_patterns = {
-            'en': [
-                r'b\.?tech|bachelor.*technology|engineering',
-                r'b\.?sc|bachelor.*science',
-                r'b\.?com|bachelor.*commerce',
-                r'b\.?a|bachelor.*arts',
-                r'm\.?tech|master.*technology',
-                r'm\.?sc|master.*science',
-                r'mba|master.*business',
-                r'diploma|polytechnic',
-                r'12th|class.*12|higher.*secondary|intermediate',
-                r'10th|class.*10|matriculation|secondary'
-            ],
-            'hi': [
-                r'बी\.?टेक|इंजीनियरिंग|तकनीकी',
-                r'बी\.?एससी|विज्ञान',
-                r'बी\.?कॉम|वाणिज्य',
-                r'बी\.?ए|कला',
-                r'एम\.?टेक|प्रौद्योगिकी',
-                r'एम\.?एससी|विज्ञान',
-                r'एमबीए|बिजनेस|व्यापार',
-                r'डिप्लोमा|पॉलिटेक्निक',
-                r'12वीं|कक्षा.*12|उच्च माध्यमिक|इंटरमीडिएट',
-                r'10वीं|कक्षा.*10|मैट्रिक|माध्यमिक'
-            ],
-            'te': [
-                r'బీ\.?టెక్|ఇంజనీరింగ్|టెక్నాలజీ',
-                r'బీ\.?ఎస్సీ|సైన్స్',
-                r'బీ\.?కామ్|కామర్స్',
-                r'బీ\.?ఏ|ఆర్ట్స్',
-                r'ఎం\.?టెక్|టెక్నాలజీ',
-                r'ఎం\.?ఎస్సీ|సైన్స్',
-                r'ఎంబీఏ|బిజినెస్',
-                r'డిప్లొమా|పాలిటెక్నిక్',
-                r'12వ|తరగతి.*12|ఇంటర్మీడియట్',
-                r'10వ|తరగతి.*10|మెట్రిక్|సెకండరీ'
-            ],
-            'ta': [
-                r'பி\.?டெக்|இன்ஜினியரிங்|தொழில்நுட்பம்',
-                r'பி\.?எஸ்சி|அறிவியல்',
-                r'பி\.?காம்|வணிகம்',
-                r'பி\.?ஏ|கலை',
-                r'எம்\.?டெக்|தொழில்நுட்பம்',
-                r'எம்\.?எஸ்சி|அறிவியல்',
-                r'எம்பிஏ|பிசினஸ்',
-                r'டிப்ளமோ|பாலிடெக்னிக்',
-                r'12ஆம்|வகுப்பு.*12|உயர்நிலை',
-                r'10ஆம்|வகுப்பு.*10|மெட்ரிக்|செகண்டரி'
-            ],
-            'bn': [
-                r'বি\.?টেক|ইঞ্জিনিয়ারিং|প্রযুক্তি',
-                r'বি\.?এসসি|বিজ্ঞান',
-                r'বি\.?কম|বাণিজ্য',
-                r'বি\.?এ|কলা',
-                r'এম\.?টেক|প্রযুক্তি',
-                r'এম\.?এসসি|বিজ্ঞান',
-                r'এমবিএ|ব্যবসা',
-                r'ডিপ্লোমা|পলিটেকনিক',
-                r'12তম|শ্রেণী.*12|উচ্চ মাধ্যমিক',
-                r'10ম|শ্রেণী.*10|মাধ্যমিক'
-            ]
-        }
+        # Results of earlier uploads, keyed on content hash + PARSER_VERSION
+        self.parse_cache = ParseCache(PARSER_VERSION)
 
         # Indian cities/states
         self.indian_locations = [
@@ -152,61 +243,326 @@ class ResumeParser:
             'meghalaya', 'nagaland', 'mizoram', 'arunachal pradesh', 'sikkim'
         ]
     
-    def parse(self, file):
-        """Main function to parse resume file with multilingual support"""
+    @property
+    def nlp(self):
+        """Shared NER-only spaCy pipeline, loaded on first use (None if unavailable)"""
+        return registry.get('spacy_nlp')
+    
+    def parse(self, file, education_details=False, progress=None):
+        """
+        Main function to parse resume file with multilingual support.
+        With education_details, every education mention is also returned
+        with its degree and span under "education_details". progress(stage)
+        is called as each of PARSE_STAGES starts.
+        An identical earlier upload is answered from the parse cache;
+        "cached" in the result tells which.
+        """
         try:
-            filename = file.filename.lower()
-            print(f"📄 Parsing file: {filename}")
-
-            # Extract text from file
-            if filename.endswith('.pdf'):
-                text = self._extract_text_from_pdf(file)
-            elif filename.endswith('.docx') or filename.endswith('.doc'):
-                text = self._extract_text_from_docx(file)
-            else:
-                file.seek(0)
-                text = file.read().decode('utf-8')
+            cache_key = None
+            if self.parse_cache.enabled:
+                cache_key = self.parse_cache.key(file, education_details=bool(education_details))
+                cached = self.parse_cache.get(cache_key)
+                if cached is not None:
+                    cached["cached"] = True
+                    return cached
+
+            _report(progress, 'extracting_text')
+            text = self._extract_text(file)
 
             print("\n🔍 Extracted text preview:\n", text[:500], "\n---")
 
             # Process with multilingual capabilities
-            parsed_data = self._parse_text_multilingual(text)
-            return {
+            parsed_data = self._parse_text_multilingual(text, education_details, progress)
+            result = {
                 "success": True, 
                 "data": parsed_data, 
                 "message": "Resume parsed successfully"
             }
+            if cache_key:
+                self.parse_cache.put(cache_key, result)
+            result["cached"] = False
+            return result
 
         except Exception as e:
-            return {
-                "success": False, 
-                "data": {}, 
-                "message": f"Error parsing resume: {str(e)}"
-            }
+            return _parse_failure(e)
+
+    def parse_many(self, files, education_details=False, progress=None):
+        """
+        Parse many resume files; returns one parse() result per file and,
+        like parse(), never raises.
+        Texts are grouped by detected language so cleaning, normalization
+        and spaCy NER run through the batch APIs with the per-language
+        setup done once per group. Uploads go through the parse cache as in
+        parse(). progress(stage) is called as each of PARSE_STAGES starts
+        for the batch; later stages repeat per language group or resume.
+        """
+        results = [None] * len(files)
+        cache_keys = [None] * len(files)
+        texts = []
+
+        _report(progress, 'extracting_text')
+        for position, file in enumerate(files):
+            try:
+                if self.parse_cache.enabled:
+                    cache_keys[position] = self.parse_cache.key(
+                        file, education_details=bool(education_details)
+                    )
+                    cached = self.parse_cache.get(cache_keys[position])
+                    if cached is not None:
+                        cached["cached"] = True
+                        results[position] = cached
+                        continue
+                texts.append((position, self._extract_text(file)))
+            except Exception as e:
+                results[position] = _parse_failure(e)
+
+        _report(progress, 'detecting_language')
+        by_language = {}
+        for position, text in texts:
+            try:
+                language = self.text_processor.detect_language(text)
+                if len(text) > self.streaming_threshold:
+                    # Long texts are parsed chunk by chunk on their own
+                    results[position] = self._parse_result(cache_keys[position], self._parse_text_streaming(
+                        text, language, education_details, progress
+                    ))
+                else:
+                    by_language.setdefault(language, []).append((position, text))
+            except Exception as e:
+                results[position] = _parse_failure(e)
+
+        for language, items in by_language.items():
+            try:
+                group_results = self._parse_group(items, language, cache_keys, education_details, progress)
+            except Exception as e:
+                # A batch step failed: parse the group one resume at a time so
+                # only the resume that causes it fails
+                print(f"WARNING: Batch parsing failed for {len(items)} '{language}' resume(s), "
+                      f"parsing them one by one: {e}")
+                group_results = []
+                for item in items:
+                    try:
+                        group_results.extend(self._parse_group(
+                            [item], language, cache_keys, education_details, progress
+                        ))
+                    except Exception as item_error:
+                        group_results.append(_parse_failure(item_error))
+            for (position, _), result in zip(items, group_results):
+                results[position] = result
+
+        return results
+
+    def _parse_group(self, items, language, cache_keys, education_details=False, progress=None):
+        """
+        Results for (position, text) items of one language. The batch steps
+        raise; field extraction failures become failure results.
+        """
+        _report(progress, 'normalizing')
+        group_texts = [text for _, text in items]
+        cleaned = self.text_processor.clean_many(group_texts, language)
+        normalized = self.text_processor.normalize_many(cleaned, language)
+
+        sections = self._split_sections(group_texts, language)
+
+        # Person names of the whole group in one batched spaCy pass
+        docs = self._ner_docs([
+            self._name_source(normalized_text, normalized_sections)
+            for normalized_text, (_, normalized_sections) in zip(normalized, sections)
+        ], language)
+
+        results = []
+        for (position, text), normalized_text, text_sections, doc in zip(
+            items, normalized, sections, docs
+        ):
+            try:
+                results.append(self._parse_result(cache_keys[position], self._extract_fields(
+                    normalized_text, language, education_details, progress,
+                    doc=doc, raw_text=text, sections=text_sections
+                )))
+            except Exception as e:
+                results.append(_parse_failure(e))
+        return results
+
+    def _parse_result(self, cache_key, parsed_data):
+        """Successful parse result of parse_many, added to the parse cache"""
+        result = {
+            "success": True,
+            "data": parsed_data,
+            "message": "Resume parsed successfully"
+        }
+        if cache_key:
+            self.parse_cache.put(cache_key, result)
+        result["cached"] = False
+        return result
+
+    def _extract_text(self, file):
+        """Extract raw text from an uploaded PDF, DOCX or text file"""
+        filename = file.filename.lower()
+        print(f"📄 Parsing file: {filename}")
+
+        if filename.endswith('.pdf'):
+            return self._extract_text_from_pdf(file)
+        elif filename.endswith('.docx') or filename.endswith('.doc'):
+            return self._extract_text_from_docx(file)
+        else:
+            file.seek(0)
+            return file.read().decode('utf-8')
     
-    def _parse_text_multilingual(self, text):
+    def _parse_text_multilingual(self, text, education_details=False, progress=None):
         """Parse extracted text with multilingual support"""
         
         # Detect the primary language of the text
+        _report(progress, 'detecting_language')
         detected_language = self.text_processor.detect_language(text)
         print(f"🌐 Detected language: {detected_language}")
         
+        if len(text) > self.streaming_threshold:
+            return self._parse_text_streaming(text, detected_language, education_details, progress)
+        
         # Clean and normalize the text
+        _report(progress, 'normalizing')
         cleaned_text = self.text_processor.clean_text(text, detected_language)
         normalized_text = self.text_processor.normalize_text(cleaned_text, detected_language)
+        sections = self._split_sections([text], detected_language)[0]
+        
+        return self._extract_fields(normalized_text, detected_language, education_details,
+                                    progress, raw_text=text, sections=sections)
+    
+    def _split_sections(self, texts, language):
+        """
+        Split raw texts at section headings. Returns one (raw, normalized)
+        pair of {section: text} dicts per text; all spans are cleaned and
+        normalized in one batch.
+        """
+        pattern = self.regex_banks['sections']
+        raw_sections = [split_sections(text, pattern) for text in texts]
+        keys = [(position, name) for position, found in enumerate(raw_sections) for name in found]
+        cleaned = self.text_processor.clean_many(
+            [raw_sections[position][name] for position, name in keys], language
+        )
+        normalized = self.text_processor.normalize_many(cleaned, language)
+        
+        normalized_sections = [{} for _ in texts]
+        for (position, name), span in zip(keys, normalized):
+            if span:
+                normalized_sections[position][name] = span
+        return list(zip(raw_sections, normalized_sections))
+    
+    def _parse_text_streaming(self, text, detected_language, education_details=False,
+                              progress=None):
+        """
+        Parse a long text chunk by chunk. The field extractors subscribe to
+        normalized chunks (email and phone to raw ones), so no full cleaned
+        or normalized copy is built. Sections are not split here.
+        """
+        fields = {
+            "name": None,
+            "email": "Not found",
+            "phone": "Not found",
+            "education": "Not specified",
+            "location": "Not specified"
+        }
+        skills = []
+        details = []
+        offset = 0
+        
+        def extract_from_chunk(chunk, language):
+            nonlocal offset
+            # The name is only looked for at the top of the document
+            if fields["name"] is None:
+                fields["name"] = self._extract_name_multilingual(chunk, language)
+            
+            # Otherwise keep the first hit of each field
+            if fields["education"] == "Not specified":
+                fields["education"] = self._extract_education_multilingual(chunk, language)
+            if fields["location"] == "Not specified":
+                fields["location"] = self._extract_location_multilingual(chunk, language)
+            skills.extend(self._extract_skills_multilingual(chunk, language))
+            if education_details:
+                # Spans are relative to the normalized chunks laid end to end
+                details.extend(self.extract_education_details(chunk, language, offset))
+                offset += len(chunk)
+        
+        def extract_contact(chunk, language):
+            # Cleaning drops '@' and '+', so these run on raw chunks
+            if fields["email"] == "Not found":
+                fields["email"] = self._extract_email(chunk)
+            if fields["phone"] == "Not found":
+                fields["phone"] = self._extract_phone(chunk)
+        
+        # Normalizing and field extraction are interleaved chunk by chunk
+        _report(progress, 'extracting_fields')
+        pipeline = TextPipeline(self.text_processor)
+        pipeline.on('chunk', extract_contact)
+        pipeline.on('normalized', extract_from_chunk)
+        pipeline.run(text, detected_language, until='normalized')
+        
+        if fields["name"] is None:
+            fields["name"] = "Not found"
+        parsed_data = {"detected_language": detected_language}
+        parsed_data.update(fields)
+        parsed_data["skills"] = list(dict.fromkeys(skills))[:15]
+        if education_details:
+            parsed_data["education_details"] = details
+        _report(progress, 'translating')
+        return self._add_translations(parsed_data, detected_language)
+    
+    def _extract_fields(self, normalized_text, detected_language, education_details=False,
+                        progress=None, doc=None, raw_text=None, sections=None):
+        """
+        Run the field extractors over cleaned, normalized text. With
+        sections (from _split_sections), each extractor looks at its own
+        section first and falls back to the full text.
+        """
+        _report(progress, 'extracting_fields')
+        raw_sections, normalized_sections = sections or ({}, {})
+        raw_text = raw_text if raw_text is not None else normalized_text
+        
+        # Contact details are read from raw text: cleaning drops '@' and '+'
+        contact_text = '\n'.join(
+            raw_sections[name] for name in ('header', 'contact') if name in raw_sections
+        )
+        phone = self._extract_phone(contact_text) if contact_text else "Not found"
+        if phone == "Not found":
+            phone = self._extract_phone(raw_text)
+        
+        education = "Not specified"
+        if 'education' in normalized_sections:
+            education = self._extract_education_multilingual(
+                normalized_sections['education'], detected_language
+            )
+        if education == "Not specified":
+            education = self._extract_education_multilingual(normalized_text, detected_language)
+        
+        skills = []
+        if 'skills' in normalized_sections:
+            skills = self._extract_skills_multilingual(normalized_sections['skills'], detected_language)
+        if not skills:
+            skills = self._extract_skills_multilingual(normalized_text, detected_language)
         
-        # Parse different sections
         parsed_data = {
             "detected_language": detected_language,
-            "name": self._extract_name_multilingual(normalized_text, detected_language),
-            "email": self._extract_email(normalized_text),
-            "phone": self._extract_phone(normalized_text),
-            "education": self._extract_education_multilingual(normalized_text, detected_language),
-            "location": self._extract_location_multilingual(normalized_text, detected_language),
-            "skills": self._extract_skills_multilingual(normalized_text, detected_language)
+            "name": self._extract_name_multilingual(
+                self._name_source(normalized_text, normalized_sections), detected_language, doc
+            ),
+            "email": self._extract_email(raw_text),
+            "phone": phone,
+            "education": education,
+            "location": self._extract_location_from_sections(
+                normalized_text, normalized_sections, detected_language
+            ),
+            "skills": skills
         }
+        if education_details:
+            parsed_data["education_details"] = self.extract_education_details(
+                normalized_text, detected_language
+            )
         
-        # If the resume is not in English, also provide English translations
+        _report(progress, 'translating')
+        return self._add_translations(parsed_data, detected_language)
+    
+    def _add_translations(self, parsed_data, detected_language):
+        """If the resume is not in English, also provide English translations"""
         if detected_language != 'en':
             parsed_data["translations"] = {
                 "education_en": self.translation_service.translate(
@@ -220,54 +576,96 @@ class ResumeParser:
         return parsed_data
     
     def _extract_skills_multilingual(self, text, language):
-        """Extract skills with multilingual support"""
-        found_skills = []
-        text_lower = text.lower()
-        
-        # Check skills in detected language
-        if language in self.skills_keywords:
-            for skill in self.skills_keywords[language]:
-                if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text_lower):
-                    found_skills.append(skill.title())
-        
-        # Also check English skills (common in all resumes)
-        for skill in self.skills_keywords['en']:
-            if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text_lower):
-                found_skills.append(skill.title())
-        
-        # Remove duplicates while preserving order
-        unique_skills = list(dict.fromkeys(found_skills))
-        return unique_skills[:15]  # Limit to top 15 skills
+        """Extract skills with multilingual support (single pass over the text)"""
+        # Keywords of every language are matched, so English skills in an
+        # Indic resume (and code-mixed text) are found too
+        return self.skill_matcher.find_skills(text, limit=15)  # Limit to top 15 skills
+    
+    def _education_matches(self, text, language):
+        """Yield (priority, language, degree, match) in one scan of the text"""
+        bank = self.regex_banks['education']
+        pattern, groups = bank.get(language, bank['en'])
+        for match in pattern.finditer(text):
+            priority, match_language, degree = groups[match.lastgroup]
+            yield priority, match_language, degree, match
+    
+    def _education_context(self, text, match):
+        start = max(0, match.start() - 50)
+        end = min(len(text), match.end() + 50)
+        return ' '.join(text[start:end].split())[:150]
+    
+    def _best_education_match(self, text, language):
+        """(priority, degree, match) of the highest-priority education mention, or None"""
+        best = None
+        for priority, _, degree, match in self._education_matches(text, language):
+            if best is None or priority < best[0]:
+                best = (priority, degree, match)
+                # Nothing outranks the first pattern of the bank
+                if priority == 0:
+                    break
+        return best
     
     def _extract_education_multilingual(self, text, language):
         """Extract education with multilingual pattern matching"""
-        educations = []
-        text_lower = text.lower()
-        
-        # Check patterns in detected language
-        if language in self.education_patterns:
-            for pattern in self.education_patterns[language]:
-                matches = re.finditer(pattern, text_lower, re.IGNORECASE)
-                for match in matches:
-                    start = max(0, match.start() - 50)
-                    end = min(len(text), match.end() + 50)
-                    context = text[start:end].strip()
-                    education_info = ' '.join(context.split())
-                    if education_info and education_info not in educations:
-                        educations.append(education_info[:150])
+        best = self._best_education_match(text, language)
+        if best is None:
+            return "Not specified"
+        return self._education_context(text, best[2]) or "Not specified"
+    
+    def education_level(self, text, language):
+        """Profile form label (EDUCATION_LABELS) of the highest degree in text, or ''"""
+        best = self._best_education_match(text, language)
+        return EDUCATION_LABELS[best[1]] if best else ''
+    
+    def extract_education_details(self, text, language, offset=0):
+        """
+        All education mentions with their degree and span in the text, in
+        text order. offset is added to the spans (for chunked text).
+        """
+        details = []
+        seen = set()
+        for _, match_language, degree, match in self._education_matches(text, language):
+            # Repeated mentions of the same degree are reported once
+            key = (degree, match.group().lower())
+            if key in seen:
+                continue
+            seen.add(key)
+            context = self._education_context(text, match)
+            details.append({
+                "degree": degree,
+                "language": match_language,
+                "text": match.group(),
+                "start": match.start() + offset,
+                "end": match.end() + offset,
+                "context": context
+            })
+        return details
+    
+    def _name_source(self, normalized_text, normalized_sections):
+        """Text the name is looked for in: the name section, else the header"""
+        return normalized_sections.get('name') or normalized_sections.get('header') or normalized_text
+    
+    def _extract_location_from_sections(self, normalized_text, normalized_sections, language):
+        """
+        Location from the address section (a known place, a label or an
+        address-shaped line), then a known city or state in the contact
+        details or header, then the full text
+        """
+        address = normalized_sections.get('address', '').strip()
+        if address:
+            location = self._extract_location_multilingual(address, language)
+            if location != "Not specified":
+                return location
+            if ADDRESS_SHAPE_RE.match(address):
+                return address[:60]
         
-        # Also check English patterns (common in Indian resumes)
-        for pattern in self.education_patterns['en']:
-            matches = re.finditer(pattern, text_lower, re.IGNORECASE)
-            for match in matches:
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 50)
-                context = text[start:end].strip()
-                education_info = ' '.join(context.split())
-                if education_info and education_info not in educations:
-                    educations.append(education_info[:150])
+        for name in ('contact', 'header'):
+            text_lower = normalized_sections.get(name, '').lower()
+            for location in self.indian_locations:
+                if location in text_lower:
+                    return location.title()
         
-        return educations[0] if educations else "Not specified"
+        return self._extract_location_multilingual(normalized_text, language)
     
     def _extract_location_multilingual(self, text, language):
         """Extract location with multilingual support"""
@@ -278,81 +676,56 @@ class ResumeParser:
             if location in text_lower:
                 return location.title()
         
-        # Location patterns in different languages
-        location_patterns = {
-            'en': [
-                r'address[:\s]*([^\n]+)',
-                r'location[:\s]*([^\n]+)',
-                r'city[:\s]*([^\n]+)',
-                r'state[:\s]*([^\n]+)',
-                r'residence[:\s]*([^\n]+)'
-            ],
-            'hi': [
-                r'पता[:\s]*([^\n]+)',
-                r'स्थान[:\s]*([^\n]+)',
-                r'शहर[:\s]*([^\n]+)',
-                r'राज्य[:\s]*([^\n]+)',
-                r'निवास[:\s]*([^\n]+)'
-            ],
-            'te': [
-                r'చిరునామా[:\s]*([^\n]+)',
-                r'స్థానం[:\s]*([^\n]+)',
-                r'పట్టణం[:\s]*([^\n]+)',
-                r'రాష్ట్రం[:\s]*([^\n]+)'
-            ],
-            'ta': [
-                r'முகவரி[:\s]*([^\n]+)',
-                r'இடம்[:\s]*([^\n]+)',
-                r'நகரம்[:\s]*([^\n]+)',
-                r'மாநிலம்[:\s]*([^\n]+)'
-            ],
-            'bn': [
-                r'ঠিকানা[:\s]*([^\n]+)',
-                r'স্থান[:\s]*([^\n]+)',
-                r'শহর[:\s]*([^\n]+)',
-                r'রাজ্য[:\s]*([^\n]+)'
-            ]
-        }
+        location_patterns = self.regex_banks['location']
         
         # Check patterns in the detected language first
         if language in location_patterns:
             for pattern in location_patterns[language]:
-                match = re.search(pattern, text, re.IGNORECASE)
+                match = pattern.search(text)
                 if match:
                     return match.group(1).strip()[:60]
         
         # Fallback to English patterns
         for pattern in location_patterns['en']:
-            match = re.search(pattern, text_lower, re.IGNORECASE)
+            match = pattern.search(text_lower)
             if match:
                 return match.group(1).strip()[:60]
         
         return "Not specified"
     
-    def _extract_name_multilingual(self, text, language):
-        """Extract name with multilingual support"""
+    def _ner_docs(self, texts, language):
+        """
+        spaCy docs of the leading NER_TEXT_CHARS of each text through one
+        nlp.pipe pass; a list of None when NER does not apply
+        """
+        nlp = self.nlp
+        if not nlp or language != 'en' or not texts:
+            return [None] * len(texts)
+        # Daemonic processes (bulk_parse workers) cannot start spaCy's own
+        n_process = 1 if multiprocessing.current_process().daemon else SPACY_N_PROCESS
+        return list(nlp.pipe(
+            (text[:NER_TEXT_CHARS] for text in texts),
+            batch_size=SPACY_BATCH_SIZE, n_process=n_process
+        ))
+    
+    def _extract_name_multilingual(self, text, language, doc=None):
+        """Extract name with multilingual support; doc is a precomputed spaCy doc"""
         
         # First try spaCy if available (works best for English)
-        if self.nlp and language == 'en':
-            doc = self.nlp(text[:500])
+        if language == 'en' and (doc is not None or self.nlp):
+            if doc is None:
+                doc = self.nlp(text[:NER_TEXT_CHARS])
             for entity in doc.ents:
                 if entity.label_ == "PERSON":
                     return entity.text
         
-        # Multilingual name patterns
-        name_patterns = {
-            'en': [r'^([A-Z][a-z]+ [A-Z][a-z]+)', r'name[:\s]*([A-Z][a-z]+ [A-Z][a-z]+)'],
-            'hi': [r'^नाम[:\s]*([^न\n]+)', r'^([अ-ह]+ [अ-ह]+)'],
-            'te': [r'^పేరు[:\s]*([^న\n]+)', r'^([అ-హ]+ [అ-హ]+)'],
-            'ta': [r'^பெயர்[:\s]*([^ந\n]+)', r'^([அ-ஹ]+ [அ-ஹ]+)'],
-            'bn': [r'^নাম[:\s]*([^ন\n]+)', r'^([অ-হ]+ [অ-হ]+)']
-        }
+        name_patterns = self.regex_banks['name']
         
         # Try language-specific patterns first
         if language in name_patterns:
             for pattern in name_patterns[language]:
                 for line in text.split("\n")[:8]:
-                    match = re.search(pattern, line.strip(), re.IGNORECASE)
+                    match = pattern.search(line.strip())
                     if match:
                         return match.group(1).strip()
         
@@ -369,37 +742,41 @@ class ResumeParser:
 
 
     def _extract_text_from_pdf(self, file):
-        """Extract text from PDF with OCR fallback"""
+        """Extract text from PDF, OCRing only the pages without a usable text layer"""
         try:
-            file.seek(0)
-            pdf_reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in pdf_reader.pages:
-                extracted = page.extract_text()
-                if extracted:
-                    text += extracted + "\n"
-
-            # OCR fallback if no text (only if OCR is available)
-            if not text.strip() and OCR_AVAILABLE:
-                print("WARNING: No text found, using OCR fallback...")
-                file.seek(0)
-                images = convert_from_bytes(file.read())
-                for img in images:
-                    text += pytesseract.image_to_string(img) + "\n"
-            elif not text.strip():
-                print("WARNING: No text found in PDF and OCR not available.")
-
-            return text
+            # Spool to disk: PyPDF2 reads pages on demand and OCR workers
+            # rasterize single pages from the file instead of copied bytes
+            with spooled_upload(file) as pdf_path, open(pdf_path, 'rb') as pdf_file:
+                pdf_reader = PyPDF2.PdfReader(pdf_file)
+                page_count = len(pdf_reader.pages)
+                if page_count > PDF_MAX_PAGES:
+                    raise ValueError(f"PDF has {page_count} pages; the limit is {PDF_MAX_PAGES}")
+                page_texts = [page.extract_text() or "" for page in pdf_reader.pages]
+
+                # Per-page OCR fallback (only if OCR is available)
+                scanned_pages = [
+                    number for number, page_text in enumerate(page_texts, start=1)
+                    if needs_ocr(page_text)
+                ]
+                if scanned_pages and OCR_AVAILABLE:
+                    if len(scanned_pages) > OCR_MAX_PAGES:
+                        print(f"WARNING: OCR limited to {OCR_MAX_PAGES} of {len(scanned_pages)} pages without text.")
+                        scanned_pages = scanned_pages[:OCR_MAX_PAGES]
+                    print(f"WARNING: No text layer on page(s) {scanned_pages}, using OCR fallback...")
+                    for number, ocr_text in ocr_pages(pdf_path, scanned_pages).items():
+                        page_texts[number - 1] = ocr_text
+                elif scanned_pages and not any(text.strip() for text in page_texts):
+                    print("WARNING: No text found in PDF and OCR not available.")
+
+            return "".join(page_text + "\n" for page_text in page_texts if page_text)
         except Exception as e:
             raise Exception(f"Error reading PDF: {str(e)}")
 
     def _extract_text_from_docx(self, file):
-        """Extract text from DOCX"""
+        """Extract text from DOCX: headers, paragraphs, tables, text boxes and footers"""
         try:
             file.seek(0)
-            doc = docx.Document(file)
-            text = "\n".join([p.text for p in doc.paragraphs])
-            return text
+            return extract_docx_text(file)
         except Exception as e:
             raise Exception(f"Error reading DOCX: {str(e)}")
     
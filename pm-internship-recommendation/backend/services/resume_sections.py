@@ -0,0 +1,150 @@
+"""
+Resume section segmentation
+
+Splits raw resume text into sections at multilingual headings (Education /
+शिक्षा, Skills / कौशल, Address / पता, ...) in one regex pass, so each field
+extractor can look only at its relevant span instead of the whole resume.
+
+A heading is a known heading phrase at the start of a line, optionally
+after a bullet, followed by the end of the line or a separator (":", tab
+or a visarga-like sign) with the section content after it. Multi-word
+phrases may also be followed by "-", "–" or "|"; single words may not, so
+"State-level chess champion" or "Phone - call me" is body text. So
+"Skills: Python, SQL", "EDUCATION", "Work Experience - ..." and the table
+row "Address<TAB>Delhi" are headings, but "Education loans are..." is not.
+Text before the first heading is the "header" section (usually name and
+contact details).
+
+Runs on raw extracted text: cleaning collapses the line breaks headings
+are recognised by.
+"""
+
+import re
+
+# Heading phrases per section and language. Sections without a field
+# extractor ("other") are still listed so they end the section before them.
+SECTION_HEADINGS = {
+    'name': {
+        'en': ['name', 'full name'],
+        'hi': ['नाम', 'पूरा नाम'],
+        'te': ['పేరు'],
+        'ta': ['பெயர்'],
+        'bn': ['নাম'],
+    },
+    'contact': {
+        'en': ['contact', 'contact details', 'contact information', 'personal details',
+               'personal information', 'email', 'e-mail', 'phone', 'mobile'],
+        'hi': ['संपर्क', 'संपर्क विवरण', 'व्यक्तिगत विवरण', 'ईमेल', 'फ़ोन', 'फोन', 'मोबाइल'],
+        'te': ['సంప్రదింపు వివరాలు', 'వ్యక్తిగత వివరాలు', 'ఫోన్', 'ఇమెయిల్'],
+        'ta': ['தொடர்பு', 'தொடர்பு விவரங்கள்', 'தனிப்பட்ட விவரங்கள்', 'தொலைபேசி', 'மின்னஞ்சல்'],
+        'bn': ['যোগাযোগ', 'ব্যক্তিগত তথ্য', 'ফোন', 'ইমেল'],
+    },
+    'address': {
+        'en': ['address', 'permanent address', 'current address', 'location', 'residence',
+               'city', 'state'],
+        'hi': ['पता', 'स्थायी पता', 'वर्तमान पता', 'स्थान', 'निवास', 'शहर', 'राज्य'],
+        'te': ['చిరునామా', 'స్థానం', 'పట్టణం', 'రాష్ట్రం'],
+        'ta': ['முகவரி', 'இடம்', 'நகரம்', 'மாநிலம்'],
+        'bn': ['ঠিকানা', 'স্থান', 'শহর', 'রাজ্য'],
+    },
+    'education': {
+        'en': ['education', 'educational qualifications', 'educational qualification',
+               'educational background', 'academic background', 'academic qualifications',
+               'academics', 'qualifications', 'qualification'],
+        'hi': ['शिक्षा', 'शैक्षिक योग्यता', 'शैक्षणिक योग्यता', 'योग्यता'],
+        'te': ['విద్య', 'విద్యార్హతలు', 'విద్యా అర్హతలు'],
+        'ta': ['கல்வி', 'கல்வித் தகுதி', 'கல்வி தகுதிகள்'],
+        'bn': ['শিক্ষা', 'শিক্ষাগত যোগ্যতা'],
+    },
+    'skills': {
+        'en': ['skills', 'technical skills', 'key skills', 'core competencies', 'competencies',
+               'expertise', 'skill set'],
+        'hi': ['कौशल', 'तकनीकी कौशल', 'मुख्य कौशल'],
+        'te': ['నైపుణ్యాలు', 'సాంకేతిక నైపుణ్యాలు'],
+        'ta': ['திறன்கள்', 'தொழில்நுட்ப திறன்கள்'],
+        'bn': ['দক্ষতা', 'কারিগরি দক্ষতা'],
+    },
+    'experience': {
+        'en': ['experience', 'work experience', 'professional experience', 'employment',
+               'employment history', 'internships', 'internship'],
+        'hi': ['अनुभव', 'कार्य अनुभव', 'इंटर्नशिप'],
+        'te': ['అనుభవం', 'పని అనుభవం'],
+        'ta': ['அனுபவம்', 'பணி அனுபவம்'],
+        'bn': ['অভিজ্ঞতা', 'কাজের অভিজ্ঞতা'],
+    },
+    'projects': {
+        'en': ['projects', 'academic projects', 'personal projects'],
+        'hi': ['परियोजनाएं', 'परियोजनाएँ', 'प्रोजेक्ट'],
+        'te': ['ప్రాజెక్టులు'],
+        'ta': ['திட்டங்கள்'],
+        'bn': ['প্রকল্প'],
+    },
+    'other': {
+        'en': ['objective', 'career objective', 'summary', 'profile', 'profile summary',
+               'certifications', 'certificates', 'achievements', 'awards', 'hobbies',
+               'interests', 'languages', 'languages known', 'declaration', 'references',
+               'extracurricular activities'],
+        'hi': ['उद्देश्य', 'प्रमाणपत्र', 'उपलब्धियां', 'उपलब्धियाँ', 'रुचियां', 'रुचियाँ', 'शौक',
+               'भाषाएं', 'भाषाएँ', 'घोषणा'],
+        'te': ['లక్ష్యం', 'ధృవపత్రాలు', 'విజయాలు', 'అభిరుచులు', 'భాషలు'],
+        'ta': ['நோக்கம்', 'சான்றிதழ்கள்', 'சாதனைகள்', 'பொழுதுபோக்குகள்', 'மொழிகள்'],
+        'bn': ['উদ্দেশ্য', 'সার্টিফিকেট', 'অর্জন', 'শখ', 'ভাষা'],
+    },
+}
+
+# Bullets that may precede a heading, and separators that may follow it
+# (colon, visarga-like signs of Devanagari, Bengali, Tamil and Telugu).
+# Dashes and bars only end multi-word headings: after a single word they
+# usually join it to body text ("State-level", "City - wise")
+_BULLETS = r'(?:[•●▪■*#>\-]+[ \t]*)?'
+_SEPARATOR = r'(?:[ \t]*[:ःঃஃః][ \t]*|\t[ \t]*|[ \t]*$)'
+_PHRASE_SEPARATOR = r'(?:[ \t]*[:ःঃஃః|\-–][ \t]*|\t[ \t]*|[ \t]*$)'
+
+
+def compile_section_pattern():
+    """
+    One alternation over all headings, separators included. Returns (regex,
+    {group name: section}); each match's lastgroup gives the section,
+    match.end() the content start.
+    """
+    alternatives = []
+    sections = {}
+    for section, by_language in SECTION_HEADINGS.items():
+        phrases = {phrase for phrases in by_language.values() for phrase in phrases}
+        # Longest first, so "technical skills" is preferred over "skills"
+        ordered = sorted(phrases, key=len, reverse=True)
+        multi_word = '|'.join(
+            re.escape(phrase).replace(r'\ ', r'[ \t]+') for phrase in ordered if ' ' in phrase
+        )
+        single_word = '|'.join(re.escape(phrase) for phrase in ordered if ' ' not in phrase)
+        body = '|'.join(
+            f'(?:{phrases}){separator}'
+            for phrases, separator in ((multi_word, _PHRASE_SEPARATOR), (single_word, _SEPARATOR))
+            if phrases
+        )
+        group = f'section_{len(sections)}'
+        sections[group] = section
+        alternatives.append(f'(?P<{group}>{body})')
+    pattern = r'^[ \t]*' + _BULLETS + '(?:' + '|'.join(alternatives) + ')'
+    return re.compile(pattern, re.IGNORECASE | re.MULTILINE), sections
+
+
+def split_sections(text, section_pattern):
+    """
+    {section: text} for the sections found in raw text, plus "header" for
+    the text before the first heading. Repeated sections are joined.
+    """
+    regex, groups = section_pattern
+    spans = []
+    name, start = 'header', 0
+    for match in regex.finditer(text):
+        spans.append((name, start, match.start()))
+        name, start = groups[match.lastgroup], match.end()
+    spans.append((name, start, len(text)))
+
+    sections = {}
+    for section, start, end in spans:
+        content = text[start:end].strip()
+        if content:
+            sections.setdefault(section, []).append(content)
+    return {section: '\n'.join(parts) for section, parts in sections.items()}
@@ -0,0 +1,118 @@
+"""
+Single-pass script detection shared by all services
+
+Text is classified with one pass over its characters (collections.Counter,
+which runs in C) and a precomputed character -> script table, so the cost is
+one dictionary lookup per *distinct* character rather than one range check
+per character per script. Pure-ASCII text short-circuits via str.isascii().
+
+Results for short strings (field values such as sectors, cities and skills
+that repeat across requests) are memoized.
+"""
+
+from collections import Counter
+from functools import lru_cache
+
+# Brahmic Unicode blocks, each 128 code points wide
+INDIC_SCRIPT_BLOCKS = (
+    ('DEVANAGARI', 0x0900, 0x097F),
+    ('BENGALI', 0x0980, 0x09FF),
+    ('GURMUKHI', 0x0A00, 0x0A7F),
+    ('GUJARATI', 0x0A80, 0x0AFF),
+    ('ORIYA', 0x0B00, 0x0B7F),
+    ('TAMIL', 0x0B80, 0x0BFF),
+    ('TELUGU', 0x0C00, 0x0C7F),
+    ('KANNADA', 0x0C80, 0x0CFF),
+    ('MALAYALAM', 0x0D00, 0x0D7F),
+)
+
+SCRIPT_TO_LANG = {
+    'DEVANAGARI': 'hi',
+    'BENGALI': 'bn',
+    'GURMUKHI': 'pa',
+    'GUJARATI': 'gu',
+    'ORIYA': 'or',
+    'TAMIL': 'ta',
+    'TELUGU': 'te',
+    'KANNADA': 'kn',
+    'MALAYALAM': 'ml',
+    'LATIN': 'en'
+}
+
+# Strings longer than this are classified without being memoized
+MEMO_MAX_LENGTH = 256
+
+
+def _build_script_table():
+    """Map every classifiable character to its script name"""
+    table = {}
+    for script, start, end in INDIC_SCRIPT_BLOCKS:
+        for codepoint in range(start, end + 1):
+            table[chr(codepoint)] = script
+    # Latin letters: ASCII plus Latin-1 Supplement and Latin Extended-A/B
+    for codepoint in range(0x0041, 0x0250):
+        char = chr(codepoint)
+        if char.isalpha():
+            table[char] = 'LATIN'
+    return table
+
+
+_SCRIPT_TABLE = _build_script_table()
+_INDIC_SCRIPTS = frozenset(script for script, _, _ in INDIC_SCRIPT_BLOCKS)
+
+
+def _classify(text):
+    """Return ((script, count), ...) sorted by count, most frequent first"""
+    if text.isascii():
+        # Fast path: no Indic characters possible, skip per-character work
+        return (('LATIN', len(text)),)
+
+    script_counts = {}
+    for char, count in Counter(text).items():
+        script = _SCRIPT_TABLE.get(char)
+        if script:
+            script_counts[script] = script_counts.get(script, 0) + count
+    return tuple(sorted(script_counts.items(), key=lambda item: item[1], reverse=True))
+
+
+_classify_memo = lru_cache(maxsize=4096)(_classify)
+
+
+def script_counts(text):
+    """Return ((script, count), ...) for the text, most frequent first"""
+    if not text:
+        return ()
+    if len(text) <= MEMO_MAX_LENGTH:
+        return _classify_memo(text)
+    return _classify(text)
+
+
+def script_proportions(text):
+    """
+    Return the share of each script among the text's letters, e.g.
+    {'DEVANAGARI': 0.75, 'LATIN': 0.25} for code-mixed input.
+    In mixed-script text digits, punctuation and whitespace are not counted.
+    """
+    counts = script_counts(text)
+    total = sum(count for _, count in counts)
+    if not total:
+        return {}
+    return {script: count / total for script, count in counts}
+
+
+def dominant_script(text):
+    """
+    Return the most frequent Indic script in the text, or 'LATIN' if none.
+    Indic scripts take precedence over Latin so that regional text with
+    embedded English terms is still treated as regional.
+    """
+    for script, _ in script_counts(text):
+        if script in _INDIC_SCRIPTS:
+            return script
+    return 'LATIN'
+
+
+def detect_language(text, script_to_lang=None):
+    """Map the dominant script to a language code ('en' when unknown)"""
+    mapping = script_to_lang or SCRIPT_TO_LANG
+    return mapping.get(dominant_script(text), 'en')
@@ -0,0 +1,144 @@
+"""
+Aho–Corasick multi-pattern skill matcher
+
+All skill keywords of all languages are compiled into one automaton, so every
+skill in a document is found in a single pass over the text regardless of
+dictionary size. Keywords are loaded from data/skills/<language>.txt (one
+skill per line, '#' starts a comment), or from SKILLS_DATA_DIR.
+
+A match only counts on word boundaries. Word characters are letters, digits,
+'_' and combining marks (Indic vowel signs, viramas), so a keyword never
+matches inside a longer word in any script.
+
+Zero-width (non-)joiners only change how a word is rendered, and text
+cleaning drops them, so they are removed from keywords and text alike.
+"""
+
+import os
+import unicodedata
+
+DEFAULT_SKILLS_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'skills')
+
+# Deletes zero-width non-joiners / joiners
+_STRIP_JOINERS = str.maketrans('', '', '\u200c\u200d')
+
+
+def _match_form(text):
+    return text.lower().translate(_STRIP_JOINERS)
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_' or unicodedata.category(char).startswith('M')
+
+
+def load_skill_dictionary(directory=None):
+    """Read {language: [skill, ...]} from <language>.txt files"""
+    directory = directory or os.getenv('SKILLS_DATA_DIR') or DEFAULT_SKILLS_DIR
+    skills_by_language = {}
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith('.txt'):
+            continue
+        language = filename[:-len('.txt')]
+        with open(os.path.join(directory, filename), encoding='utf-8') as skills_file:
+            skills = []
+            for line in skills_file:
+                skill = line.split('#', 1)[0].strip()
+                if skill:
+                    skills.append(skill)
+        skills_by_language[language] = skills
+    return skills_by_language
+
+
+class SkillMatcher:
+    """
+    Single-pass matcher over the skill keywords of all languages
+    """
+
+    def __init__(self, skills_by_language):
+        self.skills_by_language = skills_by_language
+        self.patterns = []  # (keyword in match form, display name, language)
+
+        # Trie: per-state transitions, failure links, the state's own
+        # pattern ids and a link to the nearest failure state with output
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        self._output_link = [0]
+
+        seen = set()
+        for language, skills in skills_by_language.items():
+            for skill in skills:
+                keyword = _match_form(skill)
+                if not keyword or keyword in seen:
+                    continue
+                seen.add(keyword)
+                self._add(keyword, len(self.patterns))
+                self.patterns.append((keyword, skill.title(), language))
+        self._build_links()
+
+    def _add(self, keyword, pattern_id):
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._output_link.append(0)
+            state = next_state
+        self._output[state].append(pattern_id)
+
+    def _build_links(self):
+        # Breadth-first, so failure targets are finished before their users
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                failed = self._fail[next_state]
+                self._output_link[next_state] = failed if self._output[failed] else self._output_link[failed]
+
+    def finditer(self, text):
+        """Yield (start, end, pattern_id) for every keyword occurrence in text in match form"""
+        goto, fail = self._goto, self._fail
+        output, output_link = self._output, self._output_link
+        patterns = self.patterns
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            match_state = state if output[state] else output_link[state]
+            while match_state:
+                for pattern_id in output[match_state]:
+                    end = position + 1
+                    yield end - len(patterns[pattern_id][0]), end, pattern_id
+                match_state = output_link[match_state]
+
+    def find_skills(self, text, limit=None):
+        """Display names of skills found on word boundaries, in order of first appearance"""
+        text_lower = _match_form(text)
+        length = len(text_lower)
+        found = {}
+        for start, end, pattern_id in self.finditer(text_lower):
+            if pattern_id in found:
+                continue
+            if start > 0 and _is_word_char(text_lower[start - 1]):
+                continue
+            if end < length and _is_word_char(text_lower[end]):
+                continue
+            found[pattern_id] = start
+
+        ordered = sorted(found, key=found.get)
+        skills = list(dict.fromkeys(self.patterns[pattern_id][1] for pattern_id in ordered))
+        return skills[:limit] if limit else skills
+
+    def __len__(self):
+        return len(self.patterns)
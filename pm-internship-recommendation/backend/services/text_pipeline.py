@@ -0,0 +1,158 @@
+"""
+Streaming text pipeline for large documents
+
+Text flows through clean -> normalize -> sentence split -> tokenize as a
+chain of generators over fixed-size chunks, so only about one chunk of each
+stage exists at a time instead of full copies of the whole document.
+
+Consumers subscribe to a stage with `on(stage, callback)`; the callback is
+called as callback(item, language) for every item the stage produces:
+    chunk       raw text chunk
+    cleaned     cleaned chunk
+    normalized  normalized chunk
+    sentence    one sentence (sentences crossing a chunk boundary are rejoined)
+    tokens      word list of one sentence
+
+Configuration (environment variable, overridable via constructor):
+    TEXT_PIPELINE_CHUNK_SIZE   characters per chunk (4096)
+"""
+
+import os
+import re
+
+STAGES = ('chunk', 'cleaned', 'normalized', 'sentence', 'tokens')
+
+_SENTENCE_END_RE = re.compile(r'[।.!?]\s*$')
+
+
+def _cut_position(buffer, chunk_size):
+    """Cut at the last line break, else the last whitespace, before chunk_size"""
+    cut = buffer.rfind('\n', 0, chunk_size)
+    if cut <= 0:
+        cut = max(buffer.rfind(' ', 0, chunk_size), buffer.rfind('\t', 0, chunk_size))
+    return cut + 1 if cut > 0 else chunk_size
+
+
+def iter_chunks(source, chunk_size):
+    """
+    Split text into chunks of at most about chunk_size characters without
+    cutting words. source is a string or an iterable of strings (lines, pages).
+    """
+    pieces = source
+    if isinstance(source, str):
+        pieces = (source[i:i + chunk_size] for i in range(0, len(source), chunk_size))
+
+    buffer = ''
+    for piece in pieces:
+        buffer += piece
+        while len(buffer) >= chunk_size:
+            cut = _cut_position(buffer, chunk_size)
+            yield buffer[:cut]
+            buffer = buffer[cut:]
+    if buffer:
+        yield buffer
+
+
+class TextPipeline:
+    """
+    Chunked clean/normalize/split/tokenize chain with per-stage hooks
+    """
+
+    def __init__(self, text_processor, chunk_size=None):
+        self.text_processor = text_processor
+        self.chunk_size = chunk_size or int(os.getenv('TEXT_PIPELINE_CHUNK_SIZE', 4096))
+        self._hooks = {stage: [] for stage in STAGES}
+
+    def on(self, stage, callback):
+        """Subscribe callback(item, language) to a stage"""
+        if stage not in self._hooks:
+            raise ValueError(f"Unknown pipeline stage '{stage}', expected one of {STAGES}")
+        self._hooks[stage].append(callback)
+        return self
+
+    def _emit(self, stage, items, language):
+        hooks = self._hooks[stage]
+        for item in items:
+            for hook in hooks:
+                hook(item, language)
+            yield item
+
+    def _clean(self, chunks, language):
+        for chunk in chunks:
+            cleaned = self.text_processor.clean_text(chunk, language)
+            if cleaned:
+                yield cleaned
+
+    def _normalize(self, chunks, language):
+        for chunk in chunks:
+            normalized = self.text_processor.normalize_text(chunk, language)
+            if normalized:
+                yield normalized
+
+    def _split_sentences(self, chunks, language):
+        # The last sentence of a chunk is held back until the next chunk
+        # unless it ends with terminal punctuation; capped at one chunk so
+        # unpunctuated text (e.g. OCR output) still streams
+        pending = ''
+        for chunk in chunks:
+            text = f"{pending} {chunk}" if pending else chunk
+            sentences = self.text_processor.tokenize_sentences(text, language)
+            pending = ''
+            if sentences and not _SENTENCE_END_RE.search(chunk):
+                pending = sentences.pop()
+                if len(pending) > self.chunk_size:
+                    sentences.append(pending)
+                    pending = ''
+            yield from sentences
+        if pending:
+            yield pending
+
+    def _tokenize(self, sentences, language):
+        for sentence in sentences:
+            yield self.text_processor.tokenize_words(sentence, language)
+
+    def stream(self, source, language=None, until='tokens'):
+        """
+        Generator over the items of stage `until`; hooks of that stage and
+        all earlier ones fire as items pass through. The language is
+        detected from the first chunk when not given.
+        """
+        if until not in self._hooks:
+            raise ValueError(f"Unknown pipeline stage '{until}', expected one of {STAGES}")
+
+        chunks = iter_chunks(source, self.chunk_size)
+        if language is None:
+            first = next(chunks, None)
+            if first is None:
+                return
+            language = self.text_processor.detect_language(first)
+            chunks = _prepend(first, chunks)
+
+        stages = (
+            ('chunk', None),
+            ('cleaned', self._clean),
+            ('normalized', self._normalize),
+            ('sentence', self._split_sentences),
+            ('tokens', self._tokenize),
+        )
+        items = chunks
+        for stage, transform in stages:
+            if transform is not None:
+                items = transform(items, language)
+            items = self._emit(stage, items, language)
+            if stage == until:
+                break
+
+        yield from items
+
+    def run(self, source, language=None, until='tokens'):
+        """Drain the pipeline for its hooks; returns the number of final items"""
+        count = 0
+        for _ in self.stream(source, language, until):
+            count += 1
+        return count
+
+
+def _prepend(first, rest):
+    yield first
+    yield from rest
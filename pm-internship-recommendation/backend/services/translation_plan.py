@@ -0,0 +1,97 @@
+"""
+Per-response translation plan
+
+A recommendation response repeats the same strings many times (sectors,
+cities, skill names, reason templates). The plan records every string slot
+that needs translating, interns the strings, translates each unique string
+once and writes the results back into all of its slots.
+"""
+
+from .metrics import metrics
+
+_strings_counter = metrics.counter(
+    'translation_plan_strings_total',
+    description='String slots collected by translation plans'
+)
+_unique_counter = metrics.counter(
+    'translation_plan_unique_total',
+    description='Unique strings actually translated by translation plans'
+)
+_dedup_histogram = metrics.histogram(
+    'translation_plan_dedup_ratio',
+    buckets=(0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0),
+    description='Share of translate calls saved per response (1 - unique / strings)'
+)
+
+
+def _item_label(label, position):
+    if label is None:
+        return None
+    owner, path = label
+    return owner, f"{path}[{position}]"
+
+
+class TranslationPlan:
+    """
+    Collects (container, key) slots and fills them from one translation per unique string
+    """
+
+    def __init__(self):
+        self._slots = []
+        self._index = {}  # text -> position in unique_texts
+
+    def add(self, container, key, label=None):
+        """
+        Register container[key] (dict key or list index) for translation.
+        The optional label identifies the slot in labels_for().
+        """
+        value = container[key]
+        if not value:
+            return
+        text = str(value)
+        index = self._index.setdefault(text, len(self._index))
+        self._slots.append((container, key, index, label))
+
+    def add_all(self, items, label=None):
+        """Register every entry of a list; labels become (owner, 'path[i]')"""
+        for position in range(len(items)):
+            self.add(items, position, _item_label(label, position))
+
+    def labels_for(self, unique_positions):
+        """Labels of all slots filled from the given unique_texts positions"""
+        return [
+            label for _, _, index, label in self._slots
+            if index in unique_positions and label is not None
+        ]
+
+    @property
+    def unique_texts(self):
+        return list(self._index)
+
+    def __len__(self):
+        return len(self._slots)
+
+    def execute(self, translate_many):
+        """
+        Translate unique strings with translate_many(texts) -> list and fill all slots.
+        Returns plan statistics.
+        """
+        texts = self.unique_texts
+        translations = translate_many(texts) if texts else []
+
+        for container, key, index, _ in self._slots:
+            container[key] = translations[index]
+
+        total = len(self._slots)
+        unique = len(texts)
+        dedup_ratio = 1 - unique / total if total else 0.0
+        _strings_counter.inc(total)
+        _unique_counter.inc(unique)
+        if total:
+            _dedup_histogram.observe(dedup_ratio)
+
+        return {
+            'strings': total,
+            'unique': unique,
+            'dedup_ratio': round(dedup_ratio, 3)
+        }
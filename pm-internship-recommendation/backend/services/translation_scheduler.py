@@ -0,0 +1,192 @@
+"""
+Dynamic micro-batching scheduler for neural translation
+
+A single worker thread owns the neural model. Request threads submit texts
+and get a Future back; the worker gathers pending requests into batches that
+flush when `max_batch_size` is reached or `max_wait_ms` has elapsed since the
+first request of the batch arrived, whichever comes first.
+
+Configuration (environment variables, overridable via constructor):
+    TRANSLATION_BATCH_MAX_SIZE     maximum texts per model.generate call (16)
+    TRANSLATION_BATCH_MAX_WAIT_MS  maximum time a batch stays open (5)
+    TRANSLATION_QUEUE_MAX_DEPTH    pending requests before rejecting (256)
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from .metrics import metrics
+
+
+class TranslationQueueFull(Exception):
+    """Raised when the scheduler queue is at its maximum depth"""
+
+
+class _TranslationRequest:
+    __slots__ = ('text', 'target_language', 'future', 'enqueued_at')
+
+    def __init__(self, text, target_language):
+        self.text = text
+        self.target_language = target_language
+        self.future = Future()
+        self.enqueued_at = time.monotonic()
+
+
+# Sentinel used to wake the worker up on shutdown
+_STOP = object()
+
+
+class TranslationScheduler:
+    """
+    Batches translate requests from many threads onto one model worker
+    """
+
+    def __init__(self, translate_batch, max_batch_size=None, max_wait_ms=None,
+                 max_queue_depth=None):
+        # translate_batch(texts, target_language) -> list of translations
+        self.translate_batch = translate_batch
+        self.max_batch_size = max_batch_size or int(os.getenv('TRANSLATION_BATCH_MAX_SIZE', 16))
+        self.max_wait_ms = max_wait_ms if max_wait_ms is not None else float(
+            os.getenv('TRANSLATION_BATCH_MAX_WAIT_MS', 5)
+        )
+        self.max_queue_depth = max_queue_depth or int(os.getenv('TRANSLATION_QUEUE_MAX_DEPTH', 256))
+
+        self._queue = queue.Queue(maxsize=self.max_queue_depth)
+        self._shutdown = False
+
+        # Exponentially weighted moving average of model time per batch,
+        # used to estimate how long a newly submitted request will take
+        self.batch_latency_ms = 0.0
+        self._latency_smoothing = 0.2
+
+        self.batch_size_histogram = metrics.histogram(
+            'translation_batch_size',
+            buckets=(1, 2, 4, 8, 16, 32, 64),
+            description='Texts per neural translation batch'
+        )
+        self.queue_wait_histogram = metrics.histogram(
+            'translation_queue_wait_ms',
+            buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 5000),
+            description='Time a request waited in the scheduler queue'
+        )
+        self.rejected_counter = metrics.counter(
+            'translation_queue_rejected_total',
+            description='Requests rejected because the queue was full'
+        )
+
+        self._worker = threading.Thread(
+            target=self._run, name='translation-scheduler', daemon=True
+        )
+        self._worker.start()
+
+    def submit(self, text, target_language):
+        """Queue a text for translation and return a Future for the result"""
+        if self._shutdown:
+            raise RuntimeError("Translation scheduler has been shut down")
+
+        request = _TranslationRequest(text, target_language)
+        try:
+            self._queue.put_nowait(request)
+        except queue.Full:
+            self.rejected_counter.inc()
+            raise TranslationQueueFull(
+                f"Translation queue is full ({self.max_queue_depth} pending requests)"
+            )
+        return request.future
+
+    def translate(self, text, target_language, timeout=None):
+        """Blocking convenience wrapper around submit()"""
+        return self.submit(text, target_language).result(timeout)
+
+    def queue_depth(self):
+        return self._queue.qsize()
+
+    def estimated_wait_ms(self):
+        """Rough time until a request submitted now has its result"""
+        batches_ahead = self.queue_depth() // self.max_batch_size + 1
+        return batches_ahead * self.batch_latency_ms + self.max_wait_ms
+
+    def get_stats(self):
+        return {
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait_ms,
+            'max_queue_depth': self.max_queue_depth,
+            'queue_depth': self.queue_depth(),
+            'batch_latency_ms': round(self.batch_latency_ms, 2)
+        }
+
+    def shutdown(self, wait=True):
+        """Stop the worker after the requests already queued are served"""
+        if self._shutdown:
+            return
+        self._shutdown = True
+        self._queue.put(_STOP)
+        if wait:
+            self._worker.join()
+
+    def _collect_batch(self):
+        """Block for the first request, then gather more until size or time limit"""
+        first = self._queue.get()
+        if first is _STOP:
+            return None, True
+
+        batch = [first]
+        flush_at = time.monotonic() + self.max_wait_ms / 1000.0
+        while len(batch) < self.max_batch_size:
+            remaining = flush_at - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self):
+        while True:
+            batch, stop = self._collect_batch()
+            if batch:
+                self._process(batch)
+            if stop:
+                return
+
+    def _record_batch_latency(self, elapsed_ms):
+        if self.batch_latency_ms == 0.0:
+            self.batch_latency_ms = elapsed_ms
+        else:
+            self.batch_latency_ms += self._latency_smoothing * (elapsed_ms - self.batch_latency_ms)
+
+    def _process(self, batch):
+        # forced_bos_token_id is per target language, so one generate call per language
+        by_language = {}
+        for request in batch:
+            if request.future.set_running_or_notify_cancel():
+                by_language.setdefault(request.target_language, []).append(request)
+
+        started = time.monotonic()
+        for target_language, requests in by_language.items():
+            self.batch_size_histogram.observe(len(requests))
+            for request in requests:
+                self.queue_wait_histogram.observe((started - request.enqueued_at) * 1000)
+
+            batch_started = time.monotonic()
+            try:
+                results = self.translate_batch([r.text for r in requests], target_language)
+                if len(results) != len(requests):
+                    raise RuntimeError(
+                        f"Batch returned {len(results)} results for {len(requests)} texts"
+                    )
+            except Exception as batch_error:
+                for request in requests:
+                    request.future.set_exception(batch_error)
+                continue
+
+            self._record_batch_latency((time.monotonic() - batch_started) * 1000)
+            for request, result in zip(requests, results):
+                request.future.set_result(result)
@@ -6,30 +6,67 @@ transliteration, and language detection. It includes fallback modes and
 rule-based translation for common terms.
 """
 
+import os
+import re
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from . import script_detector
+from . import reason_templates
+from . import transliteration_tables
+from .deadline import Deadline
+from .registry import registry
+from .metrics import metrics
+from .translation_plan import TranslationPlan
+from .translation_scheduler import TranslationScheduler, TranslationQueueFull
+
 # Indic NLP Library imports
 try:
     from indicnlp import common
-    from indicnlp.tokenize import indic_tokenize
-    from indicnlp.normalize import indic_normalize
-    from indicnlp.script import indic_scripts
     from indicnlp.transliterate import unicode_transliterate
-    import os
-    import re
     _INDIC_NLP_AVAILABLE = True
 except Exception:
     _INDIC_NLP_AVAILABLE = False
 
 # Optional neural dependencies (heavy). Wrapped to avoid import-time crashes.
+# torch is imported on its own so quantization helpers work without transformers.
 try:
-    from transformers import AutoModelForSeq2SeqLM, AutoTokenizer  # type: ignore
     import torch  # type: ignore
-    _NEURAL_DEPS_AVAILABLE = True
+except Exception:
+    torch = None  # type: ignore
+
+try:
+    from transformers import AutoModelForSeq2SeqLM, AutoTokenizer  # type: ignore
+    _NEURAL_DEPS_AVAILABLE = torch is not None
 except Exception:
     AutoModelForSeq2SeqLM = None  # type: ignore
     AutoTokenizer = None  # type: ignore
-    torch = None  # type: ignore
     _NEURAL_DEPS_AVAILABLE = False
 
+_first_segment_histogram = metrics.histogram(
+    'translation_stream_first_segment_ms',
+    buckets=(5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000),
+    description='Time to first translated segment on streaming translation'
+)
+
+_degraded_counter = metrics.counter(
+    'translation_degraded_total',
+    description='Texts translated rule-based because of latency budget or queue depth'
+)
+
+
+def quantize_model_int8(model):
+    """
+    Apply int8 dynamic quantization to the model's nn.Linear layers.
+    Weights are stored as int8 and activations are quantized on the fly,
+    which cuts memory and speeds up CPU inference for seq2seq models.
+    """
+    return torch.quantization.quantize_dynamic(  # type: ignore[union-attr]
+        model, {torch.nn.Linear}, dtype=torch.qint8  # type: ignore[union-attr]
+    )
+
+
 class TranslationService:
     def __init__(self):
         # Initialize Indic NLP Library if available
@@ -60,18 +97,49 @@ class TranslationService:
         self.model = None
         self.device = "cpu"
 
+        # CPU inference options (opt-in): TRANSLATION_PRECISION=int8 enables
+        # dynamic quantization; thread counts of 0 keep torch defaults
+        self.precision = os.getenv('TRANSLATION_PRECISION', 'fp32').lower()
+        self.intra_op_threads = int(os.getenv('TORCH_INTRA_OP_THREADS', 0))
+        self.inter_op_threads = int(os.getenv('TORCH_INTER_OP_THREADS', 0))
+
         if self.mode == "neural":
             try:
                 self.tokenizer = AutoTokenizer.from_pretrained(self.model_name, trust_remote_code=True)
                 self.model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name, trust_remote_code=True)
                 self.device = "cuda" if torch and torch.cuda.is_available() else "cpu"  # type: ignore[attr-defined]
                 self.model.to(self.device)
+                self._configure_inference()
             except Exception as load_error:
                 print(f"Neural model unavailable ({load_error}). Using Indic NLP mode.")
                 self.mode = "indic_nlp" if self.indic_nlp_available else "fallback"
                 self.tokenizer = None
                 self.model = None
 
+        # Normalization, tokenization and sentence splitting (shared instance)
+        self.text_processor = registry.get('text_processor')
+        self.stream_batch_size = int(os.getenv('TRANSLATION_STREAM_BATCH_SIZE', 8))
+
+        # Translated-term cache (skill/interest names used in match reasons,
+        # filled by translate_recommendations), keyed by (term,
+        # target_language), oldest entries evicted first
+        self.term_cache_size = int(os.getenv('TRANSLATION_TERM_CACHE_SIZE', 4096))
+        self._term_cache = {}
+        self._term_cache_lock = threading.Lock()
+
+        # Micro-batching scheduler: one worker owns the model and batches
+        # concurrent translate() calls into shared generate() calls
+        self.scheduler = None
+        if self.mode == "neural":
+            self.scheduler = TranslationScheduler(self._neural_translate_batch)
+
+        # Latency budget: 0 means no default budget. Above the degrade queue
+        # depth, new texts skip the neural model (0 = half the queue capacity)
+        self.latency_budget_ms = float(os.getenv('TRANSLATION_LATENCY_BUDGET_MS', 0))
+        self.degrade_queue_depth = int(os.getenv('TRANSLATION_DEGRADE_QUEUE_DEPTH', 0))
+        if self.scheduler and not self.degrade_queue_depth:
+            self.degrade_queue_depth = self.scheduler.max_queue_depth // 2
+
         # Language codes and script mapping
         self.language_map = {
             'en': 'eng_Latn',
@@ -162,61 +230,60 @@ class TranslationService:
             }
         }
 
+    def _configure_inference(self):
+        """Apply thread settings and the requested precision to the loaded model"""
+        if self.intra_op_threads > 0:
+            torch.set_num_threads(self.intra_op_threads)  # type: ignore[union-attr]
+        if self.inter_op_threads > 0:
+            try:
+                torch.set_num_interop_threads(self.inter_op_threads)  # type: ignore[union-attr]
+            except RuntimeError as thread_error:
+                # Can only be set once, before any inter-op parallel work has started
+                print(f"Could not set inter-op threads: {thread_error}")
+
+        if self.precision == 'int8':
+            if self.device != 'cpu':
+                print("int8 dynamic quantization is CPU-only. Using fp32 on GPU.")
+                self.precision = 'fp32'
+            else:
+                self.model = quantize_model_int8(self.model)
+        elif self.precision != 'fp32':
+            print(f"Unknown TRANSLATION_PRECISION '{self.precision}'. Using fp32.")
+            self.precision = 'fp32'
+
+        self.model.eval()
+
     def detect_language(self, text):
         """
-        Detect the script/language of the input text using Indic NLP
+        Detect the script/language of the input text (single-pass, memoized)
         """
-        if not self.indic_nlp_available:
-            return 'en'  # Default fallback
-        
-        try:
-            # Use script detection from Indic NLP
-            detected_script = indic_scripts.get_script(text)
-            return self.script_to_lang.get(detected_script, 'en')
-        except Exception:
-            # Fallback: simple heuristic based on character ranges
-            if any('\u0900' <= char <= '\u097F' for char in text):
-                return 'hi'  # Devanagari
-            elif any('\u0C00' <= char <= '\u0C7F' for char in text):
-                return 'te'  # Telugu
-            elif any('\u0B80' <= char <= '\u0BFF' for char in text):
-                return 'ta'  # Tamil
-            elif any('\u0980' <= char <= '\u09FF' for char in text):
-                return 'bn'  # Bengali
-            else:
-                return 'en'  # Latin/English
+        return script_detector.detect_language(text, self.script_to_lang)
     
     def normalize_text(self, text, language):
         """
-        Normalize text using Indic NLP normalization
+        Normalize text using the cached Indic NLP normalizer for the language
         """
-        if not self.indic_nlp_available or language == 'en':
-            return text.strip()
-        
-        try:
-            normalized = indic_normalize.normalize(text, language)
-            return normalized.strip()
-        except Exception:
-            return text.strip()
+        return self.text_processor.normalize_text(text, language)
     
     def tokenize_text(self, text, language):
         """
         Tokenize text using Indic NLP tokenizer
         """
-        if not self.indic_nlp_available or language == 'en':
-            return text.split()
-        
-        try:
-            tokens = indic_tokenize.trivial_tokenize(text, language)
-            return tokens
-        except Exception:
-            return text.split()
+        return self.text_processor.tokenize_words(text, language)
     
     def transliterate_text(self, text, source_lang, target_lang):
         """
         Transliterate text between Indian language scripts
         """
-        if not self.indic_nlp_available or source_lang == target_lang:
+        if source_lang == target_lang:
+            return text
+        
+        # Brahmic script pairs: precomputed str.translate tables
+        transliterated = transliteration_tables.transliterate(text, source_lang, target_lang)
+        if transliterated is not None:
+            return transliterated
+        
+        if not self.indic_nlp_available:
             return text
         
         try:
@@ -252,6 +319,31 @@ class TranslationService:
         
         return translated_text
 
+    def _neural_translate_batch(self, texts, target_language):
+        """
+        Translate a batch of texts with one model.generate call.
+        Runs on the scheduler worker thread only.
+        """
+        tgt_lang = self.language_map[target_language]
+
+        inputs = self.tokenizer(
+            texts,
+            return_tensors="pt",
+            padding=True,
+            truncation=True
+        ).to(self.device)
+
+        with torch.no_grad():  # type: ignore[union-attr]
+            generated_tokens = self.model.generate(
+                **inputs,
+                forced_bos_token_id=self.tokenizer.lang_code_to_id[tgt_lang]
+            )
+
+        return self.tokenizer.batch_decode(
+            generated_tokens,
+            skip_special_tokens=True
+        )
+
     def translate(self, text, target_language='hi'):
         """
         Comprehensive translation using multiple approaches
@@ -269,51 +361,197 @@ class TranslationService:
                 return normalized_text
             
             # Step 2: Try neural translation if available
-            if self.mode == "neural" and self.model and self.tokenizer:
+            if self.mode == "neural" and self.scheduler:
                 try:
-                    tgt_lang = self.language_map[target_language]
-                    
-                    inputs = self.tokenizer(
-                        normalized_text,
-                        return_tensors="pt",
-                        padding=True,
-                        truncation=True
-                    ).to(self.device)
-                    
-                    with torch.no_grad():  # type: ignore[union-attr]
-                        generated_tokens = self.model.generate(
-                            **inputs,
-                            forced_bos_token_id=self.tokenizer.lang_code_to_id[tgt_lang]
-                        )
-                    
-                    translated_text = self.tokenizer.batch_decode(
-                        generated_tokens,
-                        skip_special_tokens=True
-                    )[0]
-                    
-                    return translated_text
-                
+                    return self.scheduler.translate(normalized_text, target_language)
                 except Exception as neural_error:
                     print(f"Neural translation failed: {neural_error}. Falling back to rule-based.")
             
             # Step 3: Rule-based translation with Indic NLP processing
-            if source_lang == 'en':
-                # English to Indian language
-                rule_translated = self.rule_based_translate(normalized_text, target_language)
-                return self.normalize_text(rule_translated, target_language)
-            else:
-                # Indian language to Indian language via transliteration
-                if self.indic_nlp_available and source_lang != 'en' and target_language != 'en':
-                    transliterated = self.transliterate_text(normalized_text, source_lang, target_language)
-                    return self.normalize_text(transliterated, target_language)
-            
-            # Fallback: return normalized original text
-            return normalized_text
+            return self._rule_based_fallback(normalized_text, source_lang, target_language)
             
         except Exception as e:
             print(f"Translation error: {str(e)}")
             return text
 
+    def _rule_based_fallback(self, normalized_text, source_lang, target_language):
+        """Rule-based translation / transliteration used when neural is unavailable"""
+        if source_lang == 'en':
+            # English to Indian language
+            rule_translated = self.rule_based_translate(normalized_text, target_language)
+            return self.normalize_text(rule_translated, target_language)
+        else:
+            # Indian language to Indian language via transliteration
+            can_transliterate = (
+                self.indic_nlp_available
+                or transliteration_tables.supports(source_lang, target_language)
+            )
+            if can_transliterate and source_lang != 'en' and target_language != 'en':
+                transliterated = self.transliterate_text(normalized_text, source_lang, target_language)
+                return self.normalize_text(transliterated, target_language)
+        
+        # Fallback: return normalized original text
+        return normalized_text
+
+    def translate_many(self, texts, target_language, deadline=None, degraded=None):
+        """
+        Translate a list of texts into the target language.
+        Texts already in the target language are only normalized. In neural
+        mode all texts are queued at once so the scheduler can batch them.
+
+        With a deadline, texts that the neural model cannot serve within the
+        remaining budget are translated rule-based instead; their positions
+        are added to the `degraded` set when one is passed.
+        """
+        degraded = set() if degraded is None else degraded
+        results, pending = self._start_translations(texts, target_language, deadline, degraded)
+        return self._collect_translations(results, pending, target_language, deadline, degraded)
+
+    def make_deadline(self, budget_ms=None):
+        """Deadline for a request: explicit budget, else TRANSLATION_LATENCY_BUDGET_MS"""
+        return Deadline.from_budget(budget_ms if budget_ms is not None else self.latency_budget_ms)
+
+    def _should_degrade(self, deadline):
+        """True when neural translation cannot be afforded right now"""
+        if self.degrade_queue_depth and self.scheduler.queue_depth() >= self.degrade_queue_depth:
+            return True
+        return deadline is not None and deadline.remaining_ms() < self.scheduler.estimated_wait_ms()
+
+    def _start_translations(self, texts, target_language, deadline=None, degraded=None):
+        """
+        Resolve what can be done immediately and queue neural work.
+        Returns (results, pending) for _collect_translations.
+        """
+        results = [None] * len(texts)
+        pending = []
+
+        for position, text in enumerate(texts):
+            try:
+                source_lang = self.detect_language(text)
+                if source_lang == target_language:
+                    results[position] = self.normalize_text(text, target_language)
+                    continue
+                if target_language not in self.language_map:
+                    results[position] = text
+                    continue
+
+                normalized_text = self.normalize_text(text, source_lang)
+                if self.mode == "neural" and self.scheduler:
+                    if self._should_degrade(deadline):
+                        self._mark_degraded(degraded, position)
+                    else:
+                        try:
+                            future = self.scheduler.submit(normalized_text, target_language)
+                            pending.append((position, normalized_text, source_lang, future))
+                            continue
+                        except TranslationQueueFull:
+                            self._mark_degraded(degraded, position)
+                        except Exception as neural_error:
+                            print(f"Neural translation failed: {neural_error}. Falling back to rule-based.")
+
+                results[position] = self._rule_based_fallback(
+                    normalized_text, source_lang, target_language
+                )
+            except Exception as e:
+                print(f"Translation error: {str(e)}")
+                results[position] = text
+
+        return results, pending
+
+    def _collect_translations(self, results, pending, target_language, deadline=None, degraded=None):
+        """Wait for queued neural translations, falling back per text on failure or timeout"""
+        for position, normalized_text, source_lang, future in pending:
+            try:
+                timeout = deadline.remaining_seconds() if deadline else None
+                results[position] = future.result(timeout)
+                continue
+            except FutureTimeoutError:
+                # Budget spent: drop the queued request if it has not started yet
+                future.cancel()
+                self._mark_degraded(degraded, position)
+            except Exception as neural_error:
+                print(f"Neural translation failed: {neural_error}. Falling back to rule-based.")
+            results[position] = self._rule_based_fallback(
+                normalized_text, source_lang, target_language
+            )
+
+        return results
+
+    def _mark_degraded(self, degraded, position):
+        _degraded_counter.inc()
+        if degraded is not None:
+            degraded.add(position)
+
+    def translate_stream(self, text, target_language, batch_size=None):
+        """
+        Translate long text sentence by sentence, yielding each segment as
+        soon as it is ready. Sentences are translated in batches; the next
+        batch is queued before the current one is emitted, so at most two
+        batches are in flight at any time.
+
+        Yields dicts: {'index', 'source', 'translated', 'elapsed_ms'}
+        """
+        started = time.monotonic()
+        batch_size = batch_size or self.stream_batch_size
+        source_lang = self.detect_language(text)
+        sentences = self.text_processor.tokenize_sentences(text, source_lang)
+
+        def start(offset):
+            batch = sentences[offset:offset + batch_size]
+            return offset, batch, self._start_translations(batch, target_language)
+
+        def emit(offset, batch, started_batch):
+            results, pending = started_batch
+            translations = self._collect_translations(results, pending, target_language)
+            for position, (source, translated) in enumerate(zip(batch, translations)):
+                yield {
+                    'index': offset + position,
+                    'source': source,
+                    'translated': translated,
+                    'elapsed_ms': round((time.monotonic() - started) * 1000, 2)
+                }
+
+        # Rule-based translation runs inline, so there is nothing to overlap
+        pipelined = self.mode == "neural" and self.scheduler is not None
+
+        def segments():
+            in_flight = None
+            for offset in range(0, len(sentences), batch_size):
+                queued = start(offset)
+                if in_flight:
+                    yield from emit(*in_flight)
+                in_flight = queued
+                if not pipelined:
+                    yield from emit(*in_flight)
+                    in_flight = None
+            if in_flight:
+                yield from emit(*in_flight)
+
+        for index, segment in enumerate(segments()):
+            if index == 0:
+                _first_segment_histogram.observe(segment['elapsed_ms'])
+            yield segment
+
+    def _cached_terms(self, terms, target_language):
+        """{term: translation} for the terms already in the term cache"""
+        cached = {}
+        with self._term_cache_lock:
+            for term in terms:
+                translation = self._term_cache.get((term, target_language))
+                if translation is not None:
+                    cached[term] = translation
+        return cached
+
+    def _cache_terms(self, translations, target_language):
+        """Store {term: translation} in the term cache, dropping the oldest entries"""
+        if not translations:
+            return
+        with self._term_cache_lock:
+            for term, translation in translations.items():
+                self._term_cache[(term, target_language)] = translation
+            while len(self._term_cache) > self.term_cache_size:
+                del self._term_cache[next(iter(self._term_cache))]
+
     def get_supported_languages(self):
         """Get list of supported languages with their native names"""
         return {
@@ -331,122 +569,146 @@ class TranslationService:
             'indic_nlp_available': self.indic_nlp_available,
             'neural_available': self.neural_available,
             'features': {
-                'language_detection': self.indic_nlp_available,
+                'language_detection': True,
                 'text_normalization': self.indic_nlp_available,
-                'transliteration': self.indic_nlp_available,
+                'transliteration': True,
                 'neural_translation': self.mode == 'neural',
                 'rule_based_translation': True
+            },
+            'batching': self.scheduler.get_stats() if self.scheduler else None,
+            'inference': {
+                'device': self.device,
+                'precision': self.precision if self.mode == 'neural' else None,
+                'intra_op_threads': torch.get_num_threads() if torch else None,
+                'inter_op_threads': torch.get_num_interop_threads() if torch else None
             }
         }
 
-    def translate_internship_data(self, internship, target_language):
-        """Enhanced translation of internship data with better field handling"""
-        if target_language == 'en':
-            return internship
-
-        translated_internship = internship.copy()
-        
+    def _plan_internship_fields(self, plan, internship, owner=None):
+        """
+        Copy the nested parts of an internship that get translated (so the
+        shared catalog entry is never modified) and register its fields.
+        Slots are labelled (owner, field path) for degradation reporting.
+        """
         # Fields that should be translated
         text_fields = ['title', 'company', 'description', 'sector', 'location']
-        
-        for field in text_fields:
-            if field in translated_internship and translated_internship[field]:
-                original_text = str(translated_internship[field])
-                # First detect the language of the original text
-                detected_lang = self.detect_language(original_text)
-                
-                # Only translate if it's different from target language
-                if detected_lang != target_language:
-                    translated_internship[field] = self.translate(
-                        original_text,
-                        target_language
-                    )
-                else:
-                    # Normalize the text in the target language
-                    translated_internship[field] = self.normalize_text(
-                        original_text, target_language
-                    )
-        
+        # Additional free-text fields
+        other_translatable_fields = ['benefits', 'responsibilities', 'application_process']
+
+        for field in text_fields + other_translatable_fields:
+            if field in internship and internship[field]:
+                plan.add(internship, field, (owner, field))
+
         # Handle nested requirements
-        if 'requirements' in translated_internship and translated_internship['requirements']:
-            requirements = translated_internship['requirements']
-            
-            # Translate skills array
+        if 'requirements' in internship and internship['requirements']:
+            requirements = dict(internship['requirements'])
+            internship['requirements'] = requirements
+
             if 'skills' in requirements and requirements['skills']:
-                translated_skills = []
-                for skill in requirements['skills']:
-                    if skill:
-                        skill_lang = self.detect_language(str(skill))
-                        if skill_lang != target_language:
-                            translated_skill = self.translate(str(skill), target_language)
-                        else:
-                            translated_skill = self.normalize_text(str(skill), target_language)
-                        translated_skills.append(translated_skill)
-                translated_internship['requirements']['skills'] = translated_skills
-            
-            # Translate education field if present
+                requirements['skills'] = [skill for skill in requirements['skills'] if skill]
+                plan.add_all(requirements['skills'], (owner, 'requirements.skills'))
+
             if 'education' in requirements and requirements['education']:
-                education_text = str(requirements['education'])
-                edu_lang = self.detect_language(education_text)
-                if edu_lang != target_language:
-                    translated_internship['requirements']['education'] = self.translate(
-                        education_text, target_language
-                    )
-                else:
-                    translated_internship['requirements']['education'] = self.normalize_text(
-                        education_text, target_language
-                    )
-        
-        # Handle additional fields
-        other_translatable_fields = ['benefits', 'responsibilities', 'application_process']
-        for field in other_translatable_fields:
-            if field in translated_internship and translated_internship[field]:
-                field_text = str(translated_internship[field])
-                field_lang = self.detect_language(field_text)
-                if field_lang != target_language:
-                    translated_internship[field] = self.translate(field_text, target_language)
-                else:
-                    translated_internship[field] = self.normalize_text(field_text, target_language)
-        
+                plan.add(requirements, 'education', (owner, 'requirements.education'))
+
+    def _execute_plan(self, plan, target_language, deadline=None):
+        """Run the plan; returns the labels of slots that were degraded"""
+        degraded = set()
+        plan.execute(lambda texts: self.translate_many(texts, target_language, deadline, degraded))
+        return plan.labels_for(degraded)
+
+    def translate_internship_data(self, internship, target_language, deadline=None):
+        """Enhanced translation of internship data with better field handling"""
+        if target_language == 'en':
+            return internship
+
+        translated_internship = internship.copy()
+        plan = TranslationPlan()
+        self._plan_internship_fields(plan, translated_internship)
+        degraded_fields = self._execute_plan(plan, target_language, deadline)
+        if degraded_fields:
+            translated_internship['translation_degraded_fields'] = [path for _, path in degraded_fields]
         return translated_internship
 
-    def translate_recommendations(self, recommendations, target_language):
-        """Enhanced translation of recommendation results with comprehensive field handling"""
+    def translate_recommendations(self, recommendations, target_language, deadline=None):
+        """
+        Translate recommendation results. All strings of the response go into
+        one plan, so repeated sectors, cities, skills and reasons are
+        detected and translated once. Match reason terms missing from the
+        term cache join the same plan and share its single batch.
+
+        With a deadline, fields that fell back to rule-based translation are
+        listed per recommendation in 'translation_degraded_fields' so clients
+        can request refined translations later.
+        """
         if target_language == 'en':
             return recommendations
 
+        plan = TranslationPlan()
         translated_recommendations = []
-        for recommendation in recommendations:
-            # First translate the basic internship data
-            translated_rec = self.translate_internship_data(recommendation, target_language)
-            
-            # Handle match reasons with language detection and normalization
-            if 'match_reasons' in translated_rec and translated_rec['match_reasons']:
-                translated_reasons = []
-                for reason in translated_rec['match_reasons']:
-                    if reason:
-                        reason_text = str(reason)
-                        reason_lang = self.detect_language(reason_text)
-                        if reason_lang != target_language:
-                            translated_reason = self.translate(reason_text, target_language)
-                        else:
-                            translated_reason = self.normalize_text(reason_text, target_language)
-                        translated_reasons.append(translated_reason)
-                translated_rec['match_reasons'] = translated_reasons
-            
+        degraded_fields = []
+        # Structured reasons are rendered after the plan ran, once the terms
+        # of all recommendations are translated
+        reason_codes = []
+        reason_terms = {}
+        for position, recommendation in enumerate(recommendations):
+            translated_rec = recommendation.copy()
+            self._plan_internship_fields(plan, translated_rec, position)
+
+            # Match reasons: structured codes are rendered from pre-translated
+            # templates with their terms translated in the plan; free-text
+            # reasons go through the plan as they are
+            if translated_rec.get('match_reason_codes') and reason_templates.has_templates(target_language):
+                codes = translated_rec['match_reason_codes']
+                reason_codes.append((position, codes))
+                for term in reason_templates.reason_terms(codes):
+                    reason_terms.setdefault(term, term)
+            elif 'match_reasons' in translated_rec and translated_rec['match_reasons']:
+                translated_rec['match_reasons'] = [
+                    reason for reason in translated_rec['match_reasons'] if reason
+                ]
+                plan.add_all(translated_rec['match_reasons'], (position, 'match_reasons'))
+
             # Handle additional recommendation-specific fields
             recommendation_fields = ['match_explanation', 'why_recommended', 'next_steps']
             for field in recommendation_fields:
                 if field in translated_rec and translated_rec[field]:
-                    field_text = str(translated_rec[field])
-                    field_lang = self.detect_language(field_text)
-                    if field_lang != target_language:
-                        translated_rec[field] = self.translate(field_text, target_language)
-                    else:
-                        translated_rec[field] = self.normalize_text(field_text, target_language)
-            
+                    plan.add(translated_rec, field, (position, field))
+
             translated_recommendations.append(translated_rec)
 
+        # Reason terms: cache hits are filled in now, misses join the plan
+        cached_terms = self._cached_terms(reason_terms, target_language)
+        for term in reason_terms:
+            if term in cached_terms:
+                reason_terms[term] = cached_terms[term]
+            else:
+                plan.add(reason_terms, term, ('term', term))
+
+        degraded_terms = set()
+        for owner, path in self._execute_plan(plan, target_language, deadline):
+            if owner == 'term':
+                degraded_terms.add(path)
+            else:
+                degraded_fields.append((owner, path))
+        # Degraded (rule-based) term translations are not cached
+        self._cache_terms({
+            term: translation for term, translation in reason_terms.items()
+            if term not in cached_terms and term not in degraded_terms
+        }, target_language)
+
+        for position, codes in reason_codes:
+            translated_recommendations[position]['match_reasons'] = reason_templates.render_reasons(
+                codes, target_language, reason_terms
+            )
+            if degraded_terms.intersection(reason_templates.reason_terms(codes)):
+                degraded_fields.append((position, 'match_reasons'))
+
+        for position, path in degraded_fields:
+            translated_recommendations[position].setdefault(
+                'translation_degraded_fields', []
+            ).append(path)
+
         return translated_recommendations
     
     def process_multilingual_query(self, query_text):
@@ -0,0 +1,135 @@
+"""
+Precomputed transliteration tables for Brahmic scripts
+
+The Unicode blocks of the major Indic scripts are offset-aligned: the same
+offset from the block start is the same letter in every script. Converting
+between them is therefore a fixed per-character mapping, precomputed here as
+str.maketrans tables so transliteration is a single str.translate call.
+
+The mapping follows indicnlp's UnicodeIndicTransliterator (the correctness
+oracle, see benchmarks/bench_transliteration.py) with explicit handling for
+characters that do not map cleanly:
+    * danda / double danda (U+0964/U+0965) are shared punctuation and are kept
+    * Tamil has no voiced or aspirated plosives; those collapse onto the
+      unvoiced unaspirated letter of the same row, as indicnlp does
+    * when the aligned target code point is unassigned, a nukta letter is
+      decomposed into base letter + nukta and mapped piecewise, a standalone
+      nukta is dropped, and anything else is left unchanged instead of
+      emitting an unassigned code point
+"""
+
+import unicodedata
+
+SCRIPT_BASES = {
+    'hi': 0x0900,  # Devanagari
+    'bn': 0x0980,  # Bengali
+    'pa': 0x0A00,  # Gurmukhi
+    'gu': 0x0A80,  # Gujarati
+    'or': 0x0B00,  # Oriya
+    'ta': 0x0B80,  # Tamil
+    'te': 0x0C00,  # Telugu
+    'kn': 0x0C80,  # Kannada
+    'ml': 0x0D00,  # Malayalam
+}
+
+# Languages written in another language's script
+LANGUAGE_ALIASES = {
+    'mr': 'hi',
+    'as': 'bn',
+}
+
+# Offsets that are coordinated across the blocks (indicnlp langinfo)
+COORDINATED_RANGE = range(0x00, 0x70)
+
+DANDA = 0x0964
+DOUBLE_DANDA = 0x0965
+
+NUKTA_OFFSET = 0x3C
+
+
+def _script_of(language):
+    return LANGUAGE_ALIASES.get(language, language)
+
+
+def _is_assigned(codepoint):
+    return unicodedata.category(chr(codepoint)) != 'Cn'
+
+
+def _tamil_offset(offset):
+    """Collapse plosives missing from Tamil onto the row's unvoiced letter"""
+    # First four consonant rows (ka..pa), except ja which Tamil has
+    if 0x15 <= offset <= 0x28 and offset != 0x1C and (offset - 0x15) % 5 not in (0, 4):
+        offset = 0x15 + 5 * ((offset - 0x15) // 5)
+    # pha, ba, bha -> pa
+    if offset in (0x2B, 0x2C, 0x2D):
+        offset = 0x2A
+    # sha -> ssa
+    if offset == 0x36:
+        offset = 0x37
+    return offset
+
+
+def _target_offset(offset, target):
+    return _tamil_offset(offset) if target == 'ta' else offset
+
+
+def _map_char(codepoint, source, target):
+    """Replacement string for one source code point, or None to keep it"""
+    offset = codepoint - SCRIPT_BASES[source]
+    target_codepoint = SCRIPT_BASES[target] + _target_offset(offset, target)
+    if _is_assigned(target_codepoint):
+        return chr(target_codepoint)
+
+    # A standalone nukta is dropped when the target script has none
+    if offset == NUKTA_OFFSET:
+        return ''
+
+    # Nukta letters (e.g. Devanagari qa) -> base letter + nukta, if both exist
+    decomposition = unicodedata.decomposition(chr(codepoint)).split()
+    if len(decomposition) == 2:
+        base, nukta = (int(part, 16) for part in decomposition)
+        if nukta - SCRIPT_BASES[source] == NUKTA_OFFSET:
+            mapped_base = _map_char(base, source, target)
+            if mapped_base is not None:
+                nukta_target = SCRIPT_BASES[target] + NUKTA_OFFSET
+                return mapped_base + (chr(nukta_target) if _is_assigned(nukta_target) else '')
+    return None
+
+
+def _build_table(source, target):
+    mapping = {}
+    for offset in COORDINATED_RANGE:
+        codepoint = SCRIPT_BASES[source] + offset
+        if codepoint in (DANDA, DOUBLE_DANDA) or not _is_assigned(codepoint):
+            continue
+        replacement = _map_char(codepoint, source, target)
+        if replacement is not None and replacement != chr(codepoint):
+            mapping[codepoint] = replacement
+    return str.maketrans(mapping)
+
+
+TRANSLATION_TABLES = {
+    (source, target): _build_table(source, target)
+    for source in SCRIPT_BASES
+    for target in SCRIPT_BASES
+    if source != target
+}
+
+
+def supports(source_lang, target_lang):
+    """True when both languages use a script covered by the tables"""
+    return _script_of(source_lang) in SCRIPT_BASES and _script_of(target_lang) in SCRIPT_BASES
+
+
+def transliterate(text, source_lang, target_lang):
+    """
+    Transliterate text between Brahmic scripts with one str.translate call.
+    Returns None when the language pair has no table.
+    """
+    source, target = _script_of(source_lang), _script_of(target_lang)
+    if source == target and source in SCRIPT_BASES:
+        return text
+    table = TRANSLATION_TABLES.get((source, target))
+    if table is None:
+        return None
+    return text.translate(table)
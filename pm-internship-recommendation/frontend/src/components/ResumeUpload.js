@@ -4,7 +4,7 @@ import { useLanguage } from '../context/LanguageContext';
 import apiService from '../services/apiService';
 
 const ResumeUpload = ({ setUserProfile, setRecommendations }) => {
-  const { translate } = useLanguage();
+  const { translate, currentLanguage, languageSelected } = useLanguage();
   const navigate = useNavigate();
   const fileInputRef = useRef(null);
   
@@ -70,36 +70,29 @@ const ResumeUpload = ({ setUserProfile, setRecommendations }) => {
         });
       }, 200);
 
-      // Parse resume
-      const parseResult = await apiService.parseResume(file);
+      // Parse resume and score it in one request
+      const result = await apiService.recommendFromResume(
+        file, languageSelected ? currentLanguage : undefined
+      );
       clearInterval(progressInterval);
       setProgress(100);
 
-      if (parseResult.success) {
-        const profileData = parseResult.data;
-        setUserProfile(profileData);
-        setSuccess('Resume parsed successfully!');
-
-        // Auto-get recommendations if we have enough data
-        if (profileData.education && profileData.skills && profileData.skills.length > 0) {
-          setTimeout(async () => {
-            try {
-              const recommendations = await apiService.getRecommendations(profileData);
-              setRecommendations(recommendations);
-              navigate('/recommendations');
-            } catch (err) {
-              // Navigate to profile form if recommendations fail
-              navigate('/profile');
-            }
-          }, 1500);
-        } else {
-          // Navigate to profile form to complete the profile
-          setTimeout(() => {
-            navigate('/profile');
-          }, 1500);
-        }
+      // Parsed fields (name, email, ...) with the normalized profile on top
+      const profileData = { ...result.parsed, ...result.profile };
+      setUserProfile(profileData);
+      setSuccess('Resume parsed successfully!');
+
+      // Show recommendations right away if the profile is complete enough
+      if (profileData.education && profileData.skills && profileData.skills.length > 0) {
+        setRecommendations(result.recommendations);
+        setTimeout(() => {
+          navigate('/recommendations');
+        }, 1500);
       } else {
-        throw new Error(parseResult.message || 'Failed to parse resume');
+        // Navigate to profile form to complete the profile
+        setTimeout(() => {
+          navigate('/profile');
+        }, 1500);
       }
 
     } catch (err) {
@@ -12,6 +12,8 @@ export const useLanguage = () => {
 
 const LanguageProvider = ({ children }) => {
   const [currentLanguage, setCurrentLanguage] = useState('en');
+  // Whether the user picked a language (the default 'en' is not a choice)
+  const [languageSelected, setLanguageSelected] = useState(false);
   
   const supportedLanguages = {
     en: 'English',
@@ -252,11 +254,13 @@ const LanguageProvider = ({ children }) => {
   const changeLanguage = (language) => {
     if (supportedLanguages[language]) {
       setCurrentLanguage(language);
+      setLanguageSelected(true);
     }
   };
 
   const value = {
     currentLanguage,
+    languageSelected,
     supportedLanguages,
     translate,
     changeLanguage
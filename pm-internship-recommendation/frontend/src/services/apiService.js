@@ -31,6 +31,28 @@ const apiService = {
     }
   },
 
+  // Parse resume and get recommendations in one request
+  // Without a target language the results are in the resume's language
+  async recommendFromResume(file, targetLanguage) {
+    try {
+      const formData = new FormData();
+      formData.append('file', file);
+      if (targetLanguage) {
+        formData.append('target_language', targetLanguage);
+      }
+
+      const response = await axios.post(`${API_BASE_URL}/recommend-from-resume`, formData, {
+        headers: {
+          'Content-Type': 'multipart/form-data',
+        },
+      });
+
+      return response.data;
+    } catch (error) {
+      throw new Error(error.response?.data?.error || 'Failed to parse resume');
+    }
+  },
+
   // Get all internships
   async getAllInternships() {
     try {